@@ -1,5 +1,6 @@
 import json
 import re
+import time
 
 from pyswitchlib.asset import Asset
 
@@ -32,9 +33,6 @@ class XMLAsset(Asset):
             if timeout == '':
                 timeout = self._session_timeout
 
-        self._cleanup_timer_handle()
-        self._create_timer_handle()
-
         while index < len(rest_commands):
             rest_cmd = rest_commands[index]
 
@@ -56,62 +54,51 @@ class XMLAsset(Asset):
             self._session.headers.update(
                 {'Content-type': 'application/x-www-form-urlencoded'})
 
-            if self._rest_session_auth_token != self._rest_session_auth_token_expired:
+            auth_token = self._get_auth_token()
+
+            if auth_token is not None:
                 self._session.headers.update(
-                    {'Authentication-Token': self._rest_session_auth_token})
+                    {'Authentication-Token': auth_token})
+                request_auth = None
             else:
-                if 'Authentication-Token' in self._session.headers:
-                    self._session.headers.pop('Authentication-Token')
+                self._session.headers.pop('Authentication-Token', None)
+                request_auth = auth
+
+            request_start = time.time()
 
             if rest_cmd[0] == "GET":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.get(url + rest_cmd[1], headers=header, auth=auth,
-                                                       timeout=timeout)
-                else:
-                    self._response = self._session.get(url + rest_cmd[1], headers=header,
-                                                       timeout=timeout)
+                self._response = self._session.get(url + rest_cmd[1], headers=header,
+                                                   auth=request_auth, timeout=timeout)
             elif rest_cmd[0] == "POST":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.post(url + rest_cmd[1], auth=auth,
-                                                        data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.post(url + rest_cmd[1], data=rest_cmd[2],
-                                                        timeout=timeout)
+                self._response = self._session.post(url + rest_cmd[1], auth=request_auth,
+                                                    data=rest_cmd[2], timeout=timeout)
             elif rest_cmd[0] == "PUT":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.put(url + rest_cmd[1], auth=auth,
-                                                       data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.put(url + rest_cmd[1], data=rest_cmd[2],
-                                                       timeout=timeout)
+                self._response = self._session.put(url + rest_cmd[1], auth=request_auth,
+                                                   data=rest_cmd[2], timeout=timeout)
             elif rest_cmd[0] == "PATCH":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.patch(url + rest_cmd[1], auth=auth,
-                                                         data=rest_cmd[2],
-                                                         timeout=timeout)
-                else:
-                    self._response = self._session.patch(url + rest_cmd[1], data=rest_cmd[2],
-                                                         timeout=timeout)
+                self._response = self._session.patch(url + rest_cmd[1], auth=request_auth,
+                                                     data=rest_cmd[2], timeout=timeout)
             elif rest_cmd[0] == "DELETE":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.delete(url + rest_cmd[1], auth=auth,
-                                                          timeout=timeout)
-                else:
-                    self._response = self._session.delete(url + rest_cmd[1], timeout=timeout)
+                self._response = self._session.delete(url + rest_cmd[1], auth=request_auth,
+                                                      timeout=timeout)
 
-            if 'Authentication-Token' in self._response.headers:
-                self._rest_session_auth_token = self._response.headers['Authentication-Token']
+            self._response.request_seconds = time.time() - request_start
 
             # text_response = self._response.text
 
             if self._response.status_code >= 200 and self._response.status_code <= 299:
-                pass
+                if 'Authentication-Token' in self._response.headers:
+                    self._set_auth_token(
+                        auth_token=self._response.headers['Authentication-Token'])
+                elif auth_token is not None:
+                    self._set_auth_token(auth_token=auth_token)
                 # if re.match('^<', self._response.text):
                 #     if rest_cmd[3] != "rpc":
                 # text_response = '<output>\r\n' + self._response.text + '</output>\r\n'
 
             else:
-                self._auth_token_expiration()
+                if auth_token is not None:
+                    self._auth_token_expiration(auth_token=auth_token)
 
                 if self._response.status_code == 401 and auth_retries < \
                         self._rest_session_auth_max_retries:
@@ -123,10 +110,10 @@ class XMLAsset(Asset):
                 'response': {'status_code': self._response.status_code, 'url': self._response.url,
                              'text': self._response.text}}})
 
-            index += 1
+            if self._api_call_stats is not None:
+                self._add_rest_command_stats(rest_command=rest_cmd, response=self._response)
 
-        if not self._rest_session_timer_handle.is_alive():
-            self._rest_session_timer_handle.start()
+            index += 1
 
         return self._get_results()
 
@@ -7,19 +7,220 @@ import threading
 import xml.etree.ElementTree as ElementTree
 import xmltodict
 import json
-import atexit
 import Pyro4
 import Pyro4.util
 import Pyro4.errors
 from distutils.sysconfig import get_python_lib
 import time
 
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
 from pyswitchlib.util.configFile import ConfigFileUtil
+from pyswitchlib.util.apiPayload import unpack_api_result
+from pyswitchlib.util.restSession import (get_rest_session, switch_limiter)
+from pyswitchlib.util.factsCache import (FactsCache, facts_cache_file)
+from pyswitchlib.util.authToken import auth_token_manager
+from pyswitchlib.util.apiStats import api_stats
 import pyswitchlib.exceptions
 locals().update(pyswitchlib.exceptions.__dict__)
 
 sys.excepthook = Pyro4.util.excepthook
 
+_inprocess_api = None
+_inprocess_api_lock = threading.Lock()
+
+
+def _get_inprocess_api(api_template_cache_size=0):
+    """
+    Returns the process wide API builder used by assets in the 'inprocess' API mode.
+    """
+    global _inprocess_api
+
+    with _inprocess_api_lock:
+        if _inprocess_api is None:
+            from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules)
+
+            register_api_modules(PySwitchLibApiDaemon)
+            _inprocess_api = PySwitchLibApiDaemon(api_template_cache_size=api_template_cache_size)
+
+    return _inprocess_api
+
+
+_pybind_index_lock = threading.Lock()
+_pybind_dirs = {}
+_pybind_ver_trees = {}
+_supported_module_names = {}
+
+
+def _get_pybind_dir(os_type=''):
+    """
+    Returns the pybind directory of the OS type on sys.path, memoized per sys.path.
+    """
+    sys_path = tuple(sys.path)
+
+    if sys_path not in _pybind_dirs:
+        pybind_dir = ''
+
+        for site_path in sys_path:
+            pybind_dir = os.path.join(site_path, 'pybind')
+            if os.path.isdir(pybind_dir):
+                break
+
+        _pybind_dirs[sys_path] = pybind_dir
+
+    return os.path.join(_pybind_dirs[sys_path], os_type)
+
+
+def _get_pybind_ver_tree(pybind_dir=''):
+    """
+    Returns the pybind version tree under the OS directory, rebuilt when the directory mtime changes.
+    """
+    try:
+        pybind_dir_mtime = os.stat(pybind_dir).st_mtime
+    except OSError:
+        pybind_dir_mtime = None
+
+    if pybind_dir in _pybind_ver_trees and _pybind_ver_trees[pybind_dir][0] == pybind_dir_mtime:
+        return _pybind_ver_trees[pybind_dir]
+
+    pybind_ver_tree = {}
+
+    max_depth = 1
+    cur_depth = pybind_dir.count(os.sep)
+    max_os_walk_depth = cur_depth + max_depth
+
+    for (dirpath, dirs, files) in os.walk(pybind_dir):
+        if dirpath.count(os.sep) >= max_os_walk_depth:
+            del dirs[:]
+
+        submodule = dirpath.partition(pybind_dir)[2].lstrip('/').replace(os.sep, '.')
+
+        if submodule:
+            tuple = submodule.strip('v_').split('_')
+
+            for index, elem in enumerate(tuple):
+                if index == 0:
+                    if elem not in pybind_ver_tree:
+                        pybind_ver_tree[elem] = {}
+                elif index == 1:
+                    if elem not in pybind_ver_tree[tuple[0]]:
+                        pybind_ver_tree[tuple[0]][elem] = {}
+                elif index == 2:
+                    if elem not in pybind_ver_tree[tuple[0]][tuple[1]]:
+                        pybind_ver_tree[tuple[0]][tuple[1]][elem] = {}
+                elif index == 3:
+                    if elem not in pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]]:
+                        pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]][elem] = {}
+
+    _pybind_ver_trees[pybind_dir] = (pybind_dir_mtime, pybind_ver_tree)
+
+    return _pybind_ver_trees[pybind_dir]
+
+
+def _resolve_supported_module(pybind_ver_tree=None, os_type='', os_ver=''):
+    """
+    Returns the pybind package name which best matches the OS version.
+    """
+    os_version_tuple = os_ver.strip('.').split('.')
+    supported_os_version = []
+
+    if os_version_tuple[0] in pybind_ver_tree:
+        supported_os_version.append(os_version_tuple[0])
+    else:
+        for major in sorted(pybind_ver_tree, reverse=True):
+            if os_version_tuple[0] >= re.sub('\D', '', major):
+                supported_os_version.append(major)
+                break;
+
+    if len(supported_os_version) < 1:
+        raise UnsupportedOSError("OS Version: " + os_type + " " + os_ver + " is unsupported.")
+
+    if supported_os_version[0] == os_version_tuple[0] and os_version_tuple[1] in pybind_ver_tree[supported_os_version[0]]:
+        supported_os_version.append(os_version_tuple[1])
+    else:
+        for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
+            if supported_os_version[0] == os_version_tuple[0]:
+                if os_version_tuple[1] >= minor:
+                    supported_os_version.append(minor)
+                    break;
+            else:
+                supported_os_version.append(minor)
+                break;
+
+    if len(supported_os_version) >= 2:
+        if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1] and os_version_tuple[2] in pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]:
+            supported_os_version.append(os_version_tuple[2])
+        else:
+            for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
+                if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1]:
+                    if os_version_tuple[2] >= patch or len(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]) == 1:
+                        supported_os_version.append(patch)
+                        break;
+                else:
+                    supported_os_version.append(patch)
+                    break;
+    else:
+        for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
+            supported_os_version.append(minor)
+            break;
+
+        for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
+            supported_os_version.append(patch)
+            break;
+
+    safe_os_version = 'v'+'_'.join(supported_os_version)
+    package_name = '.'.join(['pybind', os_type, safe_os_version])
+
+    return package_name
+
+
+def get_supported_module_name(os_type='', os_ver=''):
+    """
+    Returns the pybind package name for the OS type and version, memoized until the pybind directory changes.
+    """
+    with _pybind_index_lock:
+        pybind_dir = _get_pybind_dir(os_type=os_type)
+        pybind_dir_mtime, pybind_ver_tree = _get_pybind_ver_tree(pybind_dir=pybind_dir)
+        supported_module_key = (pybind_dir, pybind_dir_mtime, os_type, os_ver)
+
+        if supported_module_key not in _supported_module_names:
+            _supported_module_names[supported_module_key] = _resolve_supported_module(pybind_ver_tree=pybind_ver_tree, os_type=os_type, os_ver=os_ver)
+
+        return _supported_module_names[supported_module_key]
+
+
+class _LazyRestResponse(dict):
+    """
+    The response entry of an API result, which decodes its 'json' entry from the response text on first access.
+    """
+
+    def __init__(self, decode_json=None, **kwargs):
+        super(_LazyRestResponse, self).__init__(**kwargs)
+
+        self._decode_json = decode_json
+
+    def __missing__(self, key):
+        if key != 'json':
+            raise KeyError(key)
+
+        self['json'] = self._decode_json()
+
+        return self['json']
+
+    def get(self, key, default=None):
+        if key == 'json':
+            return self['json']
+
+        return super(_LazyRestResponse, self).get(key, default)
+
+    def __reduce__(self):
+        self['json']
+
+        return (dict, (dict(self),))
+
 
 class Asset(object):
     """
@@ -27,19 +228,18 @@ class Asset(object):
     Asset provides connection information for PySwitchLib APIs.
     """
 
-    def __init__(self, ip_addr='', auth=('admin', 'password'), rest_proto=None, cacert=None, fw_ver='', timeout='', api_port=None):
+    def __init__(self, ip_addr='', auth=('admin', 'password'), rest_proto=None, cacert=None, fw_ver='', timeout='', api_port=None, api_mode=None):
         def on_deletion (killed_ref):
-            self._cleanup_timer_handle()
             self._session.close()
             self._response.close()
 
-        atexit.register(self._cleanup_timer_handle)
         self._weakref = weakref.ref(self, on_deletion)
 
         self._ip_addr = ip_addr
         self._auth = auth
         self._rest_proto_input = ''
         self._rest_protocol = 'http'
+        self._api_mode = 'daemon'
         self._attempted_rest_protocols = []
         self._enabled_rest_protocols = []
         self._cacert_input = ''
@@ -49,17 +249,29 @@ class Asset(object):
         self._default_connection_timeout = 60
         self._default_response_timeout = 1800
         self._default_session_verify = False
+        self._discovery_timeout = 10
+        self._lazy_response_decoding = False
+        self._rest_pipeline_depth = 1
+        self._api_stats = None
+        self._api_call_stats = None
         self._session_timeout = (self._default_connection_timeout, self._default_response_timeout)
-        self._session = requests.Session()
+        self._rest_pool_maxsize = 10
+        self._rest_pool_idle_timeout = 300
+        self._rest_max_in_flight = 0
+        self._rest_backoff_base = 0
+        self._rest_backoff_max = 30
+        self._rest_circuit_failure_threshold = 0
+        self._rest_circuit_reset_timeout = 30
+        self._facts_cache_file = facts_cache_file
+        self._facts_cache_ttl = 0
+        self._facts_cached = False
         self._response = requests.Response()
         self._overall_success = True
         self._overall_status = []
 
         self._rest_session_auth_max_retries = 1
         self._rest_session_auth_token_expiration = 160
-        self._rest_session_auth_token_expired = '_EXPIRED_'
-        self._rest_session_auth_token = self._rest_session_auth_token_expired
-        self._rest_session_timer_handle = None
+        self._rest_session_auth_token_refresh_margin = 10
         self._rest_config_path = '/rest/config/running'
         self._rest_operational_path = '/rest/operational-state'
         self._rest_rpc_path = '/rest/operational-state'
@@ -71,6 +283,9 @@ class Asset(object):
         self._pyro_proxy_name = ''
         self._pyro_daemon_id = 'default'
         self._pyro_bind_max_retries = 30
+        self._api_serializer = 'marshal'
+        self._api_compress_threshold = 16384
+        self._api_packed_results = False
         self._ns_pid_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns.pid')
         self._pyswitchlib_conf_filename = os.path.join(os.sep, 'etc', 'pyswitchlib', 'pyswitchlib.conf')
         self._pyswitchlib_ns_daemon_filename = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns_daemon.uri')
@@ -86,6 +301,39 @@ class Asset(object):
             elif 'cacert' == key:
                 if cacert is None:
                     cacert = self._pyswitchlib_conf[key]
+            elif 'api_serializer' == key:
+                self._api_serializer = self._pyswitchlib_conf[key]
+            elif 'api_compress_threshold' == key:
+                self._api_compress_threshold = int(self._pyswitchlib_conf[key])
+            elif 'rest_pool_maxsize' == key:
+                self._rest_pool_maxsize = int(self._pyswitchlib_conf[key])
+            elif 'rest_pool_idle_timeout' == key:
+                self._rest_pool_idle_timeout = int(self._pyswitchlib_conf[key])
+            elif 'facts_cache_ttl' == key:
+                self._facts_cache_ttl = int(self._pyswitchlib_conf[key])
+            elif 'facts_cache_file' == key:
+                self._facts_cache_file = self._pyswitchlib_conf[key]
+            elif 'discovery_timeout' == key:
+                self._discovery_timeout = int(self._pyswitchlib_conf[key])
+            elif 'lazy_response_decoding' == key:
+                self._lazy_response_decoding = self._pyswitchlib_conf[key].lower() == 'true'
+            elif 'rest_pipeline_depth' == key:
+                self._rest_pipeline_depth = int(self._pyswitchlib_conf[key])
+            elif 'rest_max_in_flight' == key:
+                self._rest_max_in_flight = int(self._pyswitchlib_conf[key])
+            elif 'rest_backoff_base' == key:
+                self._rest_backoff_base = float(self._pyswitchlib_conf[key])
+            elif 'rest_backoff_max' == key:
+                self._rest_backoff_max = float(self._pyswitchlib_conf[key])
+            elif 'rest_circuit_failure_threshold' == key:
+                self._rest_circuit_failure_threshold = int(self._pyswitchlib_conf[key])
+            elif 'rest_circuit_reset_timeout' == key:
+                self._rest_circuit_reset_timeout = int(self._pyswitchlib_conf[key])
+            elif 'api_stats' == key:
+                if self._pyswitchlib_conf[key].lower() == 'true':
+                    self._api_stats = api_stats
+
+        self._session = get_rest_session(pool_maxsize=self._rest_pool_maxsize, pool_idle_timeout=self._rest_pool_idle_timeout, max_in_flight=self._rest_max_in_flight, backoff_base=self._rest_backoff_base, backoff_max=self._rest_backoff_max, circuit_failure_threshold=self._rest_circuit_failure_threshold, circuit_reset_timeout=self._rest_circuit_reset_timeout)
 
         if api_port:
             self._pyro_ns_port = api_port
@@ -109,6 +357,12 @@ class Asset(object):
             else:
                 raise RestProtocolTypeError("Rest protocol type must be 'http', 'https', or 'auto'.  '" + rest_proto + "' was specified.")
 
+        if api_mode is not None:
+            if api_mode.lower() == 'daemon' or api_mode.lower() == 'inprocess':
+                self._api_mode = api_mode.lower()
+            else:
+                raise ApiModeTypeError("API mode must be 'daemon' or 'inprocess'.  '" + api_mode + "' was specified.")
+
         if cacert is not None:
             self._cacert_input = cacert
 
@@ -130,10 +384,24 @@ class Asset(object):
         if timeout != '':
             self._session_timeout = timeout
 
-        self._create_timer_handle()
-        self._discover_rest_protocol_and_paths()
-        self._update_fw_version()
-        self._supported_module_name = self._get_supported_module()
+        self._facts_cache = FactsCache(filename=self._facts_cache_file, ttl=self._facts_cache_ttl)
+
+        facts = self._facts_cache.get(key=self._get_facts_key())
+
+        if facts:
+            self._set_facts(facts)
+            self._facts_cached = True
+        else:
+            self._discover_facts()
+
+        if self._api_mode == 'inprocess':
+            api_template_cache_size = 0
+
+            if 'api_template_cache_size' in self._pyswitchlib_conf:
+                api_template_cache_size = int(self._pyswitchlib_conf['api_template_cache_size'])
+
+            self._proxied = _get_inprocess_api(api_template_cache_size=api_template_cache_size)
+            return
 
         with Pyro4.Proxy(self._pyro_proxy_name) as pyro_proxy:
             for n in range(self._pyro_bind_max_retries):
@@ -163,26 +431,89 @@ class Asset(object):
                 raise ApiDaemonConnectionError("Cannot connect to pyswitchlib_api_daemon.py.")
 
             self._proxied = pyro_proxy
+            self._negotiate_api_serializer()
 
     def __getattr__(self, name):
         if hasattr(self._proxied, name):
             def getattr_wrapper(*args, **kwargs):
-                self._proxied.api_acquire()
-                self._proxied.module_name(module_name=self._supported_module_name)
-                rest_operation_tuple = ()
+                if self._api_stats is not None:
+                    return self._call_api_with_stats(api_name=name, api_args=args, api_kwargs=kwargs)
 
-                try:
-                    rest_operation_tuple = getattr(self._proxied, name)(*args, **kwargs)
-                except Exception as e:
-                    raise e
-                finally:
-                    self._proxied.api_release()
-
-                return self._rest_operation(rest_commands=rest_operation_tuple[0], yang_list=rest_operation_tuple[1], timeout=rest_operation_tuple[2])
+                return self._call_api(api_name=name, api_args=args, api_kwargs=kwargs)
             return getattr_wrapper
         else:
             raise AttributeError(name)
 
+    def _call_api(self, api_name='', api_args=None, api_kwargs=None):
+        rest_operation_tuple = self._build_api(api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+        result = self._rest_operation(rest_commands=rest_operation_tuple[0], yang_list=rest_operation_tuple[1], timeout=rest_operation_tuple[2])
+
+        if self._revalidate_cached_facts():
+            rest_operation_tuple = self._build_api(api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+            result = self._rest_operation(rest_commands=rest_operation_tuple[0], yang_list=rest_operation_tuple[1], timeout=rest_operation_tuple[2])
+
+        return result
+
+    def _call_api_with_stats(self, api_name='', api_args=None, api_kwargs=None):
+        api_call_stats = {'api_name': api_name, 'ip_addr': self._ip_addr, 'start': time.time(), 'build_seconds': 0, 'rest_commands': []}
+        self._api_call_stats = api_call_stats
+
+        try:
+            return self._call_api(api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+        finally:
+            self._api_call_stats = None
+            api_call_stats['total_seconds'] = time.time() - api_call_stats['start']
+            self._api_stats.add(record=api_call_stats)
+
+    def _build_api(self, api_name='', api_args=None, api_kwargs=None):
+        if self._api_call_stats is None:
+            return self._api_dispatch(api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+
+        build_start = time.time()
+
+        try:
+            return self._api_dispatch(api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+        finally:
+            self._api_call_stats['build_seconds'] += time.time() - build_start
+
+    def _add_rest_command_stats(self, rest_command=None, response=None, parse_seconds=0):
+        request_seconds = getattr(response, 'request_seconds', 0)
+        wait_seconds = getattr(response, 'rest_wait_seconds', 0)
+
+        self._api_call_stats['rest_commands'].append({'op_code': rest_command[0], 'uri': rest_command[1], 'status_code': response.status_code, 'wait_seconds': wait_seconds, 'network_seconds': max(0, request_seconds - wait_seconds), 'response_bytes': len(response.content), 'parse_seconds': parse_seconds})
+
+    def _negotiate_api_serializer(self):
+        try:
+            wire_info = self._proxied.api_wire_info()
+        except (AttributeError, Pyro4.errors.PyroError):
+            return
+
+        # marshal payloads are only portable between the same python major versions.
+        if wire_info['python_version'] != sys.version_info[0]:
+            return
+
+        if self._api_serializer in wire_info['serializers']:
+            self._proxied._pyroSerializer = self._api_serializer
+            self._api_packed_results = self._api_serializer == 'marshal'
+
+    def _api_dispatch(self, api_name='', api_args=None, api_kwargs=None):
+        if self._api_packed_results:
+            try:
+                return unpack_api_result(payload=self._proxied.api_dispatch_packed(module_name=self._supported_module_name, api_name=api_name, api_args=api_args, api_kwargs=api_kwargs, compress_threshold=self._api_compress_threshold))
+            except ValueError as e:
+                if hasattr(e, '_pyroTraceback'):
+                    raise
+
+            # marshal cannot encode kwargs such as user defined objects, so this call falls back to serpent.
+            self._proxied._pyroSerializer = 'serpent'
+
+            try:
+                return self._proxied.api_dispatch(module_name=self._supported_module_name, api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+            finally:
+                self._proxied._pyroSerializer = self._api_serializer
+
+        return self._proxied.api_dispatch(module_name=self._supported_module_name, api_name=api_name, api_args=api_args, api_kwargs=api_kwargs)
+
     def _rest_operation(self, rest_commands=None, yang_list=None, rest_proto=None, cacert=None, timeout=None):
         auth = self._auth
         auth_retries = 0
@@ -204,99 +535,143 @@ class Asset(object):
             if timeout == '':
                 timeout = self._session_timeout
 
-        self._cleanup_timer_handle()
-        self._create_timer_handle()
-
         while index < len(rest_commands):
+            pipelined_commands = self._get_pipelined_rest_commands(rest_commands=rest_commands, index=index)
+
+            if len(pipelined_commands) > 1:
+                responses = self._pipeline_rest_commands(rest_commands=pipelined_commands, rest_protocol=rest_protocol, timeout=timeout)
+
+                for rest_cmd, response in zip(pipelined_commands, responses):
+                    self._record_rest_response(rest_command=rest_cmd, response=response, yang_list=yang_list)
+
+                index += len(pipelined_commands)
+                continue
+
             rest_cmd = rest_commands[index]
 
             if len(rest_cmd) < 4:
                 rest_cmd.append ("config")
 
-            if rest_cmd[3] == "config":
-                uri_prefix_path = self._rest_config_path
-            elif rest_cmd[3] == "operational":
-                uri_prefix_path = self._rest_operational_path
-            elif rest_cmd[3] == "rpc":
-                uri_prefix_path = self._rest_rpc_path
-            elif rest_cmd[3] == "discover":
-                uri_prefix_path = self._rest_discover_path
+            self._response, auth_token = self._send_rest_command(rest_command=rest_cmd, rest_protocol=rest_protocol, auth=auth, timeout=timeout)
 
-            header = {"Resource-Depth" : str(rest_cmd[4])}
-            url = rest_protocol+"://"+self._ip_addr+uri_prefix_path
+            if not self._update_auth_token(response=self._response, auth_token=auth_token):
+                if self._response.status_code == 401 and auth_retries < self._rest_session_auth_max_retries:
+                    auth_retries += 1
+                    continue
 
-            self._session.headers.update({'Content-Type': 'application/x-www-form-urlencoded'})
+            self._record_rest_response(rest_command=rest_cmd, response=self._response, yang_list=yang_list)
 
-            if self._rest_session_auth_token != self._rest_session_auth_token_expired:
-                self._session.headers.update({'Authentication-Token': self._rest_session_auth_token})
-            else:
-                if 'Authentication-Token' in self._session.headers:
-                    self._session.headers.pop('Authentication-Token')
+            index += 1
 
-            if rest_cmd[0] == "GET":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.get(url + rest_cmd[1], headers=header, auth=auth, timeout=timeout)
-                else:
-                    self._response = self._session.get(url + rest_cmd[1], headers=header, timeout=timeout)
-            elif rest_cmd[0] == "POST":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.post(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.post(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
-            elif rest_cmd[0] == "PUT":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.put(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.put(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
-            elif rest_cmd[0] == "PATCH":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.patch(url + rest_cmd[1], auth=auth, data=rest_cmd[2], timeout=timeout)
-                else:
-                    self._response = self._session.patch(url + rest_cmd[1], data=rest_cmd[2], timeout=timeout)
-            elif rest_cmd[0] == "DELETE":
-                if self._rest_session_auth_token == self._rest_session_auth_token_expired:
-                    self._response = self._session.delete(url + rest_cmd[1], auth=auth, timeout=timeout)
-                else:
-                    self._response = self._session.delete(url + rest_cmd[1], timeout=timeout)
+        return self._get_results()
 
-            if 'Authentication-Token' in self._response.headers:
-                self._rest_session_auth_token = self._response.headers['Authentication-Token']
+    def _send_rest_command(self, rest_command=None, rest_protocol='', auth=None, timeout=None):
+        if rest_command[3] == "config":
+            uri_prefix_path = self._rest_config_path
+        elif rest_command[3] == "operational":
+            uri_prefix_path = self._rest_operational_path
+        elif rest_command[3] == "rpc":
+            uri_prefix_path = self._rest_rpc_path
+        elif rest_command[3] == "discover":
+            uri_prefix_path = self._rest_discover_path
+
+        url = rest_protocol+"://"+self._ip_addr+uri_prefix_path+rest_command[1]
+        header = {'Content-Type': 'application/x-www-form-urlencoded'}
+        auth_token = self._get_auth_token()
+
+        # The headers are passed per request rather than set on the session, as pipelined commands share the session.
+        if auth_token is not None:
+            header['Authentication-Token'] = auth_token
+            auth = None
+
+        request_start = time.time()
+
+        if rest_command[0] == "GET":
+            header['Resource-Depth'] = str(rest_command[4])
+            response = self._session.get(url, headers=header, auth=auth, timeout=timeout)
+        elif rest_command[0] == "POST":
+            response = self._session.post(url, headers=header, auth=auth, data=rest_command[2], timeout=timeout)
+        elif rest_command[0] == "PUT":
+            response = self._session.put(url, headers=header, auth=auth, data=rest_command[2], timeout=timeout)
+        elif rest_command[0] == "PATCH":
+            response = self._session.patch(url, headers=header, auth=auth, data=rest_command[2], timeout=timeout)
+        elif rest_command[0] == "DELETE":
+            response = self._session.delete(url, headers=header, auth=auth, timeout=timeout)
+
+        response.request_seconds = time.time() - request_start
+
+        return response, auth_token
+
+    def _update_auth_token(self, response=None, auth_token=None):
+        if not 200 <= response.status_code <= 299:
+            if auth_token is not None:
+                self._auth_token_expiration(auth_token=auth_token)
+
+            return False
+
+        if 'Authentication-Token' in response.headers:
+            self._set_auth_token(auth_token=response.headers['Authentication-Token'])
+        elif auth_token is not None:
+            self._set_auth_token(auth_token=auth_token)
+
+        return True
+
+    def _get_pipelined_rest_commands(self, rest_commands=None, index=0):
+        # Without a token every pipelined command would authenticate, so the first command is sent alone to get one.
+        if self._rest_pipeline_depth <= 1 or self._get_auth_token() is None:
+            return []
+
+        pipelined_commands = []
+
+        for rest_cmd in rest_commands[index:]:
+            if len(rest_cmd) < 6 or not rest_cmd[5]:
+                break
 
-            json_output = json.loads('{"output": ""}')
-            text_response = self._response.text
+            pipelined_commands.append(rest_cmd)
 
-            if self._response.status_code >= 200 and self._response.status_code <= 299:
-                if re.match('^<', self._response.text):
-                    if rest_cmd[3] != "rpc":
-                        text_response = '<output>\r\n' + self._response.text + '</output>\r\n'
+        return pipelined_commands
 
-                    json_output = json.loads(self._xml_to_json(text_response))
-            else:
-                self._auth_token_expiration()
+    def _pipeline_rest_commands(self, rest_commands=None, rest_protocol='', timeout=None):
+        responses = [None] * len(rest_commands)
+        errors = []
+        command_indexes = queue.Queue()
 
-                if self._response.status_code == 401 and auth_retries < self._rest_session_auth_max_retries:
-                    auth_retries += 1
-                    continue
+        for index in range(len(rest_commands)):
+            command_indexes.put(index)
 
-                if re.match('^<', self._response.text):
-                    if re.match('^<output', self._response.text):
-                        json_output = json.loads(self._xml_to_json(text_response))
-                    else:
-                        json_output = json.loads('{"output": ' + self._xml_to_json(text_response) + '}')
-                else:
-                    json_output = json.loads('{"output": ' + json.dumps(str(self._response.text)) + '}')
+        def send_rest_commands():
+            while not errors:
+                try:
+                    index = command_indexes.get_nowait()
+                except queue.Empty:
+                    return
 
-            if yang_list:
-                self._format_dict_output(container=json_output, keys=yang_list)
+                try:
+                    responses[index] = self._send_pipelined_rest_command(rest_command=rest_commands[index], rest_protocol=rest_protocol, timeout=timeout)
+                except Exception as e:
+                    errors.append(e)
 
-            self._overall_status.append({self._ip_addr : {'request': {'op_code': rest_cmd[0], 'uri': rest_cmd[1], 'data': rest_cmd[2]}, 'response': {'status_code': self._response.status_code, 'url': self._response.url, 'text': self._response.text, 'json': json_output}}})
+        pipeline_threads = [threading.Thread(target=send_rest_commands) for index in range(min(self._rest_pipeline_depth, len(rest_commands)))]
 
-            index += 1
+        for pipeline_thread in pipeline_threads:
+            pipeline_thread.start()
 
-        if not self._rest_session_timer_handle.is_alive():
-            self._rest_session_timer_handle.start()
+        for pipeline_thread in pipeline_threads:
+            pipeline_thread.join()
 
-        return self._get_results()
+        if errors:
+            raise errors[0]
+
+        return responses
+
+    def _send_pipelined_rest_command(self, rest_command=None, rest_protocol='', timeout=None):
+        for auth_retries in range(self._rest_session_auth_max_retries + 1):
+            response, auth_token = self._send_rest_command(rest_command=rest_command, rest_protocol=rest_protocol, auth=self._auth, timeout=timeout)
+
+            if self._update_auth_token(response=response, auth_token=auth_token) or response.status_code != 401:
+                break
+
+        return response
 
     def _get_results(self):
         self._overall_success = True
@@ -311,6 +686,52 @@ class Asset(object):
 
         return self._overall_success, self._overall_status
 
+    def _get_facts_key(self):
+        return self._ip_addr + '/' + (self._rest_proto_input or self._rest_protocol)
+
+    def _get_facts(self):
+        return {'rest_protocol': self._rest_protocol, 'enabled_rest_protocols': self._enabled_rest_protocols,
+                'rest_config_path': self._rest_config_path, 'rest_operational_path': self._rest_operational_path, 'rest_rpc_path': self._rest_rpc_path,
+                'os_type': self._os_type, 'os_ver': self._os_ver, 'os_full_ver': self._os_full_ver, 'supported_module_name': self._supported_module_name}
+
+    def _set_facts(self, facts=None):
+        self._rest_protocol = facts['rest_protocol']
+        self._enabled_rest_protocols = list(facts['enabled_rest_protocols'])
+        self._rest_config_path = facts['rest_config_path']
+        self._rest_operational_path = facts['rest_operational_path']
+        self._rest_rpc_path = facts['rest_rpc_path']
+        self._os_type = facts['os_type']
+        self._os_ver = facts['os_ver']
+        self._os_full_ver = facts['os_full_ver']
+        self._supported_module_name = facts['supported_module_name']
+
+    def _discover_facts(self):
+        self._discover_rest_protocol_and_paths()
+        self._update_fw_version()
+        self._supported_module_name = self._get_supported_module()
+
+        self._facts_cache.put(key=self._get_facts_key(), facts=self._get_facts())
+
+    def _revalidate_cached_facts(self):
+        # Facts read from the cache are trusted until the first request is refused, then rediscovered once.
+        if not self._facts_cached or not self._overall_status:
+            return False
+
+        if self._overall_status[0][self._ip_addr]['response']['status_code'] not in (401, 404):
+            return False
+
+        self._facts_cached = False
+        self._facts_cache.invalidate(key=self._get_facts_key())
+
+        if self._rest_proto_input == 'auto':
+            self._rest_protocol = 'http'
+            del self._attempted_rest_protocols[:]
+            del self._enabled_rest_protocols[:]
+
+        self._discover_facts()
+
+        return True
+
     def _discover_rest_protocol_and_paths(self):
         status, result = self._do_rest_protocol_discovery(self._rest_proto_input)
 
@@ -382,51 +803,118 @@ class Asset(object):
         overall_result = None
 
         if rest_proto_input == 'auto':
-            self._attempted_rest_protocols.append('http')
+            return self._do_concurrent_rest_protocol_discovery(rest_command[0])
+        else:
+            self._attempted_rest_protocols.append(self._rest_protocol)
 
             try:
-                self._rest_operation(rest_command, rest_proto='http', timeout=(self._default_connection_timeout, self._default_connection_timeout*2))
+                self._rest_operation(rest_command, timeout=(self._discovery_timeout, self._discovery_timeout))
             except:
                 pass
             finally:
                 overall_status, overall_result = self._get_results()
 
                 if (overall_status == True):
-                    self._enabled_rest_protocols.append('http')
+                    self._enabled_rest_protocols.append(self._rest_protocol)
+
+        return overall_status, overall_result
 
-            self._attempted_rest_protocols.append('https')
+    def _probe_rest_protocol(self, rest_command=None, rest_proto='', cacert=None):
+        session = get_rest_session(pool_maxsize=self._rest_pool_maxsize, pool_idle_timeout=self._rest_pool_idle_timeout)
+        session.verify = cacert
 
-            try:
-                self._rest_operation(rest_command, rest_proto='https', cacert=False, timeout=(self._default_connection_timeout, self._default_connection_timeout*2))
-            except:
-                pass
-            finally:
-                status, result = self._get_results()
+        try:
+            return session.get(rest_proto + "://" + self._ip_addr + self._rest_discover_path + rest_command[1], headers={"Resource-Depth": str(rest_command[4])}, auth=self._auth, timeout=(self._discovery_timeout, self._discovery_timeout))
+        except Exception:
+            return None
+
+    def _do_concurrent_rest_protocol_discovery(self, rest_command=None):
+        # https is preferred over http, so an http answer only wins once https has failed.
+        rest_protocols = ['http', 'https']
+        probe_cacerts = {'http': self._default_session_verify, 'https': False}
+        probe_queue = queue.Queue()
+        responses = {}
+        winner = None
+
+        self._attempted_rest_protocols.extend(rest_protocols)
+
+        for rest_proto in rest_protocols:
+            probe_thread = threading.Thread(target=lambda rest_proto=rest_proto: probe_queue.put((rest_proto, self._probe_rest_protocol(rest_command=rest_command, rest_proto=rest_proto, cacert=probe_cacerts[rest_proto]))))
+            probe_thread.daemon = True
+            probe_thread.start()
+
+        while winner is None and len(responses) < len(rest_protocols):
+            rest_proto, response = probe_queue.get()
+            responses[rest_proto] = response
+
+            for rest_proto in reversed(rest_protocols):
+                if rest_proto not in responses:
+                    break
 
-                if (status == True):
-                    self._session.close()
-                    self._session = requests.Session()
-                    self._session.verify = self._default_session_verify
+                if responses[rest_proto] is not None and 200 <= responses[rest_proto].status_code <= 299:
+                    winner = rest_proto
+                    break
 
-                    self._enabled_rest_protocols.append('https')
-                    self._rest_protocol = 'https'
+        for rest_proto in rest_protocols:
+            if responses.get(rest_proto) is not None and 200 <= responses[rest_proto].status_code <= 299:
+                self._enabled_rest_protocols.append(rest_proto)
 
-                    overall_status = status
-                    overall_result = result
+        if winner is not None:
+            self._rest_protocol = winner
+            response = responses[winner]
         else:
-            self._attempted_rest_protocols.append(self._rest_protocol)
+            response = responses.get('http') or responses.get('https')
 
-            try:
-                self._rest_operation(rest_command, timeout=(self._default_connection_timeout, self._default_connection_timeout*2))
-            except:
-                pass
-            finally:
-                overall_status, overall_result = self._get_results()
+        del self._overall_status[:]
 
-                if (overall_status == True):
-                    self._enabled_rest_protocols.append(self._rest_protocol)
+        if response is not None:
+            if 'Authentication-Token' in response.headers and 200 <= response.status_code <= 299:
+                self._set_auth_token(auth_token=response.headers['Authentication-Token'])
 
-        return overall_status, overall_result
+            self._record_rest_response(rest_command=rest_command, response=response)
+
+        return self._get_results()
+
+    def _record_rest_response(self, rest_command=None, response=None, yang_list=None):
+        parse_start = time.time()
+        self._response = response
+        status_code = self._response.status_code
+        text = self._response.text
+        decode_json = lambda: self._decode_json_output(rest_type=rest_command[3], status_code=status_code, text=text, yang_list=yang_list)
+
+        if self._lazy_response_decoding:
+            response_status = _LazyRestResponse(decode_json=decode_json, status_code=status_code, url=self._response.url, text=text)
+        else:
+            response_status = {'status_code': status_code, 'url': self._response.url, 'text': text, 'json': decode_json()}
+
+        self._overall_status.append({self._ip_addr : {'request': {'op_code': rest_command[0], 'uri': rest_command[1], 'data': rest_command[2]}, 'response': response_status}})
+
+        if self._api_call_stats is not None:
+            self._add_rest_command_stats(rest_command=rest_command, response=self._response, parse_seconds=time.time() - parse_start)
+
+    def _decode_json_output(self, rest_type='', status_code=None, text='', yang_list=None):
+        json_output = json.loads('{"output": ""}')
+        text_response = text
+
+        if status_code >= 200 and status_code <= 299:
+            if re.match('^<', text):
+                if rest_type != "rpc":
+                    text_response = '<output>\r\n' + text + '</output>\r\n'
+
+                json_output = json.loads(self._xml_to_json(text_response))
+        else:
+            if re.match('^<', text):
+                if re.match('^<output', text):
+                    json_output = json.loads(self._xml_to_json(text_response))
+                else:
+                    json_output = json.loads('{"output": ' + self._xml_to_json(text_response) + '}')
+            else:
+                json_output = json.loads('{"output": ' + json.dumps(str(text)) + '}')
+
+        if yang_list:
+            self._format_dict_output(container=json_output, keys=yang_list)
+
+        return json_output
 
     def _update_uri_prefix_paths(self, result):
         try:
@@ -463,114 +951,23 @@ class Asset(object):
         return json.dumps(xmltodict.parse(xml))
 
     def _get_supported_module(self):
-        pybind_dir = ''
-        site_dir = sys.path
-
-        for site_path in site_dir:
-            pybind_dir = os.path.join(site_path, 'pybind')
-            if os.path.isdir(pybind_dir):
-                pybind_dir = os.path.join(pybind_dir, self._os_type)
-                break
-
-        pybind_ver_tree = {}
-
-        max_depth = 1
-        cur_depth = pybind_dir.count(os.sep)
-        max_os_walk_depth = cur_depth + max_depth
-
-        for (dirpath, dirs, files) in os.walk(pybind_dir):
-            if dirpath.count(os.sep) >= max_os_walk_depth:
-                del dirs[:]
-
-            submodule = dirpath.partition(pybind_dir)[2].lstrip('/').replace(os.sep, '.')
-
-            if submodule:
-                tuple = submodule.strip('v_').split('_')
-
-                for index, elem in enumerate(tuple):
-                    if index == 0:
-                        if elem not in pybind_ver_tree:
-                            pybind_ver_tree[elem] = {}
-                    elif index == 1:
-                        if elem not in pybind_ver_tree[tuple[0]]:
-                            pybind_ver_tree[tuple[0]][elem] = {}
-                    elif index == 2:
-                        if elem not in pybind_ver_tree[tuple[0]][tuple[1]]:
-                            pybind_ver_tree[tuple[0]][tuple[1]][elem] = {}
-                    elif index == 3:
-                        if elem not in pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]]:
-                            pybind_ver_tree[tuple[0]][tuple[1]][tuple[2]][elem] = {}
-
-        os_version_tuple = self._os_ver.strip('.').split('.')
-        supported_os_version = []
-
-        if os_version_tuple[0] in pybind_ver_tree:
-            supported_os_version.append(os_version_tuple[0])
-        else:
-            for major in sorted(pybind_ver_tree, reverse=True):
-                if os_version_tuple[0] >= re.sub('\D', '', major):
-                    supported_os_version.append(major)
-                    break;
-
-        if len(supported_os_version) < 1:
-            raise UnsupportedOSError("OS Version: " + self._os_type + " " + self._os_ver + " is unsupported.")
-
-        if supported_os_version[0] == os_version_tuple[0] and os_version_tuple[1] in pybind_ver_tree[supported_os_version[0]]:
-            supported_os_version.append(os_version_tuple[1])
-        else:
-            for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
-                if supported_os_version[0] == os_version_tuple[0]:
-                    if os_version_tuple[1] >= minor:
-                        supported_os_version.append(minor)
-                        break;
-                else:
-                    supported_os_version.append(minor)
-                    break;
-
-        if len(supported_os_version) >= 2:
-            if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1] and os_version_tuple[2] in pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]:
-                supported_os_version.append(os_version_tuple[2])
-            else:
-                for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
-                    if supported_os_version[0] == os_version_tuple[0] and supported_os_version[1] == os_version_tuple[1]:
-                        if os_version_tuple[2] >= patch or len(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]]) == 1:
-                            supported_os_version.append(patch)
-                            break;
-                    else:
-                        supported_os_version.append(patch)
-                        break;
-        else:
-            for minor in sorted(pybind_ver_tree[supported_os_version[0]], reverse=True):
-                supported_os_version.append(minor)
-                break;
-
-            for patch in sorted(pybind_ver_tree[supported_os_version[0]][supported_os_version[1]], reverse=True):
-                supported_os_version.append(patch)
-                break;
-
-        safe_os_version = 'v'+'_'.join(supported_os_version)
-        package_name = '.'.join(['pybind', self._os_type, safe_os_version])
-
-        return package_name
+        return get_supported_module_name(os_type=self._os_type, os_ver=self._os_ver)
 
     def _load_module(self, supported_module_name=''):
         if supported_module_name:
             self._module_obj =  __import__(supported_module_name, fromlist=['*'])
 
-    def _auth_token_expiration(self):
-        self._rest_session_auth_token = self._rest_session_auth_token_expired
-        self._cleanup_timer_handle()
-        self._create_timer_handle()
+    def _get_auth_token_key(self):
+        return (self._ip_addr,) + tuple(self._auth)
+
+    def _get_auth_token(self):
+        return auth_token_manager.get(key=self._get_auth_token_key(), refresh_margin=self._rest_session_auth_token_refresh_margin)
 
-    def _create_timer_handle(self):
-        self._rest_session_timer_handle = threading.Timer(self._rest_session_auth_token_expiration, self._auth_token_expiration)
-        self._rest_session_timer_handle.daemon = True
+    def _set_auth_token(self, auth_token=None):
+        auth_token_manager.put(key=self._get_auth_token_key(), token=auth_token, expiration=self._rest_session_auth_token_expiration)
 
-    def _cleanup_timer_handle(self):
-        if self._rest_session_timer_handle:
-            if self._rest_session_timer_handle.is_alive():
-                self._rest_session_timer_handle.cancel()
-                self._rest_session_timer_handle = None
+    def _auth_token_expiration(self, auth_token=None):
+        auth_token_manager.invalidate(key=self._get_auth_token_key(), token=auth_token)
 
     def _format_dict_output(self, container=None, keys=None):
         if keys and container:
@@ -652,6 +1049,33 @@ class Asset(object):
         :returns: Returns the enabled rest protocols for the asset.
         """
         return self._enabled_rest_protocols
+
+    def set_api_stats(self, stats=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Records the latency of the API calls of the asset in stats, such as the process wide
+        pyswitchlib.util.apiStats.api_stats.  None stops recording.
+        """
+        self._api_stats = stats
+
+    def get_api_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *ApiStats*
+        :returns: Returns the stats the API calls of the asset are recorded in, or None.
+        """
+        return self._api_stats
+
+    def get_rest_transport_status(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the circuit breaker state, the in-flight and queued request counts and the consecutive failures
+                  of the switch, shared by every asset of the process, or None when no request limits are configured.
+        """
+        return switch_limiter.stats().get(self._ip_addr)
         
 
     def run_command(self, command=''):
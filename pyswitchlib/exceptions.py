@@ -32,3 +32,12 @@ class CACertificateNotSpecifiedError(PyswitchlibException):
 
 class InvalidAuthenticationCredentialsError(PyswitchlibException):
     """If the provided authentication credentials are invalid."""
+
+class ApiModeTypeError(PyswitchlibException):
+    """If provided API mode specified is invalid."""
+
+class AssetTimeoutError(PyswitchlibException):
+    """If an asset of a fleet does not complete within the per device timeout."""
+
+class RestCircuitOpenError(PyswitchlibException):
+    """If requests to a switch are shed because its REST circuit breaker is open after repeated failures."""
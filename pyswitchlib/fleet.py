@@ -0,0 +1,157 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from pyswitchlib.asset import Asset
+from pyswitchlib.exceptions import AssetTimeoutError
+
+
+class AssetFleet(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    AssetFleet runs the same PySwitchLib API across the assets of many switches on a bounded pool of threads.
+    """
+
+    def __init__(self, devices=None, max_workers=32, timeout=None, **asset_kwargs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :param devices: The (ip_addr, auth) pairs of the switches.
+        :param max_workers: The number of switches worked on at once.
+        :param timeout: The number of seconds a switch is given to build its asset and complete the API, or None to wait.
+        :param asset_kwargs: The other Asset arguments, such as rest_proto or api_mode.
+        """
+        self._devices = list(devices or [])
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._asset_kwargs = asset_kwargs
+        self._assets = {}
+        self._assets_lock = threading.Lock()
+
+    def connect(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Builds the assets of the switches that do not have one yet.
+
+        :rtype: *generator*
+        :returns: Yields an (ip_addr, asset, error) tuple for each switch as soon as it completes.
+        """
+        return self._execute(operation=lambda asset: asset)
+
+    def run(self, api_name, *args, **kwargs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Runs the named API on each switch, building its asset first when needed.
+
+        :rtype: *generator*
+        :returns: Yields an (ip_addr, result, error) tuple for each switch as soon as it completes.  The result is the
+                  (status, output) tuple of the API.  The error is the raised exception, or an AssetTimeoutError when
+                  the switch did not complete within the timeout.
+        """
+        return self._execute(operation=lambda asset: getattr(asset, api_name)(*args, **kwargs))
+
+    def get_asset(self, ip_addr=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *Asset*
+        :returns: Returns the asset built for the switch, or None.
+        """
+        with self._assets_lock:
+            return self._assets.get(ip_addr)
+
+    def _get_or_build_asset(self, ip_addr='', auth=None):
+        asset = self.get_asset(ip_addr=ip_addr)
+
+        if asset is None:
+            asset = Asset(ip_addr=ip_addr, auth=auth, **self._asset_kwargs)
+
+            with self._assets_lock:
+                self._assets[ip_addr] = asset
+
+        return asset
+
+    def _execute(self, operation=None):
+        tasks = queue.Queue()
+        results = queue.Queue()
+        state_lock = threading.Lock()
+        start_times = {}
+        finished = set()
+        timed_out = set()
+        pending = set(range(len(self._devices)))
+
+        for device_index in pending:
+            tasks.put(device_index)
+
+        def work():
+            while True:
+                try:
+                    device_index = tasks.get_nowait()
+                except queue.Empty:
+                    return
+
+                ip_addr, auth = self._devices[device_index]
+
+                with state_lock:
+                    start_times[device_index] = time.time()
+
+                try:
+                    outcome = (device_index, operation(self._get_or_build_asset(ip_addr=ip_addr, auth=auth)), None)
+                except Exception as e:
+                    outcome = (device_index, None, e)
+
+                # A worker held up past the timeout has been replaced, so it leaves once its switch completes.
+                with state_lock:
+                    if device_index in timed_out:
+                        return
+
+                    finished.add(device_index)
+                    results.put(outcome)
+
+        def start_worker():
+            worker = threading.Thread(target=work)
+            worker.daemon = True
+            worker.start()
+
+        for worker_index in range(min(self._max_workers, len(pending))):
+            start_worker()
+
+        while pending:
+            wait = None
+
+            if self._timeout is not None:
+                with state_lock:
+                    deadlines = [start_times[device_index] + self._timeout for device_index in pending if device_index in start_times]
+
+                wait = max(0, min(deadlines) - time.time()) if deadlines else self._timeout
+
+            try:
+                device_index, result, error = results.get(timeout=wait)
+            except queue.Empty:
+                now = time.time()
+
+                for device_index in sorted(pending):
+                    with state_lock:
+                        if device_index in finished or device_index not in start_times or now < start_times[device_index] + self._timeout:
+                            continue
+
+                        timed_out.add(device_index)
+
+                    start_worker()
+                    pending.remove(device_index)
+
+                    yield (self._devices[device_index][0], None, AssetTimeoutError('The switch did not complete within ' + str(self._timeout) + ' seconds.'))
+
+                continue
+
+            pending.remove(device_index)
+
+            yield (self._devices[device_index][0], result, error)
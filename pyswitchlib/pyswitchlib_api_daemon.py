@@ -2,18 +2,21 @@ import os
 import sys
 import time
 import threading
-import json
 import re
+import pkgutil
 import Pyro4
 import Pyro4.naming
 import uuid
 import hashlib
-import pyangbind.lib.pybindJSON as pybindJSON
+import zlib
+import multiprocessing
 from pyswitchlib.util.configFile import ConfigFileUtil
 from pyswitchlib.util.config import ConfigUtil
+from pyswitchlib.util.restTemplate import RestTemplateCache
+from pyswitchlib.util.restXml import pybind_to_rest_xml
+from pyswitchlib.util.apiPayload import pack_api_result
+from pyswitchlib.util.netmikoPool import NetmikoSessionPool
 from pyswitchlib.exceptions import (MultipleChoicesSetError)
-from collections import OrderedDict
-from dicttoxml import dicttoxml
 from daemon.runner import (DaemonRunner, DaemonRunnerStopFailureError)
 from lockfile import LockTimeout
 from netmiko import ConnectHandler
@@ -22,6 +25,9 @@ from paramiko.ssh_exception import SSHException
 
 pyswitchlib_conf_file = os.path.join(os.sep, 'etc', 'pyswitchlib', 'pyswitchlib.conf')
 pyswitchlib_ns_daemon_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_ns_daemon.uri')
+pyswitchlib_api_modules = ['pyswitchlib.api.create', 'pyswitchlib.api.update', 'pyswitchlib.api.delete', 'pyswitchlib.api.get', 'pyswitchlib.api.rpc']
+_api_modules_lock = threading.Lock()
+_api_worker = None
 
 @Pyro4.behavior(instance_mode="single")
 class PySwitchLibApiDaemon(object):
@@ -30,17 +36,42 @@ class PySwitchLibApiDaemon(object):
     Providing python bindings to configure a switch through the REST interface.
     """
 
-    def __init__(self, module_name='', module_obj=None, pyro_daemon=None):
+    def __init__(self, module_name='', module_obj=None, pyro_daemon=None, api_template_cache_size=0, api_preload_modules=None, api_worker_processes=0, netmiko_min_sessions=1, netmiko_max_sessions=1, netmiko_idle_timeout=300):
         """
         This is an auto-generated method for the PySwitchLib.
         """
 
-        self._module_name = module_name
+        self._default_module_name = module_name
+        self._api_local = threading.local()
         self._module_obj = module_obj
         self._api_lock = threading.Lock()
         self._pyro_daemon = pyro_daemon
-        self._netmiko_lock = threading.Lock()
-        self._netmiko_connection = {}
+        self._netmiko_pool = NetmikoSessionPool(connect=self._establish_netmiko_handler, min_sessions=netmiko_min_sessions, max_sessions=netmiko_max_sessions, idle_timeout=netmiko_idle_timeout)
+        self._rest_template_cache = RestTemplateCache(max_size=api_template_cache_size)
+        self._bindings_index = {}
+        self._pybind_modules = {}
+        self._preload_lock = threading.Lock()
+        self._preload_status = {}
+        self._preload_thread = None
+        self._api_worker_pools = []
+
+        # The worker processes are forked before any preload thread is started, so they
+        # never inherit an import lock held by that thread.
+        for worker_index in range(api_worker_processes):
+            self._api_worker_pools.append(multiprocessing.Pool(processes=1, initializer=_init_api_worker, initargs=(api_preload_modules,)))
+
+        if api_preload_modules and not self._api_worker_pools:
+            self.preload_modules(module_names=api_preload_modules)
+
+    # The Pyro thread pool serves each proxy connection from its own worker thread, so
+    # keeping the selected module thread local scopes it to the calling connection.
+    @property
+    def _module_name(self):
+        return getattr(self._api_local, 'module_name', self._default_module_name)
+
+    @_module_name.setter
+    def _module_name(self, module_name):
+        self._api_local.module_name = module_name
 
     def _hash_auth_string(self, auth_str):
         salt = uuid.uuid4().hex
@@ -57,59 +88,16 @@ class PySwitchLibApiDaemon(object):
         return auth_str == new_hash
 
     def create_netmiko_connection(self, opt):
-        key = opt['ip']
-        conn_list = ['None', 'None', 'None']
-        net_connect_dict = self._netmiko_connection
         auth = (opt['username'], opt['password'])
-        if key not in net_connect_dict:
-            # case 1: No key create a connection
-            try:
-                net_connect = self._establish_netmiko_handler(opt, net_connect_dict)
-                if net_connect:
-                    hashed_auth = self._hash_auth_string(auth)
-                    conn_list[0] = net_connect
-                    conn_list[1] = hashed_auth
-                    conn_list[2] = threading.Lock()
-                    net_connect_dict[key] = conn_list
-            except ValueError as err:
-                raise
-            except Exception as err:
-                raise
+        auth_hash = self._netmiko_pool.get_auth_hash(host=opt['ip'])
 
-        else:
-            existing_hash = net_connect_dict[key][1]
-            conn_list = self._get_netmiko_connection(key)
-            conn_obj = conn_list[0]
-            if self._check_auth_string(existing_hash, auth):
-                # case 2: check if connection object is alive
-                if conn_obj.is_alive() is True:
-                    return
-            # case 3: Assume user value is new so delete existing
-            # and add new connection object for this
-            else:
-                #disconnect stale object
-                conn_list[2].acquire()
-                conn_obj.disconnect()
-                conn_list[2].release()
-
-            # Existing object is not valid so clear and create new
-            # connection
-            del net_connect_dict[key]
-            try:
-                net_connect = self._establish_netmiko_handler(opt, net_connect_dict)
-                if net_connect:
-                    new_hash = self._hash_auth_string(auth)
-                    conn_list[0] = net_connect
-                    conn_list[1] = new_hash
-                    conn_list[2] = threading.Lock()
-                    net_connect_dict[key] = conn_list
-            except ValueError as error:
-                raise
-            except Exception:
-                raise Exception
-
-    def _establish_netmiko_handler(self, opt, net_connect_dict):
-        key = opt['ip']
+        # New credentials replace the sessions of the switch, the same ones keep its alive sessions.
+        if auth_hash is None or not self._check_auth_string(auth_hash, auth):
+            auth_hash = self._hash_auth_string(auth)
+
+        self._netmiko_pool.open(opt=opt, auth_hash=auth_hash)
+
+    def _establish_netmiko_handler(self, opt):
         try:
             net_connect = ConnectHandler(**opt)
         except NetMikoTimeoutException as error:
@@ -126,30 +114,24 @@ class PySwitchLibApiDaemon(object):
             raise ValueError('Failed to connect to switch %s' % reason)
         return net_connect
 
-    def _get_netmiko_connection(self, key):
-        if key in self._netmiko_connection:
-            return self._netmiko_connection[key]
-        else:
-            return None
-
-
     def cli_execution(self, handler, host, call):
         value = ''
-        conn_list = self._get_netmiko_connection(host)
-        if not conn_list:
+        pooled_session = self._netmiko_pool.checkout(host=host)
+        if not pooled_session:
             return value
-        conn_obj = conn_list[0]
-        conn_list[2].acquire()
+        conn_obj = pooled_session.session
+        healthy = False
         try:
             if handler == 'cli-set':
                 conn_obj.enable()
                 value = conn_obj.send_config_set(config_commands=call, delay_factor=0.25)
             elif handler == 'cli-get':
                 value = conn_obj.send_command(call)
+            healthy = True
         except Exception:
             raise Exception
         finally:
-            conn_list[2].release()
+            self._netmiko_pool.checkin(pooled_session=pooled_session, healthy=healthy)
 
         return value
 
@@ -158,6 +140,11 @@ class PySwitchLibApiDaemon(object):
         This is an auto-generated method for the PySwitchLib.
         """
 
+        for api_worker_pool in self._api_worker_pools:
+            api_worker_pool.terminate()
+
+        self._netmiko_pool.close()
+
         if self._pyro_daemon:
             self._pyro_daemon.shutdown()
 
@@ -171,16 +158,28 @@ class PySwitchLibApiDaemon(object):
     def netmiko_acquire(self):
         """
         This is an auto-generated method for the PySwitchLib.
+        Kept for older clients.  The Netmiko session pool already serializes opening the sessions of a switch.
         """
 
-        self._netmiko_lock.acquire()
+        pass
 
     def netmiko_release(self):
         """
         This is an auto-generated method for the PySwitchLib.
+        Kept for older clients.
+        """
+
+        pass
+
+    def netmiko_pool_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the number of Netmiko sessions and idle sessions of each switch.
         """
 
-        self._netmiko_lock.release()
+        return self._netmiko_pool.stats()
 
     def api_acquire(self):
         """
@@ -196,6 +195,191 @@ class PySwitchLibApiDaemon(object):
 
         self._api_lock.release()
 
+    def api_dispatch(self, module_name='', api_name='', api_args=None, api_kwargs=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Selects the pybind module and builds the REST request for the named API in a single call.
+
+        :rtype: (*list, list, string*)
+        :returns: Returns the (rest_commands, yang_list, timeout) tuple from the named API.
+        """
+
+        if not api_name or api_name.startswith('_'):
+            raise AttributeError(api_name)
+
+        api_args = api_args or ()
+        api_kwargs = api_kwargs or {}
+
+        self._module_name = module_name
+
+        template_key = None
+
+        if not api_args:
+            template_key = self._rest_template_cache.get_key(api_name=api_name, module_name=module_name, api_kwargs=api_kwargs)
+
+        if template_key is not None:
+            rest_operation_tuple = self._rest_template_cache.fill(template_key, api_kwargs)
+
+            if rest_operation_tuple is not None:
+                return rest_operation_tuple
+
+        if self._api_worker_pools:
+            api_worker_pool = self._get_api_worker_pool(module_name=module_name, api_name=api_name)
+            rest_operation_tuple = api_worker_pool.apply(_api_worker_call, ('api_dispatch', {'module_name': module_name, 'api_name': api_name, 'api_args': api_args, 'api_kwargs': api_kwargs}))
+        else:
+            self._api_local.api_name = api_name
+
+            try:
+                rest_operation_tuple = getattr(self, api_name)(*api_args, **api_kwargs)
+            finally:
+                self._api_local.api_name = None
+
+        if template_key is not None:
+            self._rest_template_cache.update(template_key, api_kwargs, rest_operation_tuple)
+
+        return rest_operation_tuple
+
+    def api_dispatch_packed(self, module_name='', api_name='', api_args=None, api_kwargs=None, compress_threshold=0):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Same as api_dispatch, but returns the result as a single marshal blob which is zlib compressed above compress_threshold bytes.
+
+        :rtype: *bytes*
+        :returns: Returns the packed (rest_commands, yang_list, timeout) tuple from the named API.
+        """
+
+        return pack_api_result(result=self.api_dispatch(module_name=module_name, api_name=api_name, api_args=api_args, api_kwargs=api_kwargs), compress_threshold=compress_threshold)
+
+    def api_wire_info(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the Pyro serializers accepted by the daemon and its python major version, which decides whether marshal payloads are portable.
+        """
+
+        return {'serializers': sorted(Pyro4.config.SERIALIZERS_ACCEPTED), 'python_version': sys.version_info[0]}
+
+    def api_template_cache_stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the hits, misses, size and max_size of the REST request template cache.
+        """
+
+        return self._rest_template_cache.stats()
+
+    def _get_api_worker_pool(self, module_name='', api_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Returns the worker process which builds the requests of the API for the pybind module.
+
+        The same (API name, module name) always lands on the same worker so its bindings index
+        stays warm, while the many API names spread one firmware across all of the workers.
+        """
+
+        worker_index = zlib.crc32((module_name + ':' + api_name).encode()) & 0xffffffff
+
+        return self._api_worker_pools[worker_index % len(self._api_worker_pools)]
+
+    def preload_modules(self, module_names=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Imports the named pybind firmware modules and their submodules on a background thread.
+        """
+
+        with self._preload_lock:
+            for module_name in module_names or []:
+                if module_name not in self._preload_status:
+                    self._preload_status[module_name] = {'state': 'pending', 'seconds': 0.0, 'error': ''}
+
+            if self._preload_thread is None or not self._preload_thread.is_alive():
+                self._preload_thread = threading.Thread(target=self._preload_loop)
+                self._preload_thread.daemon = True
+                self._preload_thread.start()
+
+    def api_preload_status(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the state ('pending', 'loading', 'loaded' or 'failed'), import seconds and error of each preloaded pybind module.
+        """
+
+        if self._api_worker_pools:
+            preload_status = {}
+            preload_states = ['loaded', 'failed', 'loading', 'pending']
+
+            # A module is only as warm as its slowest worker.
+            for api_worker_pool in self._api_worker_pools:
+                for module_name, status in api_worker_pool.apply(_api_worker_call, ('api_preload_status', {})).items():
+                    module_status = preload_status.setdefault(module_name, dict(status))
+
+                    if preload_states.index(status['state']) > preload_states.index(module_status['state']):
+                        module_status.update({'state': status['state'], 'error': status['error']})
+
+                    module_status['seconds'] = max(status['seconds'], module_status['seconds'])
+
+            return preload_status
+
+        with self._preload_lock:
+            return dict((module_name, dict(status)) for module_name, status in self._preload_status.items())
+
+    def _preload_loop(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        while True:
+            with self._preload_lock:
+                for module_name in sorted(self._preload_status):
+                    if self._preload_status[module_name]['state'] == 'pending':
+                        self._preload_status[module_name]['state'] = 'loading'
+                        break
+                else:
+                    self._preload_thread = None
+                    return
+
+            start = time.time()
+            state = 'loaded'
+            error = ''
+
+            try:
+                self._preload_module(module_name=module_name)
+            except Exception as e:
+                state = 'failed'
+                error = str(e)
+
+            with self._preload_lock:
+                self._preload_status[module_name].update({'state': state, 'seconds': time.time() - start, 'error': error})
+
+    def _preload_module(self, module_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        module_obj = __import__(module_name, fromlist=['*'])
+        self._pybind_modules[module_name] = module_obj
+
+        for module_loader, submodule_name, is_package in pkgutil.iter_modules(getattr(module_obj, '__path__', [])):
+            submodule_name = module_name + '.' + submodule_name
+            self._pybind_modules[submodule_name] = __import__(submodule_name, fromlist=['*'])
+
+    def _import_pybind_module(self, module_name='', class_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Returns the pybind module, reusing the modules already imported by a preload.
+        """
+
+        module_obj = self._pybind_modules.get(module_name)
+
+        if module_obj is None:
+            module_obj = __import__(module_name, fromlist=[class_name])
+            self._pybind_modules[module_name] = module_obj
+
+        return module_obj
+
     def _api_validation(self, choices_kwargs_map=None, leaf_os_support_map=None, **kwargs):
         """
         This is an auto-generated method for the PySwitchLib.
@@ -219,146 +403,195 @@ class PySwitchLibApiDaemon(object):
         if leaf_os_support_map:
             pass
 
-    def _get_pybind_object(self, operation_type=None, compositions_list=None, bindings_list=None, composed_child_list=None, compositions_keyval_list=None, bindings_keyval=None, composed_child_leafval_list=None, leafval_map=None, **kwargs):
+    def _get_bindings_index(self, index_name='', resolve=None):
         """
         This is an auto-generated method for the PySwitchLib.
+        Returns the bindings resolved for the dispatched API and the selected pybind module.
+
+        The generated bindings tables are literals of each API, so they are resolved once per
+        (API name, module name) and reused.  Calls made outside of api_dispatch resolve every time.
         """
 
-        pybind_obj = None
+        api_name = getattr(self._api_local, 'api_name', None)
+
+        if not api_name:
+            return resolve()
+
+        index_key = (api_name, self._module_name, index_name)
+
+        if index_key not in self._bindings_index:
+            self._bindings_index[index_key] = resolve()
+
+        return self._bindings_index[index_key]
+
+    def _resolve_pybind_object_bindings(self, bindings_list=None, compositions_list=None, composed_child_list=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: (*tuple, dict, list*)
+        :returns: Returns the first binding for the selected module, the composition indexes keyed by pybind class module name and the composed child indexes of the binding.
+        """
+
+        compositions_map = {}
+        child_indexes = []
 
         for index, value in enumerate(bindings_list):
             if self._module_name in value[2]:
-                class_name = value[1].replace(value[2] + '.', '', 1)  
-                pybind_module_path = value[0].replace(value[2] + '.', '', 1)  
-                pybind_paths = pybind_module_path.split('.')
+                break
+        else:
+            return None, compositions_map, child_indexes
 
-                module_name = value[2]
-                module_obj = None
+        for composition_index, composition_tuple in enumerate(compositions_list):
+            compositions_map.setdefault(composition_tuple[0], []).append(composition_index)
 
-                if self._module_obj is not None:
-                    module_obj = self._module_obj
-                else:
-                    module_obj =  __import__(module_name, fromlist=[class_name])
-
-                pybind_base_class = getattr(module_obj, class_name)
-                pybind_obj = pybind_base_class()
-                pybind_module = pybind_obj
-                pybind_class_module_name = value[2]
-                kwargs_exclusion_list = []
-                
-                for module in pybind_paths:
-                    pybind_class_module_name = pybind_class_module_name + '.' + module
-                    pybind_module = getattr(pybind_module, module)
-
-                    for composition_index, composition_tuple in enumerate(compositions_list):
-                        if pybind_class_module_name == composition_tuple[0]:
-                            kwargs_exclusion_list.append(composition_tuple[1])
-
-                            pybind_module = getattr(pybind_module, 'add')
-
-                            if compositions_keyval_list[composition_index]['extra_keyval']:
-                                parent_kwargs_map = {}
-                                parent_key_instance = []
-
-                                for parent_key_index, parent_key in enumerate(compositions_keyval_list[composition_index]['extra_keyval'].split(', ')):
-                                    if parent_key_index < len(kwargs[composition_tuple[1]]):
-                                        parent_kwargs_map[parent_key] = kwargs[composition_tuple[1]][parent_key_index]
-
-                                for key in compositions_keyval_list[composition_index]['keyval'].split(', '):
-                                    if key in parent_kwargs_map:
-                                        parent_key_instance.append(parent_kwargs_map[key])
-                                        parent_kwargs_map.pop(key)
-
-                                pybind_module = pybind_module(' '.join(map(str, parent_key_instance)))
-
-                                for key in parent_kwargs_map:
-                                    if parent_kwargs_map[key] is not None:
-                                        mapped_key = key
-
-                                        if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
-                                            mapped_key = leafval_map[pybind_class_module_name][key]
-
-                                        pybind_parent_extra_key_assignment = getattr(pybind_parent_obj, '_set_' + mapped_key)
-                                        pybind_parent_extra_key_assignment(parent_kwargs_map[key])
-                            else:
-                                if isinstance(kwargs[composition_tuple[1]], tuple):
-                                    pybind_module = pybind_module(' '.join(kwargs[composition_tuple[1]]))
-                                else:
-                                    pybind_module = pybind_module(kwargs[composition_tuple[1]])
-                                
-                if bindings_keyval['kwargs_key_name']:
-                    pybind_obj = getattr(pybind_module, 'add')
-                else:
-                    pybind_obj = pybind_module
+        pybind_class_module_name = value[2] + '.' + value[0].replace(value[2] + '.', '', 1)
+
+        for child_index, child_tuple in enumerate(composed_child_list):
+            if pybind_class_module_name in child_tuple[0]:
+                child_indexes.append(child_index)
+
+        return value, compositions_map, child_indexes
+
+    def _get_pybind_object(self, operation_type=None, compositions_list=None, bindings_list=None, composed_child_list=None, compositions_keyval_list=None, bindings_keyval=None, composed_child_leafval_list=None, leafval_map=None, **kwargs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
+        pybind_obj = None
+        value, compositions_map, child_indexes = self._get_bindings_index(index_name='pybind_object', resolve=lambda: self._resolve_pybind_object_bindings(bindings_list=bindings_list, compositions_list=compositions_list, composed_child_list=composed_child_list))
 
-                for kwarg in kwargs:
-                    if kwarg == bindings_keyval['kwargs_key_name']:
-                        if bindings_keyval['extra_keyval'] and kwargs[kwarg] is not None:
-                            kwargs_map = {}
-                            key_instance = []
+        if value is not None:
+            class_name = value[1].replace(value[2] + '.', '', 1)  
+            pybind_module_path = value[0].replace(value[2] + '.', '', 1)  
+            pybind_paths = pybind_module_path.split('.')
 
-                            for key_index, key in enumerate(bindings_keyval['extra_keyval'].split(', ')):
-                                if key_index < len(kwargs[kwarg]):
-                                    kwargs_map[key] = kwargs[kwarg][key_index]
+            module_name = value[2]
+            module_obj = None
 
-                            for key in bindings_keyval['keyval'].split(', '):
-                                if key in kwargs_map:
-                                    key_instance.append(kwargs_map[key])
-                                    kwargs_map.pop(key)
+            if self._module_obj is not None:
+                module_obj = self._module_obj
+            else:
+                module_obj = self._import_pybind_module(module_name=module_name, class_name=class_name)
+
+            pybind_base_class = getattr(module_obj, class_name)
+            pybind_obj = pybind_base_class()
+            pybind_module = pybind_obj
+            pybind_class_module_name = value[2]
+            kwargs_exclusion_list = []
+
+            for module in pybind_paths:
+                pybind_class_module_name = pybind_class_module_name + '.' + module
+                pybind_module = getattr(pybind_module, module)
+
+                for composition_index in compositions_map.get(pybind_class_module_name, []):
+                    composition_tuple = compositions_list[composition_index]
+
+                    kwargs_exclusion_list.append(composition_tuple[1])
+
+                    pybind_module = getattr(pybind_module, 'add')
+
+                    if compositions_keyval_list[composition_index]['extra_keyval']:
+                        parent_kwargs_map = {}
+                        parent_key_instance = []
+
+                        for parent_key_index, parent_key in enumerate(compositions_keyval_list[composition_index]['extra_keyval'].split(', ')):
+                            if parent_key_index < len(kwargs[composition_tuple[1]]):
+                                parent_kwargs_map[parent_key] = kwargs[composition_tuple[1]][parent_key_index]
 
-                            pybind_obj = pybind_obj(' '.join(map(str, key_instance)))
+                        for key in compositions_keyval_list[composition_index]['keyval'].split(', '):
+                            if key in parent_kwargs_map:
+                                parent_key_instance.append(parent_kwargs_map[key])
+                                parent_kwargs_map.pop(key)
 
-                            for key in kwargs_map:
-                                if kwargs_map[key] is not None:
-                                    mapped_key = key
+                        pybind_module = pybind_module(' '.join(map(str, parent_key_instance)))
 
-                                    if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
-                                        mapped_key = leafval_map[pybind_class_module_name][key]
+                        for key in parent_kwargs_map:
+                            if parent_kwargs_map[key] is not None:
+                                mapped_key = key
 
-                                    pybind_extra_key_assignment = getattr(pybind_obj, '_set_' + mapped_key)
-                                    pybind_extra_key_assignment(kwargs_map[key])
+                                if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
+                                    mapped_key = leafval_map[pybind_class_module_name][key]
+
+                                pybind_parent_extra_key_assignment = getattr(pybind_parent_obj, '_set_' + mapped_key)
+                                pybind_parent_extra_key_assignment(parent_kwargs_map[key])
+                    else:
+                        if isinstance(kwargs[composition_tuple[1]], tuple):
+                            pybind_module = pybind_module(' '.join(kwargs[composition_tuple[1]]))
                         else:
-                            if isinstance(kwargs[kwarg], tuple):
-                                pybind_obj = pybind_obj(' '.join(kwargs[kwarg]))
-                            elif kwargs[kwarg] is not None:
-                                pybind_obj = pybind_obj(kwargs[kwarg])
-                            else:
-                                pybind_obj = pybind_module
-
-                if operation_type != 'get':
-                    for child_index, child_tuple in enumerate(composed_child_list):
-                        if pybind_class_module_name in child_tuple[0]:
-                            if child_tuple[1] in kwargs and kwargs[child_tuple[1]] != None:
-                                kwargs_exclusion_list.append(child_tuple[1])
-                                pybind_update_child_obj = pybind_obj
-
-                                if pybind_class_module_name != child_tuple[0]:
-                                    pybind_update_child_path = child_tuple[0].replace(pybind_class_module_name + '.', '', 1)
-                                    pybind_update_child_paths = pybind_update_child_path.split('.')
-
-                                    for module in pybind_update_child_paths:
-                                        pybind_update_child_obj = getattr(pybind_update_child_obj, module)
-
-                                pybind_update_child_obj = getattr(pybind_update_child_obj, child_tuple[1])
-
-                                for leaf_index, leaf_name in enumerate(composed_child_leafval_list[child_index]['leafval'].split(', ')):
-                                    if kwargs[child_tuple[1]][leaf_index] is not None:
-                                        pybind_update_child_assignment = getattr(pybind_update_child_obj, '_set_' + leaf_name) 
-                                        pybind_update_child_assignment(kwargs[child_tuple[1]][leaf_index])
-
-                for kwarg in kwargs:
-                    if kwarg not in kwargs_exclusion_list:
-                        if kwarg != bindings_keyval['kwargs_key_name']:
-                            if kwargs[kwarg] is not None:
-                                mapped_kwarg = kwarg
-
-                                if leafval_map and pybind_class_module_name in leafval_map and kwarg in leafval_map[pybind_class_module_name]:
-                                    mapped_kwarg = leafval_map[pybind_class_module_name][kwarg]
-
-                                pybind_update_key_assignment = getattr(pybind_obj, '_set_' + mapped_kwarg)
-                                pybind_update_key_assignment(kwargs[kwarg])
+                            pybind_module = pybind_module(kwargs[composition_tuple[1]])
 
-                break
+            if bindings_keyval['kwargs_key_name']:
+                pybind_obj = getattr(pybind_module, 'add')
+            else:
+                pybind_obj = pybind_module
+
+            for kwarg in kwargs:
+                if kwarg == bindings_keyval['kwargs_key_name']:
+                    if bindings_keyval['extra_keyval'] and kwargs[kwarg] is not None:
+                        kwargs_map = {}
+                        key_instance = []
+
+                        for key_index, key in enumerate(bindings_keyval['extra_keyval'].split(', ')):
+                            if key_index < len(kwargs[kwarg]):
+                                kwargs_map[key] = kwargs[kwarg][key_index]
+
+                        for key in bindings_keyval['keyval'].split(', '):
+                            if key in kwargs_map:
+                                key_instance.append(kwargs_map[key])
+                                kwargs_map.pop(key)
+
+                        pybind_obj = pybind_obj(' '.join(map(str, key_instance)))
+
+                        for key in kwargs_map:
+                            if kwargs_map[key] is not None:
+                                mapped_key = key
+
+                                if leafval_map and pybind_class_module_name in leafval_map and key in leafval_map[pybind_class_module_name]:
+                                    mapped_key = leafval_map[pybind_class_module_name][key]
+
+                                pybind_extra_key_assignment = getattr(pybind_obj, '_set_' + mapped_key)
+                                pybind_extra_key_assignment(kwargs_map[key])
+                    else:
+                        if isinstance(kwargs[kwarg], tuple):
+                            pybind_obj = pybind_obj(' '.join(kwargs[kwarg]))
+                        elif kwargs[kwarg] is not None:
+                            pybind_obj = pybind_obj(kwargs[kwarg])
+                        else:
+                            pybind_obj = pybind_module
+
+            if operation_type != 'get':
+                for child_index in child_indexes:
+                    child_tuple = composed_child_list[child_index]
+
+                    if child_tuple[1] in kwargs and kwargs[child_tuple[1]] != None:
+                        kwargs_exclusion_list.append(child_tuple[1])
+                        pybind_update_child_obj = pybind_obj
+
+                        if pybind_class_module_name != child_tuple[0]:
+                            pybind_update_child_path = child_tuple[0].replace(pybind_class_module_name + '.', '', 1)
+                            pybind_update_child_paths = pybind_update_child_path.split('.')
+
+                            for module in pybind_update_child_paths:
+                                pybind_update_child_obj = getattr(pybind_update_child_obj, module)
+
+                        pybind_update_child_obj = getattr(pybind_update_child_obj, child_tuple[1])
+
+                        for leaf_index, leaf_name in enumerate(composed_child_leafval_list[child_index]['leafval'].split(', ')):
+                            if kwargs[child_tuple[1]][leaf_index] is not None:
+                                pybind_update_child_assignment = getattr(pybind_update_child_obj, '_set_' + leaf_name) 
+                                pybind_update_child_assignment(kwargs[child_tuple[1]][leaf_index])
+
+            for kwarg in kwargs:
+                if kwarg not in kwargs_exclusion_list:
+                    if kwarg != bindings_keyval['kwargs_key_name']:
+                        if kwargs[kwarg] is not None:
+                            mapped_kwarg = kwarg
+
+                            if leafval_map and pybind_class_module_name in leafval_map and kwarg in leafval_map[pybind_class_module_name]:
+                                mapped_kwarg = leafval_map[pybind_class_module_name][kwarg]
+
+                            pybind_update_key_assignment = getattr(pybind_obj, '_set_' + mapped_kwarg)
+                            pybind_update_key_assignment(kwargs[kwarg])
 
         return pybind_obj
 
@@ -385,11 +618,10 @@ class PySwitchLibApiDaemon(object):
             rest_operation = 'DELETE'
             rest_uri = pybind_object._rest_uri()
 
-        label_list_items = lambda x: x
-
         if 'update' in operation_type:
             update_object_rest_data = ''
-            rest_data =  dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+            parent_rest_data = {}
+            rest_data =  pybind_to_rest_xml(pybind_object=pybind_object)
 
             for key in pybind_object.elements():
                 update_object_name = getattr(pybind_object, '_get_' + key)
@@ -408,7 +640,10 @@ class PySwitchLibApiDaemon(object):
                         temp_pybind_obj = temp_pybind_obj._parent
 
                     if hasattr(temp_pybind_obj, '_pyangbind_elements'):
-                        rest_data = dicttoxml(json.loads(pybindJSON.dumps(temp_pybind_obj, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+                        if id(temp_pybind_obj) not in parent_rest_data:
+                            parent_rest_data[id(temp_pybind_obj)] = pybind_to_rest_xml(pybind_object=temp_pybind_obj)
+
+                        rest_data = parent_rest_data[id(temp_pybind_obj)]
                     elif update_object.default() and update_object == update_object.default():
                         rest_data += '<{0}>{1}</{0}>'.format(rest_name, update_object)
 
@@ -442,6 +677,10 @@ class PySwitchLibApiDaemon(object):
                 update_object_rest_data = '<{0}>{1}</{0}>'.format(rest_uri_end_element, rest_data)
 
                 rest_commands.append([rest_operation, rest_uri, update_object_rest_data, 'config', resource_depth])
+            elif len(rest_commands) > 1 and len(set(rest_cmd[1] for rest_cmd in rest_commands)) == len(rest_commands):
+                # Each leaf update has its own URI, so the asset may send them concurrently.
+                for rest_cmd in rest_commands:
+                    rest_cmd.append(True)
 
             rest_commands.reverse()
         else:
@@ -449,7 +688,7 @@ class PySwitchLibApiDaemon(object):
 
             pybind_object = pybind_object._parent
             
-            rest_data = dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+            rest_data = pybind_to_rest_xml(pybind_object=pybind_object)
 
             if rest_data:
                 end_marker = rest_data.rsplit('<', 1)[1].strip('/')
@@ -507,11 +746,9 @@ class PySwitchLibApiDaemon(object):
         if rest_uri == '/':
             rest_uri = pybind_object._rest_uri()
 
-        label_list_items = lambda x: x
-
         pybind_object = pybind_object._parent
         
-        rest_data = dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=label_list_items)
+        rest_data = pybind_to_rest_xml(pybind_object=pybind_object)
 
         rest_commands.append([rest_operation, rest_uri, rest_data, 'rpc', resource_depth])
 
@@ -522,6 +759,13 @@ class PySwitchLibApiDaemon(object):
         This is an auto-generated method for the PySwitchLib.
         """
 
+        return list(self._get_bindings_index(index_name='bindings_list_yang_name', resolve=lambda: self._resolve_bindings_list_yang_name(bindings_list=bindings_list)))
+
+    def _resolve_bindings_list_yang_name(self, bindings_list=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
         yang_name_list = []
 
         for bindings_tuple in bindings_list:
@@ -535,6 +779,13 @@ class PySwitchLibApiDaemon(object):
         This is an auto-generated method for the PySwitchLib.
         """
 
+        return list(self._get_bindings_index(index_name='child_list_yang_name', resolve=lambda: self._resolve_child_list_yang_name(composed_child_list=composed_child_list)))
+
+    def _resolve_child_list_yang_name(self, composed_child_list=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+
         yang_name_list = []
 
         for child_tuple in composed_child_list:
@@ -544,6 +795,134 @@ class PySwitchLibApiDaemon(object):
         return yang_name_list
 
 
+def _init_api_worker(api_preload_modules=None):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Creates the API builder of a daemon worker process.
+    """
+    global _api_worker
+
+    register_api_modules(PySwitchLibApiDaemon)
+    _api_worker = PySwitchLibApiDaemon(api_preload_modules=api_preload_modules)
+
+
+def _api_worker_call(method_name='', method_kwargs=None):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Calls a method of the API builder of a daemon worker process.
+    """
+
+    return getattr(_api_worker, method_name)(**method_kwargs)
+
+
+def _set_api_module(api_class=None, api_module=None):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Attaches the functions of an imported pyswitchlib.api module to the API class.
+    """
+
+    for api_name, api in api_module.__dict__.items():
+        if '__' not in api_name:
+            if getattr(api_class, '_pyroExposed', False) and callable(api):
+                api._pyroExposed = True
+
+            setattr(api_class, api_name, api)
+
+
+def _lazy_api(api_class=None, api_module_name='', api_name=''):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Returns a stand-in for an API which imports its pyswitchlib.api module on first use.
+    """
+
+    def lazy_api(self, *args, **kwargs):
+        with _api_modules_lock:
+            if api_class.__dict__.get(api_name) is lazy_api:
+                _set_api_module(api_class=api_class, api_module=__import__(api_module_name, fromlist=['*']))
+
+        if api_class.__dict__.get(api_name) is lazy_api:
+            raise AttributeError(api_name)
+
+        return getattr(self, api_name)(*args, **kwargs)
+
+    lazy_api.__name__ = api_name
+
+    return lazy_api
+
+
+def register_api_modules(api_class=PySwitchLibApiDaemon, lazy=True):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Attaches the generated pyswitchlib.api functions to the API class.
+
+    The API names are read from the module sources, so a module is only imported when one
+    of its APIs is first called.  Modules that are already imported, or that are installed
+    without source, are attached directly.
+    """
+
+    for api_module_name in pyswitchlib_api_modules:
+        api_module_source = None
+
+        if lazy and api_module_name not in sys.modules:
+            try:
+                api_module_loader = pkgutil.get_loader(api_module_name)
+            except ImportError:
+                continue
+
+            if api_module_loader is None:
+                continue
+
+            api_module_source = api_module_loader.get_source(api_module_name)
+
+        if api_module_source is None:
+            try:
+                api_module = __import__(api_module_name, fromlist=['*'])
+            except ImportError:
+                continue
+
+            _set_api_module(api_class=api_class, api_module=api_module)
+        else:
+            for api_name in re.findall(r'^def (\w+)\(', api_module_source, re.M):
+                if '__' not in api_name:
+                    setattr(api_class, api_name, _lazy_api(api_class=api_class, api_module_name=api_module_name, api_name=api_name))
+
+
+def get_pybind_module_names(module_names=None):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Expands the configured pybind firmware modules against the pybind packages found on sys.path.
+
+    'all' selects every pybind.<os>.<version> package and a prefix such as 'pybind.nos' selects
+    the versions under it.  Names that match no installed package are kept as given.
+    """
+
+    pybind_module_names = []
+
+    for site_path in sys.path:
+        pybind_dir = os.path.join(site_path, 'pybind')
+
+        if os.path.isdir(pybind_dir):
+            for os_type in sorted(os.listdir(pybind_dir)):
+                os_dir = os.path.join(pybind_dir, os_type)
+
+                if os.path.isfile(os.path.join(os_dir, '__init__.py')):
+                    for os_version in sorted(os.listdir(os_dir)):
+                        if os.path.isfile(os.path.join(os_dir, os_version, '__init__.py')):
+                            pybind_module_names.append('.'.join(['pybind', os_type, os_version]))
+            break
+
+    preload_module_names = []
+
+    for module_name in module_names or []:
+        matched_module_names = [pybind_module_name for pybind_module_name in pybind_module_names if module_name == 'all' or pybind_module_name == module_name or pybind_module_name.startswith(module_name + '.')]
+
+        for preload_module_name in matched_module_names or [module_name]:
+            if preload_module_name not in preload_module_names:
+                preload_module_names.append(preload_module_name)
+
+    return preload_module_names
+
+
 class PySwitchLibApiDaemonRunner(DaemonRunner):
     """
     This is an auto-generated class for the PySwitchLib.
@@ -560,11 +939,35 @@ class PySwitchLibApiDaemonRunner(DaemonRunner):
         self._daemon_prefix = ConfigUtil().get_prefix_for_daemon_id(daemon_id=self._daemon_id, conf_dict=self._pyswitchlib_conf)
         self._daemon_thread = None
         self._pyro_ns_port = None
+        self._api_template_cache_size = 0
+        self._api_preload_modules = []
+        self._api_worker_processes = 0
+        self._netmiko_min_sessions = 1
+        self._netmiko_max_sessions = 1
+        self._netmiko_idle_timeout = 300
 
         if self._pyswitchlib_conf:
             if 'ns_port' in self._pyswitchlib_conf:
                 self._pyro_ns_port = int(self._pyswitchlib_conf['ns_port'])
 
+            if 'api_template_cache_size' in self._pyswitchlib_conf:
+                self._api_template_cache_size = int(self._pyswitchlib_conf['api_template_cache_size'])
+
+            if 'api_preload_modules' in self._pyswitchlib_conf:
+                self._api_preload_modules = self._pyswitchlib_conf['api_preload_modules'].split(',')
+
+            if 'api_worker_processes' in self._pyswitchlib_conf:
+                self._api_worker_processes = int(self._pyswitchlib_conf['api_worker_processes'])
+
+            if 'netmiko_min_sessions' in self._pyswitchlib_conf:
+                self._netmiko_min_sessions = int(self._pyswitchlib_conf['netmiko_min_sessions'])
+
+            if 'netmiko_max_sessions' in self._pyswitchlib_conf:
+                self._netmiko_max_sessions = int(self._pyswitchlib_conf['netmiko_max_sessions'])
+
+            if 'netmiko_idle_timeout' in self._pyswitchlib_conf:
+                self._netmiko_idle_timeout = int(self._pyswitchlib_conf['netmiko_idle_timeout'])
+
         if self._daemon_thread == None:
             self._daemon_thread = threading.Thread(target=self._daemon_loop, kwargs={'daemon_id': self._daemon_id, 'daemon_prefix':self._daemon_prefix, 'pyro_ns_port': self._pyro_ns_port})
             self._daemon_thread.daemon = True
@@ -595,20 +998,10 @@ class PySwitchLibApiDaemonRunner(DaemonRunner):
             sys.exec_prefix = daemon_prefix
             sys.path.insert(0, daemon_lib_path)
 
-        pyswitchlib_api_create = __import__('pyswitchlib.api.create', fromlist=['*'])
-        pyswitchlib_api_update = __import__('pyswitchlib.api.update', fromlist=['*'])
-        pyswitchlib_api_delete = __import__('pyswitchlib.api.delete', fromlist=['*'])
-        pyswitchlib_api_get = __import__('pyswitchlib.api.get', fromlist=['*'])
-        pyswitchlib_api_rpc = __import__('pyswitchlib.api.rpc', fromlist=['*'])
-
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_create.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_update.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_delete.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_get.__dict__.items()))
-        map(lambda filtered_api: setattr(PySwitchLibApiDaemon, filtered_api[0], filtered_api[1]), filter(lambda api: '__' not in api[0], pyswitchlib_api_rpc.__dict__.items()))
+        register_api_modules(PySwitchLibApiDaemon)
 
         api_exposed_class = Pyro4.expose(PySwitchLibApiDaemon)
-        daemon_obj = api_exposed_class(pyro_daemon=pyro_daemon)
+        daemon_obj = api_exposed_class(pyro_daemon=pyro_daemon, api_template_cache_size=self._api_template_cache_size, api_preload_modules=get_pybind_module_names(module_names=self._api_preload_modules), api_worker_processes=self._api_worker_processes, netmiko_min_sessions=self._netmiko_min_sessions, netmiko_max_sessions=self._netmiko_max_sessions, netmiko_idle_timeout=self._netmiko_idle_timeout)
 
         uri = pyro_daemon.register(daemon_obj, force=True)
 
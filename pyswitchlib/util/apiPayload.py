@@ -0,0 +1,39 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import marshal
+import zlib
+
+_marshal_version = 2
+_plain_payload = b'M'
+_compressed_payload = b'Z'
+
+
+def pack_api_result(result=None, compress_threshold=0):
+    """
+    Packs the (rest_commands, yang_list, timeout) tuple of an API into a single marshal blob.
+
+    Blobs larger than compress_threshold bytes are zlib compressed.  A compress_threshold
+    of 0 never compresses.
+    """
+    payload = marshal.dumps(result, _marshal_version)
+
+    if compress_threshold and len(payload) > compress_threshold:
+        return _compressed_payload + zlib.compress(payload)
+
+    return _plain_payload + payload
+
+
+def unpack_api_result(payload=b''):
+    """
+    Unpacks a blob made by pack_api_result.
+    """
+    payload_type, payload = payload[:1], payload[1:]
+
+    if payload_type == _compressed_payload:
+        payload = zlib.decompress(payload)
+    elif payload_type != _plain_payload:
+        raise ValueError('Unknown API result payload type: ' + repr(payload_type))
+
+    return marshal.loads(payload)
@@ -0,0 +1,121 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import bisect
+import threading
+from collections import (defaultdict, deque)
+
+_default_max_records = 1000
+_default_window = 1000
+_histogram_bounds = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class ApiStats(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Latency records of API calls made through pyswitchlib assets, with rolling histograms per API name.
+
+    Each record is a dict with the api_name, ip_addr, start time and total_seconds of the call, the
+    build_seconds spent getting the REST commands from the api daemon and a rest_commands list.  Each
+    rest_commands entry holds the op_code, uri, status_code, wait_seconds spent queued for a request slot
+    or connection, network_seconds, response_bytes and parse_seconds of one REST request.
+    """
+
+    def __init__(self, max_records=_default_max_records, window=_default_window):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :param max_records: The number of most recent call records that are kept.
+        :param window: The number of most recent calls per API name that the histograms cover.
+        """
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._window = window
+        self._durations = defaultdict(lambda: deque(maxlen=self._window))
+        self._hooks = []
+
+    def add_hook(self, hook=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Calls hook with each new call record, on the thread that made the call.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            self._hooks.remove(hook)
+
+    def add(self, record=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            self._records.append(record)
+            self._durations[record['api_name']].append(record['total_seconds'])
+            hooks = list(self._hooks)
+
+        for hook in hooks:
+            hook(record)
+
+    def get_records(self, api_name=None, ip_addr=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *list*
+        :returns: Returns the kept call records, oldest first, optionally only those of one API name or switch.
+        """
+        with self._lock:
+            records = list(self._records)
+
+        return [record for record in records if api_name in (None, record['api_name']) and ip_addr in (None, record['ip_addr'])]
+
+    def get_histogram(self, api_name=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the count, the p50, p90, p99 and max total_seconds, and the (upper bound in seconds, count)
+                  buckets of the most recent calls of the API.  The last bucket has an upper bound of None.
+        """
+        with self._lock:
+            durations = sorted(self._durations.get(api_name, ()))
+
+        counts = [0] * (len(_histogram_bounds) + 1)
+
+        for duration in durations:
+            counts[bisect.bisect_left(_histogram_bounds, duration)] += 1
+
+        histogram = {'count': len(durations), 'buckets': list(zip(_histogram_bounds + (None,), counts))}
+
+        for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99)):
+            histogram[name] = durations[min(len(durations) - 1, int(fraction * len(durations)))] if durations else None
+
+        histogram['max'] = durations[-1] if durations else None
+
+        return histogram
+
+    def get_api_names(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *list*
+        :returns: Returns the names of the APIs that have histograms.
+        """
+        with self._lock:
+            return sorted(self._durations)
+
+    def clear(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        with self._lock:
+            self._records.clear()
+            self._durations.clear()
+
+
+api_stats = ApiStats()
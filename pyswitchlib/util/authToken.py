@@ -0,0 +1,67 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import threading
+import time
+
+_monotonic = getattr(time, 'monotonic', time.time)
+_default_token_expiration = 160
+_default_token_refresh_margin = 10
+
+
+class AuthTokenManager(object):
+    """
+    Process wide REST session tokens, keyed by (ip, user, password).
+
+    Expiry is tracked with timestamps instead of a timer thread per asset.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens = {}
+
+    def get(self, key=None, refresh_margin=_default_token_refresh_margin):
+        """
+        Returns the token for the key, or None when there is none or it expires within refresh_margin seconds.
+
+        Returning None ahead of the expiry makes the next request authenticate and fetch a new token
+        instead of having the switch refuse the old one.
+        """
+        now = _monotonic()
+
+        with self._lock:
+            token, expires_at = self._tokens.get(key, (None, 0))
+
+            if token is not None and now < expires_at - refresh_margin:
+                return token
+
+            self._tokens.pop(key, None)
+
+        return None
+
+    def put(self, key=None, token=None, expiration=_default_token_expiration):
+        """
+        Stores the token for the key, or extends its expiry when it is already stored.
+        """
+        with self._lock:
+            self._tokens[key] = (token, _monotonic() + expiration)
+
+    def invalidate(self, key=None, token=None):
+        """
+        Drops the token of the key.  When a token is given, it is only dropped if it is still the stored one,
+        so a token refreshed by another asset is kept.
+        """
+        with self._lock:
+            if token is None or self._tokens.get(key, (None, 0))[0] == token:
+                self._tokens.pop(key, None)
+
+    def clear(self):
+        """
+        Drops every token.
+        """
+        with self._lock:
+            self._tokens.clear()
+
+
+auth_token_manager = AuthTokenManager()
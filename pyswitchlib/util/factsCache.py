@@ -0,0 +1,102 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import json
+import os
+import time
+
+import fasteners
+
+from pyswitchlib.util.configFile import lock_file
+
+facts_cache_file = os.path.join(os.sep, 'etc', 'pyswitchlib', '.pyswitchlib_facts.json')
+
+
+class FactsCache(object):
+    """
+    This is an auto-generated class for the PySwitchLib device asset.
+    Keeps the discovered device facts of assets on disk, keyed by ip address and rest protocol.
+    """
+
+    def __init__(self, filename=facts_cache_file, ttl=0):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._filename = filename
+        self._ttl = ttl
+
+    def _read(self):
+        if not os.path.exists(self._filename):
+            return {}
+
+        try:
+            with open(self._filename, 'r') as facts_file:
+                return json.load(facts_file)
+        except ValueError:
+            return {}
+
+    def _write(self, facts_dict):
+        temp_filename = self._filename + '.' + str(os.getpid())
+
+        with open(temp_filename, 'w') as facts_file:
+            json.dump(facts_dict, facts_file)
+
+        os.rename(temp_filename, self._filename)
+
+    def get(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the facts stored for the key, or None when there are none or they are older than the ttl.
+        """
+        if not self._ttl:
+            return None
+
+        try:
+            with fasteners.InterProcessLock(lock_file):
+                facts = self._read().get(key)
+        except (IOError, OSError):
+            return None
+
+        if facts and time.time() - facts.get('timestamp', 0) <= self._ttl:
+            return facts
+
+        return None
+
+    def put(self, key='', facts=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if not self._ttl:
+            return
+
+        now = time.time()
+
+        # The cache is only an optimization, so an unwritable cache file is ignored.
+        try:
+            with fasteners.InterProcessLock(lock_file):
+                facts_dict = self._read()
+                facts_dict = dict((facts_key, value) for facts_key, value in facts_dict.items() if now - value.get('timestamp', 0) <= self._ttl)
+                facts_dict[key] = dict(facts, timestamp=now)
+
+                self._write(facts_dict)
+        except (IOError, OSError):
+            pass
+
+    def invalidate(self, key=''):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        if not self._ttl:
+            return
+
+        try:
+            with fasteners.InterProcessLock(lock_file):
+                facts_dict = self._read()
+
+                if facts_dict.pop(key, None) is not None:
+                    self._write(facts_dict)
+        except (IOError, OSError):
+            pass
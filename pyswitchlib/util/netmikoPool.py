@@ -0,0 +1,240 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import threading
+import time
+
+_default_min_sessions = 1
+_default_max_sessions = 1
+_default_idle_timeout = 300
+
+
+class _HostSessions(object):
+    """
+    The connection options, credentials hash and sessions of one switch.
+    """
+
+    def __init__(self, opt=None, auth_hash=None):
+        self.opt = opt
+        self.auth_hash = auth_hash
+        self.generation = 0
+        self.sessions = 0
+        self.idle = []
+        self.condition = threading.Condition()
+        self.open_lock = threading.Lock()
+
+
+class _PooledSession(object):
+    """
+    A Netmiko session with the credentials generation it was opened for and its last use time.
+    """
+
+    def __init__(self, host_sessions=None, session=None, generation=0):
+        self.host_sessions = host_sessions
+        self.session = session
+        self.generation = generation
+        self.created = time.time()
+        self.last_used = self.created
+
+
+class NetmikoSessionPool(object):
+    """
+    Netmiko sessions of the api daemon, keyed by switch address.
+
+    Each switch gets between min_sessions and max_sessions sessions.  Sessions are opened outside of the
+    pool lock, so the sessions of different switches are opened in parallel.
+    """
+
+    def __init__(self, connect=None, min_sessions=_default_min_sessions, max_sessions=_default_max_sessions, idle_timeout=_default_idle_timeout):
+        self._connect = connect
+        self._min_sessions = max(min_sessions, 1)
+        self._max_sessions = max(max_sessions, self._min_sessions)
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def get_auth_hash(self, host=''):
+        """
+        Returns the credentials hash the sessions of the switch are opened with, or None.
+        """
+        with self._lock:
+            host_sessions = self._hosts.get(host)
+
+        return host_sessions.auth_hash if host_sessions else None
+
+    def open(self, opt=None, auth_hash=None):
+        """
+        Opens the min_sessions sessions of the switch in opt['ip'], after dropping its idle sessions that are
+        no longer alive.
+
+        When auth_hash differs from the one the sessions were opened with, the idle sessions are closed and the
+        sessions in use are closed once they are checked in.  Raises the error of connect when the switch is
+        left without a session.
+        """
+        with self._lock:
+            host_sessions = self._hosts.setdefault(opt['ip'], _HostSessions(opt=opt, auth_hash=auth_hash))
+
+        with host_sessions.open_lock:
+            with host_sessions.condition:
+                closed = []
+
+                if host_sessions.auth_hash != auth_hash:
+                    closed = host_sessions.idle
+                    host_sessions.auth_hash = auth_hash
+                    host_sessions.generation += 1
+                    host_sessions.sessions -= len(closed)
+                    host_sessions.idle = []
+                    host_sessions.condition.notify_all()
+
+                host_sessions.opt = opt
+                checked = host_sessions.idle
+                host_sessions.idle = []
+
+            alive = []
+
+            for pooled_session in checked:
+                if self._is_alive(pooled_session):
+                    alive.append(pooled_session)
+                else:
+                    closed.append(pooled_session)
+
+            with host_sessions.condition:
+                host_sessions.sessions -= len(checked) - len(alive)
+                host_sessions.idle.extend(alive)
+                host_sessions.condition.notify_all()
+
+            for pooled_session in closed:
+                self._disconnect(pooled_session)
+
+            while True:
+                with host_sessions.condition:
+                    if host_sessions.sessions >= self._min_sessions:
+                        return
+
+                    host_sessions.sessions += 1
+                    generation = host_sessions.generation
+
+                try:
+                    pooled_session = _PooledSession(host_sessions=host_sessions, session=self._connect(opt), generation=generation)
+                except Exception:
+                    with host_sessions.condition:
+                        host_sessions.sessions -= 1
+                        host_sessions.condition.notify_all()
+
+                        if host_sessions.sessions:
+                            return
+
+                    raise
+
+                self.checkin(pooled_session=pooled_session)
+
+    def checkout(self, host=''):
+        """
+        Returns a session of the switch for the sole use of the caller, or None when the switch has no
+        sessions opened.
+
+        The most recently used idle session is returned first.  When none is idle, a new session is opened
+        unless the switch already has max_sessions, in which case the caller waits for one to be checked in.
+        """
+        with self._lock:
+            host_sessions = self._hosts.get(host)
+
+        if host_sessions is None:
+            return None
+
+        with host_sessions.condition:
+            while True:
+                if host_sessions.idle:
+                    return host_sessions.idle.pop()
+
+                if host_sessions.sessions < self._max_sessions:
+                    host_sessions.sessions += 1
+                    opt = host_sessions.opt
+                    generation = host_sessions.generation
+                    break
+
+                host_sessions.condition.wait()
+
+        try:
+            return _PooledSession(host_sessions=host_sessions, session=self._connect(opt), generation=generation)
+        except Exception:
+            with host_sessions.condition:
+                host_sessions.sessions -= 1
+                host_sessions.condition.notify()
+
+            raise
+
+    def checkin(self, pooled_session=None, healthy=True):
+        """
+        Returns a checked out session to its switch, closing it when it is not healthy or was opened with
+        replaced credentials.  The idle sessions beyond min_sessions that were not used for idle_timeout seconds
+        are closed as well.
+        """
+        host_sessions = pooled_session.host_sessions
+        now = time.time()
+        closed = []
+
+        with host_sessions.condition:
+            if healthy and pooled_session.generation == host_sessions.generation:
+                pooled_session.last_used = now
+                host_sessions.idle.append(pooled_session)
+            else:
+                host_sessions.sessions -= 1
+                closed.append(pooled_session)
+
+            if self._idle_timeout:
+                while host_sessions.idle and host_sessions.sessions > self._min_sessions and now - host_sessions.idle[0].last_used > self._idle_timeout:
+                    closed.append(host_sessions.idle.pop(0))
+                    host_sessions.sessions -= 1
+
+            host_sessions.condition.notify()
+
+        for pooled_session in closed:
+            self._disconnect(pooled_session)
+
+    def stats(self):
+        """
+        Returns the number of sessions and idle sessions of each switch.
+        """
+        with self._lock:
+            hosts = list(self._hosts.items())
+
+        stats = {}
+
+        for host, host_sessions in hosts:
+            with host_sessions.condition:
+                stats[host] = {'sessions': host_sessions.sessions, 'idle': len(host_sessions.idle)}
+
+        return stats
+
+    def close(self):
+        """
+        Closes every idle session.  The sessions in use are closed once they are checked in.
+        """
+        with self._lock:
+            hosts = list(self._hosts.values())
+            self._hosts.clear()
+
+        for host_sessions in hosts:
+            with host_sessions.condition:
+                closed = host_sessions.idle
+                host_sessions.generation += 1
+                host_sessions.sessions -= len(closed)
+                host_sessions.idle = []
+                host_sessions.condition.notify_all()
+
+            for pooled_session in closed:
+                self._disconnect(pooled_session)
+
+    def _is_alive(self, pooled_session=None):
+        try:
+            return pooled_session.session.is_alive() is True
+        except Exception:
+            return False
+
+    def _disconnect(self, pooled_session=None):
+        try:
+            pooled_session.session.disconnect()
+        except Exception:
+            pass
@@ -0,0 +1,275 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import (BaseAdapter, HTTPAdapter)
+
+from pyswitchlib.exceptions import RestCircuitOpenError
+
+try:
+    from urlparse import urlparse
+except ImportError:
+    from urllib.parse import urlparse
+
+_default_pool_maxsize = 10
+_default_pool_idle_timeout = 300
+_default_backoff_max = 30
+_default_circuit_reset_timeout = 30
+
+
+class _PooledAdapter(object):
+    """
+    A shared HTTPAdapter with its in-flight request count and last use time.
+    """
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.active = 0
+        self.last_used = time.time()
+
+
+class RestConnectionPool(object):
+    """
+    Process wide keep-alive connections to switches, keyed by (ip, protocol, verify).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._adapters = {}
+
+    def acquire(self, key=None, pool_maxsize=_default_pool_maxsize, pool_idle_timeout=_default_pool_idle_timeout):
+        """
+        Returns the pooled adapter for the key, evicting the adapters idle for longer than pool_idle_timeout.
+
+        Up to pool_maxsize connections are opened per key.  Requests beyond that wait for a free connection.
+        """
+        now = time.time()
+
+        with self._lock:
+            for idle_key, pooled_adapter in list(self._adapters.items()):
+                if pooled_adapter.active == 0 and now - pooled_adapter.last_used > pool_idle_timeout:
+                    pooled_adapter.adapter.close()
+                    del self._adapters[idle_key]
+
+            if key not in self._adapters:
+                self._adapters[key] = _PooledAdapter(HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True))
+
+            pooled_adapter = self._adapters[key]
+            pooled_adapter.active += 1
+
+        return pooled_adapter
+
+    def release(self, pooled_adapter=None):
+        """
+        Marks a request made through a pooled adapter as done.
+        """
+        with self._lock:
+            pooled_adapter.active -= 1
+            pooled_adapter.last_used = time.time()
+
+    def clear(self):
+        """
+        Closes every pooled connection.
+        """
+        with self._lock:
+            for pooled_adapter in self._adapters.values():
+                pooled_adapter.adapter.close()
+
+            self._adapters.clear()
+
+
+rest_connection_pool = RestConnectionPool()
+
+
+class _SwitchState(object):
+    """
+    The in-flight requests, failures and circuit breaker state of one switch.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.waiting = 0
+        self.consecutive_failures = 0
+        self.retry_after = 0
+        self.circuit_state = 'closed'
+        self.circuit_open_until = 0
+        self.circuit_trial = False
+
+
+class SwitchLimiter(object):
+    """
+    Process wide in-flight request caps, adaptive backoff and circuit breakers, keyed by switch address.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._switches = {}
+
+    def acquire(self, key=None, max_in_flight=0):
+        """
+        Waits for a free request slot of the switch and for its backoff delay, and returns the switch state
+        and whether the request is the trial request of a half-open circuit breaker.
+
+        Raises RestCircuitOpenError while the circuit breaker of the switch is open.  Once the reset timeout
+        has passed, a single trial request is let through to decide whether the circuit closes again.
+        """
+        with self._condition:
+            switch = self._switches.setdefault(key, _SwitchState())
+            switch.waiting += 1
+
+            try:
+                while max_in_flight and switch.in_flight >= max_in_flight:
+                    self._condition.wait()
+            finally:
+                switch.waiting -= 1
+
+            # The circuit is checked after waiting for a slot, so queued requests are shed as well.
+            if switch.circuit_state == 'open':
+                if time.time() < switch.circuit_open_until:
+                    raise RestCircuitOpenError('Requests to ' + str(key) + ' are shed while its circuit breaker is open.')
+
+                switch.circuit_state = 'half-open'
+            elif switch.circuit_state == 'half-open' and switch.circuit_trial:
+                raise RestCircuitOpenError('Requests to ' + str(key) + ' are shed while its circuit breaker trial request is in flight.')
+
+            trial = switch.circuit_state == 'half-open'
+            switch.circuit_trial = switch.circuit_trial or trial
+            switch.in_flight += 1
+            backoff_delay = switch.retry_after - time.time()
+
+        if backoff_delay > 0:
+            time.sleep(backoff_delay)
+
+        return switch, trial
+
+    def release(self, switch=None, trial=False, failed=False, backoff_base=0, backoff_max=_default_backoff_max, circuit_failure_threshold=0, circuit_reset_timeout=_default_circuit_reset_timeout):
+        """
+        Frees the request slot and records whether the request failed.
+
+        Each consecutive failure doubles the backoff ceiling, starting at backoff_base and capped at backoff_max,
+        and the next request waits a random delay below it.  circuit_failure_threshold consecutive failures, or a
+        failed trial request, open the circuit breaker for circuit_reset_timeout seconds.  A success resets both.
+        """
+        with self._condition:
+            switch.in_flight -= 1
+            now = time.time()
+
+            if failed:
+                switch.consecutive_failures += 1
+
+                if backoff_base:
+                    switch.retry_after = now + random.uniform(0, min(backoff_max, backoff_base * 2 ** (switch.consecutive_failures - 1)))
+
+                if trial or (circuit_failure_threshold and switch.consecutive_failures >= circuit_failure_threshold):
+                    switch.circuit_state = 'open'
+                    switch.circuit_open_until = now + circuit_reset_timeout
+            else:
+                switch.consecutive_failures = 0
+                switch.retry_after = 0
+                switch.circuit_state = 'closed'
+
+            if trial:
+                switch.circuit_trial = False
+
+            self._condition.notify_all()
+
+    def stats(self):
+        """
+        Returns the circuit state, in-flight and waiting request counts and consecutive failures of each switch.
+        """
+        with self._condition:
+            return dict((key, {'circuit_state': switch.circuit_state, 'in_flight': switch.in_flight, 'waiting': switch.waiting, 'consecutive_failures': switch.consecutive_failures}) for key, switch in self._switches.items())
+
+    def clear(self):
+        """
+        Forgets the state of every switch.
+        """
+        with self._condition:
+            self._switches.clear()
+
+
+switch_limiter = SwitchLimiter()
+
+
+class SharedHTTPAdapter(BaseAdapter):
+    """
+    Sends the requests of one session through the process wide RestConnectionPool.
+    """
+
+    def __init__(self, connection_pool=None, pool_maxsize=_default_pool_maxsize, pool_idle_timeout=_default_pool_idle_timeout, limiter=None, max_in_flight=0, backoff_base=0, backoff_max=_default_backoff_max, circuit_failure_threshold=0, circuit_reset_timeout=_default_circuit_reset_timeout):
+        super(SharedHTTPAdapter, self).__init__()
+
+        self._connection_pool = connection_pool or rest_connection_pool
+        self._pool_maxsize = pool_maxsize
+        self._pool_idle_timeout = pool_idle_timeout
+        self._limiter = limiter or switch_limiter
+        self._max_in_flight = max_in_flight
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._circuit_failure_threshold = circuit_failure_threshold
+        self._circuit_reset_timeout = circuit_reset_timeout
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """
+        Sends the request.  The response gets a rest_wait_seconds attribute with the time spent waiting for a request
+        slot, backoff delay or pooled adapter before it was sent.
+        """
+        send_start = time.time()
+        url = urlparse(request.url)
+
+        if not (self._max_in_flight or self._backoff_base or self._circuit_failure_threshold):
+            return self._send_pooled(request, url, send_start=send_start, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        switch, trial = self._limiter.acquire(key=url.netloc, max_in_flight=self._max_in_flight)
+        failed = False
+
+        try:
+            response = self._send_pooled(request, url, send_start=send_start, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+            failed = response.status_code >= 500
+
+            return response
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            failed = True
+            raise
+        finally:
+            self._limiter.release(switch=switch, trial=trial, failed=failed, backoff_base=self._backoff_base, backoff_max=self._backoff_max, circuit_failure_threshold=self._circuit_failure_threshold, circuit_reset_timeout=self._circuit_reset_timeout)
+
+    def _send_pooled(self, request, url, send_start=0, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        pooled_adapter = self._connection_pool.acquire(key=(url.netloc, url.scheme, verify), pool_maxsize=self._pool_maxsize, pool_idle_timeout=self._pool_idle_timeout)
+        wait_seconds = time.time() - send_start
+
+        try:
+            response = pooled_adapter.adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        finally:
+            self._connection_pool.release(pooled_adapter=pooled_adapter)
+
+        response.rest_wait_seconds = wait_seconds
+
+        return response
+
+    def close(self):
+        """
+        The pooled connections outlive the session, so closing a session keeps them.
+        """
+        pass
+
+
+def get_rest_session(pool_maxsize=_default_pool_maxsize, pool_idle_timeout=_default_pool_idle_timeout, max_in_flight=0, backoff_base=0, backoff_max=_default_backoff_max, circuit_failure_threshold=0, circuit_reset_timeout=_default_circuit_reset_timeout):
+    """
+    Returns a requests.Session whose connections are shared with the other sessions of the process.
+
+    When max_in_flight, backoff_base or circuit_failure_threshold is set, the requests of the session also go
+    through the process wide SwitchLimiter.  A 5xx response, a timeout or a connection error counts as a failure.
+    """
+    session = requests.Session()
+    adapter = SharedHTTPAdapter(pool_maxsize=pool_maxsize, pool_idle_timeout=pool_idle_timeout, max_in_flight=max_in_flight, backoff_base=backoff_base, backoff_max=backoff_max, circuit_failure_threshold=circuit_failure_threshold, circuit_reset_timeout=circuit_reset_timeout)
+
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
@@ -0,0 +1,293 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import re
+import threading
+from collections import OrderedDict
+
+try:
+    unicode
+except NameError:
+    unicode = str
+
+try:
+    long
+except NameError:
+    long = int
+
+_uri_field_index = 1
+_data_field_index = 2
+_uncacheable = object()
+
+
+def _escape_xml(text):
+    """
+    Escapes a value the same way dicttoxml does for element text.
+    """
+    text = text.replace('&', '&amp;')
+    text = text.replace('"', '&quot;')
+    text = text.replace('\'', '&apos;')
+    text = text.replace('<', '&lt;')
+    text = text.replace('>', '&gt;')
+
+    return text
+
+
+def _render(value, field_index, as_bytes):
+    """
+    Renders a kwarg value as it appears in the URI or XML body of a REST command.
+    """
+    text = unicode(value)
+
+    if field_index == _data_field_index:
+        text = _escape_xml(text)
+
+    if as_bytes:
+        text = text.encode('utf-8')
+
+    return text
+
+
+class _RestTemplate(object):
+    """
+    REST commands with kwarg values replaced by placeholders.
+    """
+
+    def __init__(self, commands, yang_list, values):
+        self.commands = commands
+        self.yang_list = yang_list
+        self.values = values
+        self.verified = set()
+
+    @classmethod
+    def derive(cls, api_kwargs, rest_operation_tuple):
+        values = {}
+
+        for name in api_kwargs:
+            value = api_kwargs[name]
+
+            if name == 'api_timeout' or value is None or isinstance(value, bool):
+                continue
+
+            if unicode(value):
+                values[name] = value
+
+        if len(set(unicode(value) for value in values.values())) != len(values):
+            return None
+
+        found = set()
+        commands = []
+
+        for rest_cmd in rest_operation_tuple[0]:
+            command = list(rest_cmd)
+
+            for field_index in (_uri_field_index, _data_field_index):
+                if field_index < len(command) and command[field_index]:
+                    command[field_index] = cls._split_field(command[field_index], field_index, values, found)
+
+            commands.append(command)
+
+        if found != set(values):
+            return None
+
+        return cls(commands, rest_operation_tuple[1], values)
+
+    @staticmethod
+    def _split_field(field, field_index, values, found):
+        as_bytes = isinstance(field, bytes)
+        rendered = dict((_render(values[name], field_index, as_bytes), name) for name in values)
+
+        if not rendered:
+            return field
+
+        alternatives = '|'.join(re.escape(token) for token in sorted(rendered, key=len, reverse=True))
+
+        if field_index == _data_field_index:
+            pattern = '(?<=>)(' + alternatives + ')(?=<)'
+        else:
+            pattern = '(?:(?<=/)|(?<=%2C)|(?<=%22))(' + alternatives + ')(?=/|%2C|%22|$)'
+
+        if as_bytes:
+            pattern = pattern.encode('utf-8') if not isinstance(pattern, bytes) else pattern
+
+        segments = []
+        position = 0
+
+        for match in re.finditer(pattern, field):
+            name = rendered[match.group(1)]
+            found.add(name)
+            segments.append(field[position:match.start()])
+            segments.append((name,))
+            position = match.end()
+
+        if not segments:
+            return field
+
+        segments.append(field[position:])
+
+        return _TemplateField(segments, field_index, as_bytes)
+
+    def matches(self, api_kwargs):
+        for name in self.values:
+            if name not in self.verified and api_kwargs.get(name) != self.values[name]:
+                return False
+
+        return True
+
+    def verify(self, api_kwargs):
+        for name in self.values:
+            if api_kwargs.get(name) != self.values[name]:
+                self.verified.add(name)
+
+    def fill(self, api_kwargs):
+        rest_commands = []
+
+        for command in self.commands:
+            rest_commands.append([field.fill(api_kwargs) if isinstance(field, _TemplateField) else field for field in command])
+
+        yang_list = list(self.yang_list) if isinstance(self.yang_list, list) else self.yang_list
+
+        return (rest_commands, yang_list, api_kwargs.get('api_timeout', ''))
+
+
+class _TemplateField(object):
+    """
+    A URI or XML body split into literal segments and kwarg placeholders.
+    """
+
+    def __init__(self, segments, field_index, as_bytes):
+        self.segments = segments
+        self.field_index = field_index
+        self.as_bytes = as_bytes
+
+    def fill(self, api_kwargs):
+        parts = []
+
+        for segment in self.segments:
+            if isinstance(segment, tuple):
+                parts.append(_render(api_kwargs[segment[0]], self.field_index, self.as_bytes))
+            else:
+                parts.append(segment)
+
+        return (b'' if self.as_bytes else u'').join(parts)
+
+
+class RestTemplateCache(object):
+    """
+    This is an auto-generated class for the PySwitchLib.
+    Size bounded LRU of REST request templates keyed by API name, module name and kwargs shape.
+
+    A template is derived from the first request built for a key.  Each placeholder is
+    only trusted after a later build with a different value for it produced the same
+    request as the filled template; until then a differing value is built normally and
+    used to verify the template.  A mismatch marks the key as uncacheable.
+    """
+
+    def __init__(self, max_size=0):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        """
+        self._max_size = max_size
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_key(self, api_name='', module_name='', api_kwargs=None):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *tuple*
+        :returns: Returns the cache key for the API call, or None if the call cannot be templated.
+        """
+        if self._max_size <= 0:
+            return None
+
+        shape = []
+
+        for name in sorted(api_kwargs or {}):
+            value = api_kwargs[name]
+
+            if name == 'api_timeout':
+                continue
+            elif value is None:
+                kind = None
+            elif isinstance(value, bool):
+                kind = ('bool', value)
+            elif isinstance(value, (int, long)):
+                kind = 'int'
+            elif isinstance(value, (str, unicode)):
+                kind = ('str', '/' in value) if value else ('str', value)
+            else:
+                return None
+
+            shape.append((name, kind))
+
+        return (api_name, module_name, tuple(shape))
+
+    def fill(self, key, api_kwargs):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: (*list, list, string*)
+        :returns: Returns the REST operation tuple filled from the cached template, or None on a miss.
+        """
+        with self._lock:
+            template = self._templates.get(key)
+
+            if template is not None:
+                self._templates[key] = self._templates.pop(key)
+
+            if template is None or template is _uncacheable or not template.matches(api_kwargs):
+                self._misses += 1
+                return None
+
+            self._hits += 1
+
+        return template.fill(api_kwargs)
+
+    def update(self, key, api_kwargs, rest_operation_tuple):
+        """
+        This is an auto-generated method for the PySwitchLib.
+        Derives or verifies the template for the key from a freshly built REST operation tuple.
+        """
+        with self._lock:
+            template = self._templates.get(key)
+
+        if template is _uncacheable:
+            return
+
+        if template is None:
+            template = _RestTemplate.derive(api_kwargs, rest_operation_tuple)
+
+            if template is not None:
+                self._store(key, template)
+
+            return
+
+        filled = template.fill(api_kwargs)
+
+        if filled[0] == [list(rest_cmd) for rest_cmd in rest_operation_tuple[0]] and filled[1] == rest_operation_tuple[1]:
+            with self._lock:
+                template.verify(api_kwargs)
+        else:
+            self._store(key, _uncacheable)
+
+    def _store(self, key, template):
+        with self._lock:
+            self._templates.pop(key, None)
+            self._templates[key] = template
+
+            while len(self._templates) > self._max_size:
+                self._templates.popitem(last=False)
+
+    def stats(self):
+        """
+        This is an auto-generated method for the PySwitchLib.
+
+        :rtype: *dict*
+        :returns: Returns the hit and miss counters and the current size of the cache.
+        """
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'size': len(self._templates), 'max_size': self._max_size}
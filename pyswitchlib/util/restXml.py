@@ -0,0 +1,198 @@
+"""
+This is an auto-generated module for the PySwitchLib.
+Providing python bindings to configure a switch through the REST interface.
+"""
+import json
+from collections import OrderedDict
+from numbers import Number
+
+import dicttoxml
+from pyangbind.lib.serialise import pybindRESTJSONEncoder
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+try:
+    unicode
+except NameError:
+    unicode = str
+
+try:
+    long
+except NameError:
+    long = int
+
+_xml_names = {}
+
+
+def _xml_name(key):
+    """
+    Returns the element name and attribute string dicttoxml uses for a key.
+    """
+    xml_name = _xml_names.get(key)
+
+    if xml_name is None:
+        name, attr = dicttoxml.make_valid_xml_name(key, {})
+        xml_name = _xml_names[key] = (name, dicttoxml.make_attrstring(attr))
+
+    return xml_name
+
+
+def _escape(value):
+    if isinstance(value, basestring):
+        return dicttoxml.escape_xml(value)
+
+    return u'%s' % (value,)
+
+
+def _write_value(output, key, value):
+    """
+    Writes a JSON decoded value the same way dicttoxml.convert_dict writes a dict entry.
+    """
+    name, attrstring = _xml_name(key)
+
+    if isinstance(value, (Number, basestring)):
+        output.append(u'<%s%s>%s</%s>' % (name, attrstring, _escape(value), name))
+    elif isinstance(value, dict):
+        output.append(u'<%s%s>' % (name, attrstring))
+
+        for child_key, child_value in value.items():
+            _write_value(output, child_key, child_value)
+
+        output.append(u'</%s>' % name)
+    elif isinstance(value, list):
+        output.append(u'<%s%s>' % (name, attrstring))
+        _write_items(output, name, value)
+        output.append(u'</%s>' % name)
+    elif value is None:
+        output.append(u'<%s%s></%s>' % (name, attrstring, name))
+    else:
+        raise TypeError('Unsupported data type: %s (%s)' % (value, type(value).__name__))
+
+
+def _write_items(output, item_name, items):
+    """
+    Writes JSON decoded list items the same way dicttoxml.convert_list does.
+    """
+    for item in items:
+        if isinstance(item, dict):
+            output.append(u'<%s>' % item_name)
+
+            for child_key, child_value in item.items():
+                _write_value(output, child_key, child_value)
+
+            output.append(u'</%s>' % item_name)
+        elif isinstance(item, list):
+            output.append(u'<%s >' % item_name)
+            _write_items(output, item_name, item)
+            output.append(u'</%s>' % item_name)
+        else:
+            _write_value(output, item_name, item)
+
+
+def _write_leaf(output, key, element):
+    """
+    Writes a leaf from the REST JSON tree as it comes out of the json round trip.
+    """
+    if isinstance(element, unicode):
+        _write_value(output, key, unicode(element))
+    elif isinstance(element, bytes):
+        _write_value(output, key, element.decode('utf-8'))
+    elif isinstance(element, (int, long)) and not isinstance(element, bool):
+        _write_value(output, key, int(element))
+    elif isinstance(element, float):
+        _write_value(output, key, float(element))
+    else:
+        _write_value(output, key, json.loads(json.dumps(element, cls=pybindRESTJSONEncoder, indent=4), object_pairs_hook=OrderedDict))
+
+
+def _element_entries(obj, flt):
+    """
+    Walks a pybind object in the order pybindRESTJSONEncoder.generate_element does.
+
+    Entries are kept per element name since a later element with the same REST name
+    replaces the earlier one in place, or removes it when it is an empty container or list.
+    """
+    entries = OrderedDict()
+
+    if hasattr(obj, '_base_type') and hasattr(obj._base_type, '__slots__'):
+        elements = [x.lstrip('_') for x in obj._base_type.__slots__ if '__' in x]
+    else:
+        elements = obj._pyangbind_elements
+
+    for element_name in elements:
+        element = getattr(obj, element_name, None)
+        yang_name = getattr(element, 'yang_name', None)
+        rest_name = getattr(element, 'rest_name', None)
+        yname = yang_name() if yang_name is not None else element_name
+        rname = rest_name() if rest_name is not None else element_name
+
+        yname = rname if rname != '' else yname
+
+        generated_by = getattr(element, '_pybind_generated_by', None)
+
+        if generated_by == 'container' and rname:
+            child_entries = _element_entries(element, flt)
+
+            if child_entries:
+                name, attrstring = _xml_name(yname)
+                output = [u'<%s%s>' % (name, attrstring)]
+                _extend_entries(output, child_entries)
+                output.append(u'</%s>' % name)
+                entries[yname] = output
+            else:
+                entries.pop(yname, None)
+        elif generated_by == 'YANGListType':
+            if len(element._members):
+                name, attrstring = _xml_name(yname)
+                output = [u'<%s%s>' % (name, attrstring)]
+
+                for member in element._members.itervalues():
+                    output.append(u'<%s>' % name)
+                    _extend_entries(output, _element_entries(member, flt))
+                    output.append(u'</%s>' % name)
+
+                output.append(u'</%s>' % name)
+                entries[yname] = output
+            else:
+                entries.pop(yname, None)
+        elif not flt or element._changed():
+            if str(element) == 'True':
+                output = []
+                _write_value(output, yname, u' ')
+                entries[yname] = output
+            elif str(element) != 'False':
+                output = []
+                _write_leaf(output, yname, element)
+                entries[yname] = output
+
+    return entries
+
+
+def _extend_entries(output, entries):
+    for entry in entries.values():
+        output.extend(entry)
+
+
+def pybind_to_rest_xml(pybind_object=None):
+    """
+    This is an auto-generated function for the PySwitchLib.
+    Serializes a pybind object to the REST XML body in a single walk of the object.
+
+    The output is identical to dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'),
+    object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=lambda x: x).
+
+    :rtype: *string*
+    :returns: Returns the utf-8 encoded XML body.
+    """
+    if getattr(pybind_object, '_pybind_generated_by', None) == 'YANGListType':
+        import pyangbind.lib.pybindJSON as pybindJSON
+
+        return dicttoxml.dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=lambda x: x)
+
+    output = []
+    _extend_entries(output, _element_entries(pybind_object, True))
+
+    return u''.join(output).encode('utf-8')
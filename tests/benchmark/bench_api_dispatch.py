@@ -0,0 +1,46 @@
+"""
+Compare the legacy four round trip API path with the single api_dispatch call.
+
+Usage: python -m tests.benchmark.bench_api_dispatch [iterations]
+"""
+import sys
+
+import Pyro4
+
+from tests.benchmark.helpers import (start_api_daemon, calls_per_second)
+
+MODULE_NAME = 'pybind.nos.v7_2_0'
+
+
+def four_hop(proxy, index):
+    proxy.api_acquire()
+    proxy.module_name(module_name=MODULE_NAME)
+
+    try:
+        return proxy.get_vlan_brief_rpc(vlan_id=index % 4090 + 1)
+    finally:
+        proxy.api_release()
+
+
+def single_hop(proxy, index):
+    return proxy.api_dispatch(module_name=MODULE_NAME, api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': index % 4090 + 1})
+
+
+def main(iterations=500):
+    pyro_daemon, uri = start_api_daemon()
+
+    try:
+        with Pyro4.Proxy(uri) as proxy:
+            single_hop(proxy, 0)
+
+            legacy_rate = calls_per_second(lambda index: four_hop(proxy, index), iterations)
+            dispatch_rate = calls_per_second(lambda index: single_hop(proxy, index), iterations)
+    finally:
+        pyro_daemon.shutdown()
+
+    print('four round trips: {0:10.1f} calls/s'.format(legacy_rate))
+    print('api_dispatch:     {0:10.1f} calls/s ({1:.2f}x)'.format(dispatch_rate, dispatch_rate / legacy_rate))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,72 @@
+"""
+Compare serpent api_dispatch calls with marshal api_dispatch_packed calls for a typical and a bulk API.
+
+Reports the call latency and the serialized request and response bytes of each call.
+
+Usage: python -m tests.benchmark.bench_api_serializer [iterations]
+"""
+import sys
+
+import Pyro4
+import Pyro4.util
+
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+from pyswitchlib.util.apiPayload import unpack_api_result
+from tests.benchmark.helpers import (start_api_daemon, calls_per_second)
+
+MODULE_NAME = 'pybind.nos.v7_2_0'
+COMPRESS_THRESHOLD = 16384
+
+
+def bulk_acl_rules_rpc(self, rules=None):
+    rest_commands = []
+
+    for seq_id, action, src_host in rules:
+        rest_data = '<seq><seq-id>{0}</seq-id><action>{1}</action><src-host-ip>{2}</src-host-ip></seq>'.format(seq_id, action, src_host)
+        rest_commands.append(['PATCH', '/ip/access-list/extended/bench/seq/' + str(seq_id), rest_data, 'config', 1])
+
+    return (rest_commands, '', '')
+
+
+CALLS = [
+    ('typical', 'get_vlan_brief_rpc', {'vlan_id': 10}),
+    ('bulk', 'bulk_acl_rules_rpc', {'rules': [(index, 'permit', '10.0.' + str(index // 256) + '.' + str(index % 256)) for index in range(1, 2001)]}),
+]
+
+
+def wire_bytes(serializer_name, method, kwargs, result):
+    serializer = Pyro4.util.get_serializer(serializer_name)
+
+    return len(serializer.dumpsCall('api', method, (), kwargs)), len(serializer.dumps(result))
+
+
+def main(iterations=200):
+    PySwitchLibApiDaemon.bulk_acl_rules_rpc = bulk_acl_rules_rpc
+    pyro_daemon, uri = start_api_daemon()
+
+    try:
+        with Pyro4.Proxy(uri) as serpent_proxy, Pyro4.Proxy(uri) as marshal_proxy:
+            marshal_proxy._pyroSerializer = 'marshal'
+
+            for label, api_name, api_kwargs in CALLS:
+                dispatch_kwargs = {'module_name': MODULE_NAME, 'api_name': api_name, 'api_args': (), 'api_kwargs': api_kwargs}
+                packed_kwargs = dict(dispatch_kwargs, compress_threshold=COMPRESS_THRESHOLD)
+                result = serpent_proxy.api_dispatch(**dispatch_kwargs)
+
+                if unpack_api_result(marshal_proxy.api_dispatch_packed(**packed_kwargs)) != result:
+                    raise AssertionError(label + ' packed result differs')
+
+                serpent_rate = calls_per_second(lambda index: serpent_proxy.api_dispatch(**dispatch_kwargs), iterations)
+                marshal_rate = calls_per_second(lambda index: unpack_api_result(marshal_proxy.api_dispatch_packed(**packed_kwargs)), iterations)
+                serpent_bytes = wire_bytes('serpent', 'api_dispatch', dispatch_kwargs, result)
+                marshal_bytes = wire_bytes('marshal', 'api_dispatch_packed', packed_kwargs, marshal_proxy.api_dispatch_packed(**packed_kwargs))
+
+                print('{0:8s} serpent: {1:8.3f} ms/call {2:8d} B request {3:8d} B response'.format(label, 1000 / serpent_rate, serpent_bytes[0], serpent_bytes[1]))
+                print('{0:8s} marshal: {1:8.3f} ms/call {2:8d} B request {3:8d} B response'.format(label, 1000 / marshal_rate, marshal_bytes[0], marshal_bytes[1]))
+    finally:
+        pyro_daemon.shutdown()
+        del PySwitchLibApiDaemon.bulk_acl_rules_rpc
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,35 @@
+"""
+Compare the per call time of an in-process asset API call with latency recording off and on.
+
+Usage: python -m tests.benchmark.bench_api_stats [calls]
+"""
+import sys
+
+import pyswitchlib.asset
+from pyswitchlib.util.apiStats import api_stats
+from tests.benchmark.helpers import calls_per_second
+from tests.unit.rest_standin import StandInSwitch
+
+
+def main(calls=500):
+    switch = StandInSwitch().start()
+
+    try:
+        asset = pyswitchlib.asset.Asset(ip_addr=switch.ip_addr, rest_proto='http', api_mode='inprocess')
+        call_api = lambda index: asset.get_vlan_brief_rpc(vlan_id=index % 4090 + 1)
+
+        call_api(0)
+        off_rate = calls_per_second(call_api, calls)
+
+        asset.set_api_stats(stats=api_stats)
+        on_rate = calls_per_second(call_api, calls)
+    finally:
+        switch.stop()
+
+    print('recording off: {0:8.1f} us per call'.format(1000000 / off_rate))
+    print('recording on:  {0:8.1f} us per call'.format(1000000 / on_rate))
+    print(api_stats.get_histogram(api_name='get_vlan_brief_rpc'))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,75 @@
+"""
+Compare the aggregate api_dispatch throughput of the API daemon with 1, 4 and 16 worker processes.
+
+Usage: python -m tests.benchmark.bench_api_workers [calls_per_client] [clients] [workers...]
+"""
+import multiprocessing
+import sys
+import threading
+import time
+
+from pyswitchlib.api import rpc
+from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules)
+
+MODULE_NAME = 'pybind.nos.v7_2_0'
+
+
+def get_api_names():
+    api = PySwitchLibApiDaemon()
+    api_names = []
+
+    for api_name in sorted(dir(rpc)):
+        if api_name.endswith('_rpc'):
+            try:
+                api.api_dispatch(module_name=MODULE_NAME, api_name=api_name)
+            except Exception:
+                continue
+
+            api_names.append(api_name)
+
+    return api_names
+
+
+def wait_for_preload(api):
+    while any(status['state'] in ('pending', 'loading') for status in api.api_preload_status().values()):
+        time.sleep(0.5)
+
+
+def calls_per_second(api, api_names, clients, calls_per_client):
+    def run_client(client_index):
+        for index in range(calls_per_client):
+            api.api_dispatch(module_name=MODULE_NAME, api_name=api_names[(client_index + index) % len(api_names)])
+
+    threads = [threading.Thread(target=run_client, args=(client_index,)) for client_index in range(clients)]
+    start = time.time()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return clients * calls_per_client / (time.time() - start)
+
+
+def main(calls_per_client=50, clients=64, *worker_counts):
+    register_api_modules(PySwitchLibApiDaemon)
+    api_names = get_api_names()
+
+    print('{0} APIs, {1} clients, {2} cpus'.format(len(api_names), clients, multiprocessing.cpu_count()))
+    print('in-process:  {0:10.1f} calls/s'.format(calls_per_second(PySwitchLibApiDaemon(), api_names, clients, calls_per_client)))
+
+    for worker_count in worker_counts or (1, 4, 16):
+        api = PySwitchLibApiDaemon(api_preload_modules=[MODULE_NAME], api_worker_processes=worker_count)
+
+        try:
+            wait_for_preload(api)
+            calls_per_second(api, api_names, clients, 1)
+
+            print('{0:2d} workers:  {1:10.1f} calls/s'.format(worker_count, calls_per_second(api, api_names, clients, calls_per_client)))
+        finally:
+            api.shutdown()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,55 @@
+"""
+Compare running get_vlan_brief_rpc on many stand-in switches with a serial Asset loop and with AssetFleet.
+
+Each stand-in switch listens on its own local port and answers every request after response_delay seconds.
+
+Usage: python -m tests.benchmark.bench_asset_fleet [switches] [response_delay] [max_workers]
+"""
+import sys
+import time
+
+import pyswitchlib.asset
+from pyswitchlib.fleet import AssetFleet
+from tests.unit.rest_standin import StandInSwitch
+
+
+def run_serially(devices):
+    for ip_addr, auth in devices:
+        asset = pyswitchlib.asset.Asset(ip_addr=ip_addr, auth=auth, rest_proto='http', api_mode='inprocess')
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+
+def run_fleet(devices, max_workers):
+    fleet = AssetFleet(devices=devices, max_workers=max_workers, rest_proto='http', api_mode='inprocess')
+
+    for ip_addr, result, error in fleet.run('get_vlan_brief_rpc', vlan_id=10):
+        if error is not None:
+            raise error
+
+
+def main(switches=100, response_delay=0.05, max_workers=32):
+    standin_switches = [StandInSwitch(response_delay=response_delay).start() for index in range(switches)]
+    devices = [(standin_switch.ip_addr, ('admin', 'password')) for standin_switch in standin_switches]
+
+    try:
+        # Imports the pybind module outside of the timed runs.
+        run_serially(devices[:1])
+
+        start = time.time()
+        run_serially(devices)
+        serial_seconds = time.time() - start
+
+        start = time.time()
+        run_fleet(devices, max_workers)
+        fleet_seconds = time.time() - start
+    finally:
+        for standin_switch in standin_switches:
+            standin_switch.stop()
+
+    print('{0} switches, {1} s per request'.format(switches, response_delay))
+    print('serial loop:            {0:8.2f} s'.format(serial_seconds))
+    print('fleet of {0:3d} workers:   {1:8.2f} s ({2:.1f}x)'.format(max_workers, fleet_seconds, serial_seconds / fleet_seconds))
+
+
+if __name__ == '__main__':
+    main(*[float(arg) if '.' in arg else int(arg) for arg in sys.argv[1:]])
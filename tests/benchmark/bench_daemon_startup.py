@@ -0,0 +1,45 @@
+"""
+Compare the API daemon cold start time and resident memory with eager and lazy API registration.
+
+Usage: python -m tests.benchmark.bench_daemon_startup [runs]
+"""
+import subprocess
+import sys
+
+STARTUP_SCRIPT = '''
+import resource
+import sys
+import time
+
+start = time.time()
+
+from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules)
+
+register_api_modules(PySwitchLibApiDaemon, lazy={lazy})
+PySwitchLibApiDaemon()
+
+sys.stdout.write('%f %d' % (time.time() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+'''
+
+
+def measure_startup(lazy, runs):
+    results = []
+
+    for run in range(runs):
+        output = subprocess.check_output([sys.executable, '-B', '-c', STARTUP_SCRIPT.format(lazy=lazy)])
+        seconds, max_rss_kb = output.split()
+        results.append((float(seconds), int(max_rss_kb)))
+
+    return min(result[0] for result in results), min(result[1] for result in results)
+
+
+def main(runs=3):
+    eager_seconds, eager_rss = measure_startup(False, runs)
+    lazy_seconds, lazy_rss = measure_startup(True, runs)
+
+    print('eager registration: {0:8.3f} s {1:8d} KB max RSS'.format(eager_seconds, eager_rss))
+    print('lazy registration:  {0:8.3f} s {1:8d} KB max RSS'.format(lazy_seconds, lazy_rss))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
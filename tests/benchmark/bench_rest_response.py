@@ -0,0 +1,56 @@
+"""
+Compare eager and lazy decoding of a large MAC address table response when the caller only reads the XML text.
+
+Each mode runs in a fresh interpreter so the max RSS reflects that mode alone.
+
+Usage: python -m tests.benchmark.bench_rest_response [entries]
+"""
+import subprocess
+import sys
+
+RESPONSE_SCRIPT = '''
+import resource
+import sys
+import time
+
+import pyswitchlib.asset
+
+
+class Response(object):
+    status_code = 200
+    url = 'http://10.0.0.1/rest/operational-state/mac-address-table'
+    headers = {{}}
+    text = '<mac-address-table>' + ''.join('<mac-address><mac-address>0000.0000.{{0:04x}}</mac-address><vlanid>{{1}}</vlanid><mac-type>dynamic</mac-type><forwarding-interface><interface-type>TenGigabitEthernet</interface-type><interface-name>1/0/{{2}}</interface-name></forwarding-interface></mac-address>'.format(index % 65536, index % 4090 + 1, index % 48 + 1) for index in range({entries})) + '</mac-address-table>'
+
+
+asset = pyswitchlib.asset.Asset.__new__(pyswitchlib.asset.Asset)
+asset._ip_addr = '10.0.0.1'
+asset._overall_status = []
+asset._lazy_response_decoding = {lazy}
+response = Response()
+start = time.time()
+
+asset._record_rest_response(rest_command=['GET', '/mac-address-table', '', 'operational', 1], response=response)
+asset.get_xml_output()
+
+sys.stdout.write('%f %d' % (time.time() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+'''
+
+
+def measure(lazy, entries):
+    output = subprocess.check_output([sys.executable, '-B', '-c', RESPONSE_SCRIPT.format(lazy=lazy, entries=entries)])
+    seconds, max_rss_kb = output.split()
+
+    return float(seconds), int(max_rss_kb)
+
+
+def main(entries=20000):
+    eager_seconds, eager_rss = measure(False, entries)
+    lazy_seconds, lazy_rss = measure(True, entries)
+
+    print('eager decoding: {0:8.3f} s {1:8d} KB max RSS'.format(eager_seconds, eager_rss))
+    print('lazy decoding:  {0:8.3f} s {1:8d} KB max RSS'.format(lazy_seconds, lazy_rss))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
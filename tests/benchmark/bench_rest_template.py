@@ -0,0 +1,33 @@
+"""
+Compare building every REST request with filling memoized REST request templates.
+
+Usage: python -m tests.benchmark.bench_rest_template [iterations]
+"""
+import sys
+
+from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules)
+from tests.benchmark.helpers import calls_per_second
+
+MODULE_NAME = 'pybind.nos.v7_2_0'
+
+
+def provision(api, index):
+    return api.api_dispatch(module_name=MODULE_NAME, api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': index % 4090 + 1})
+
+
+def main(iterations=4000):
+    register_api_modules(PySwitchLibApiDaemon)
+
+    api = PySwitchLibApiDaemon()
+    cached_api = PySwitchLibApiDaemon(api_template_cache_size=1024)
+
+    build_rate = calls_per_second(lambda index: provision(api, index), iterations)
+    template_rate = calls_per_second(lambda index: provision(cached_api, index), iterations)
+
+    print('built:     {0:10.1f} calls/s'.format(build_rate))
+    print('templated: {0:10.1f} calls/s ({1:.1f}x)'.format(template_rate, template_rate / build_rate))
+    print('cache:     {0}'.format(cached_api.api_template_cache_stats()))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,27 @@
+"""
+Compare the pybindJSON/json/dicttoxml conversion with the direct pybind to XML serializer.
+
+Usage: python -m tests.benchmark.bench_rest_xml [iterations]
+"""
+import sys
+
+from pybind.nos.v7_2_0.interface_vlan import interface_vlan
+
+from pyswitchlib.util.restXml import pybind_to_rest_xml
+from tests.benchmark.helpers import calls_per_second
+from tests.unit.test_rest_xml import (legacy_rest_xml, populate)
+
+
+def main(iterations=500):
+    pybind_object = interface_vlan()
+    populate(pybind_object)
+
+    legacy_rate = calls_per_second(lambda index: legacy_rest_xml(pybind_object), iterations)
+    direct_rate = calls_per_second(lambda index: pybind_to_rest_xml(pybind_object=pybind_object), iterations)
+
+    print('pybindJSON/dicttoxml: {0:10.1f} bodies/s'.format(legacy_rate))
+    print('pybind_to_rest_xml:   {0:10.1f} bodies/s ({1:.1f}x)'.format(direct_rate, direct_rate / legacy_rate))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
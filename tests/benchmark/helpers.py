@@ -0,0 +1,41 @@
+"""
+Helpers shared by the PySwitchLib benchmarks.
+"""
+import threading
+import time
+
+import Pyro4
+
+from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules)
+
+
+def start_api_daemon(**daemon_kwargs):
+    """
+    Start an API daemon on a local Pyro daemon thread and return (pyro_daemon, uri).
+    """
+    register_api_modules(PySwitchLibApiDaemon)
+
+    Pyro4.config.THREADPOOL_SIZE_MIN = 10
+    Pyro4.config.THREADPOOL_SIZE = 200
+
+    pyro_daemon = Pyro4.Daemon(host='127.0.0.1')
+    api_exposed_class = Pyro4.expose(PySwitchLibApiDaemon)
+    uri = pyro_daemon.register(api_exposed_class(pyro_daemon=pyro_daemon, **daemon_kwargs), force=True)
+
+    daemon_thread = threading.Thread(target=pyro_daemon.requestLoop)
+    daemon_thread.daemon = True
+    daemon_thread.start()
+
+    return pyro_daemon, uri
+
+
+def calls_per_second(func, iterations):
+    """
+    Run func the given number of times and return the achieved call rate.
+    """
+    start = time.time()
+
+    for index in range(iterations):
+        func(index)
+
+    return iterations / (time.time() - start)
@@ -0,0 +1,164 @@
+"""
+Local stand-in for a switch REST interface used by the unit tests.
+"""
+import socket
+import threading
+import time
+
+try:
+    from BaseHTTPServer import (HTTPServer, BaseHTTPRequestHandler)
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import (HTTPServer, BaseHTTPRequestHandler)
+    from socketserver import ThreadingMixIn
+
+DISCOVER_XML = (
+    '<Root xmlns="urn:brocade.com:mgmt:brocade-rest">'
+    '<config><running self="/rest/config/running"/></config>'
+    '<operational-state self="/rest/operational-state"/>'
+    '<operations self="/rest/operations"/>'
+    '</Root>'
+)
+
+FIRMWARE_XML = (
+    '<output><show-firmware-version>'
+    '<os-name>Network Operating System Software</os-name>'
+    '<os-version>7.2.0</os-version>'
+    '<firmware-full-version>7.2.0</firmware-full-version>'
+    '</show-firmware-version></output>'
+)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def handle(self):
+        switch = self.server.switch
+
+        if switch.blackhole_protocols:
+            rest_proto = 'https' if self.connection.recv(1, socket.MSG_PEEK) == b'\x16' else 'http'
+
+            if rest_proto in switch.blackhole_protocols:
+                switch.stopped.wait()
+                return
+
+        BaseHTTPRequestHandler.handle(self)
+
+    def _respond(self):
+        switch = self.server.switch
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else ''
+
+        with switch.lock:
+            switch.requests.append((self.command, self.path, body, dict(self.headers)))
+            switch.active_requests += 1
+            switch.max_active_requests = max(switch.max_active_requests, switch.active_requests)
+
+        if switch.response_delay:
+            time.sleep(switch.response_delay)
+
+        with switch.lock:
+            switch.active_requests -= 1
+
+        status, text = switch.get_response(self.command, self.path, self.headers)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(text)))
+
+        if status < 400 and self.headers.get('Authorization'):
+            self.send_header('Authentication-Token', switch.issue_token())
+
+        self.end_headers()
+        self.wfile.write(text)
+
+    do_GET = _respond
+    do_POST = _respond
+    do_PUT = _respond
+    do_PATCH = _respond
+    do_DELETE = _respond
+
+
+class _StandInServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def get_request(self):
+        request = HTTPServer.get_request(self)
+
+        with self.switch.lock:
+            self.switch.connections += 1
+
+        return request
+
+
+class StandInSwitch(object):
+    """
+    Serves the discovery, firmware version and API URIs of a NOS switch on a local port.
+    """
+
+    def __init__(self, firmware_xml=FIRMWARE_XML, response_delay=0):
+        self.firmware_xml = firmware_xml
+        self.response_delay = response_delay
+        self.responses = {}
+        self.requests = []
+        self.connections = 0
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self.tokens = set()
+        self.blackhole_protocols = set()
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        self._token_index = 0
+        self._server = _StandInServer(('127.0.0.1', 0), _StandInHandler)
+        self._server.switch = self
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def ip_addr(self):
+        return '127.0.0.1:' + str(self._server.server_address[1])
+
+    def start(self):
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def issue_token(self):
+        with self.lock:
+            self._token_index += 1
+            token = 'token-' + str(self._token_index)
+            self.tokens.add(token)
+
+        return token
+
+    def get_response(self, method, path, headers):
+        if not headers.get('Authorization') and headers.get('Authentication-Token') not in self.tokens:
+            return 401, '<errors><error><error-message>Unauthorized</error-message></error></errors>'
+
+        if (method, path) in self.responses:
+            return self.responses[(method, path)]
+
+        if method == 'GET' and path == '/rest':
+            return 200, DISCOVER_XML
+
+        if method == 'POST' and path.endswith('/show-firmware-version'):
+            return 200, self.firmware_xml
+
+        return 200, ''
+
+    def api_requests(self):
+        """
+        Returns the requests made after discovery and the firmware version lookup.
+        """
+        return [request for request in self.requests if request[1] != '/rest' and not request[1].endswith('/show-firmware-version')]
+
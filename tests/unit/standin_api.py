@@ -0,0 +1,11 @@
+"""
+Stand-in for a generated pyswitchlib.api module used by the lazy registration tests.
+"""
+
+
+def standin_vlan_rpc(self, vlan_id=None, api_timeout=''):
+    return ([['POST', '/standin-vlan', '<input><vlan-id>' + str(vlan_id) + '</vlan-id></input>', 'rpc', 1]], '', api_timeout)
+
+
+def standin_module_rpc(self, api_timeout=''):
+    return ([['POST', '/' + self._module_name, '', 'rpc', 1]], '', api_timeout)
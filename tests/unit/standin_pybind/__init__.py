@@ -0,0 +1,3 @@
+"""
+Stand-in for a pybind firmware package used by the module preload tests.
+"""
@@ -0,0 +1,2 @@
+class brocade_standin(object):
+    pass
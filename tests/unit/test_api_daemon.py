@@ -0,0 +1,430 @@
+import sys
+import threading
+import time
+
+import Pyro4
+import unittest2 as unittest
+
+from pyswitchlib.api import rpc
+import pyswitchlib.pyswitchlib_api_daemon
+from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules, get_pybind_module_names)
+from tests.benchmark.helpers import start_api_daemon
+
+
+def standin_build_api(self, build_seconds=0.02):
+    time.sleep(build_seconds)
+
+    return ([['GET', '/' + self._module_name, '', 'config', 1]], '', '')
+
+
+class TestApiDispatch(unittest.TestCase):
+
+    def setUp(self):
+        register_api_modules(PySwitchLibApiDaemon)
+        self.api = PySwitchLibApiDaemon()
+
+    def test_dispatch_matches_module_name_path(self):
+        self.api.module_name(module_name='pybind.nos.v7_2_0')
+        expected = self.api.get_vlan_brief_rpc(vlan_id=10)
+
+        result = self.api.api_dispatch(module_name='pybind.nos.v7_2_0', api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertEqual(expected, result)
+        self.assertEqual([['POST', '/get-vlan-brief', '<input><vlan-id>10</vlan-id></input>', 'rpc', 1]], result[0])
+
+    def test_dispatch_rejects_private_names(self):
+        with self.assertRaises(AttributeError):
+            self.api.api_dispatch(module_name='pybind.nos.v7_2_0', api_name='_get_pybind_object')
+
+
+class TestApiDispatchConcurrency(unittest.TestCase):
+
+    clients = 100
+    calls_per_client = 5
+
+    def setUp(self):
+        PySwitchLibApiDaemon.standin_build_api = standin_build_api
+        self.pyro_daemon, self.uri = start_api_daemon()
+
+    def tearDown(self):
+        self.pyro_daemon.shutdown()
+        del PySwitchLibApiDaemon.standin_build_api
+
+    def _run_client(self, module_name, results):
+        with Pyro4.Proxy(self.uri) as proxy:
+            for index in range(self.calls_per_client):
+                results.append((module_name, proxy.api_dispatch(module_name=module_name, api_name='standin_build_api')))
+
+    def _calls_per_second(self, clients):
+        results = []
+        threads = [threading.Thread(target=self._run_client, args=('pybind.nos.v' + str(n), results)) for n in range(clients)]
+        start = time.time()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.time() - start
+
+        self.assertEqual(clients * self.calls_per_client, len(results))
+
+        for module_name, result in results:
+            self.assertEqual('/' + module_name, result[0][0][1])
+
+        return len(results) / elapsed
+
+    def test_concurrent_clients_scale(self):
+        single_client_rate = self._calls_per_second(1)
+        concurrent_rate = self._calls_per_second(self.clients)
+
+        self.assertGreater(concurrent_rate, single_client_rate * 10)
+
+
+class TestApiTemplateCache(unittest.TestCase):
+
+    module_name = 'pybind.nos.v7_2_0'
+
+    def setUp(self):
+        register_api_modules(PySwitchLibApiDaemon)
+        self.api = PySwitchLibApiDaemon()
+        self.cached_api = PySwitchLibApiDaemon(api_template_cache_size=8)
+
+    def _assert_same_request(self, api_name, api_kwargs):
+        expected = self.api.api_dispatch(module_name=self.module_name, api_name=api_name, api_kwargs=api_kwargs)
+        result = self.cached_api.api_dispatch(module_name=self.module_name, api_name=api_name, api_kwargs=api_kwargs)
+
+        self.assertEqual(expected, result)
+
+    def test_filled_templates_match_built_requests(self):
+        for index in range(1, 6):
+            self._assert_same_request('get_vlan_brief_rpc', {'vlan_id': index, 'api_timeout': index})
+            self._assert_same_request('bna_config_cmd_rpc', {'src': 'a&b<' + str(index), 'dest': 'flash://' + str(index)})
+
+        stats = self.cached_api.api_template_cache_stats()
+
+        self.assertEqual(6, stats['hits'])
+        self.assertEqual(4, stats['misses'])
+        self.assertEqual(2, stats['size'])
+
+    def test_cache_is_size_bounded(self):
+        cached_api = PySwitchLibApiDaemon(api_template_cache_size=2)
+
+        for module_name in ['pybind.nos.v6_0_2f', 'pybind.nos.v7_2_0', 'pybind.slxos.v17r_1_01a', 'pybind.slxos.v17s_1_02']:
+            cached_api.api_dispatch(module_name=module_name, api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertEqual(2, cached_api.api_template_cache_stats()['size'])
+
+    def test_cache_disabled_by_default(self):
+        self.api.api_dispatch(module_name=self.module_name, api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertEqual({'hits': 0, 'misses': 0, 'size': 0, 'max_size': 0}, self.api.api_template_cache_stats())
+
+
+class TestConfigWorker(unittest.TestCase):
+
+    def setUp(self):
+        import pybind.nos.v7_2_0
+
+        self.api = PySwitchLibApiDaemon()
+        self.vlan = pybind.nos.v7_2_0.brocade_interface().interface_vlan.interface.vlan.add('10')
+
+    def test_leaf_updates_are_marked_independent(self):
+        self.vlan._set_description('uplink')
+        self.vlan._set_vlan_name('blue')
+
+        rest_commands = self.api._config_worker(operation_type='update_patch', pybind_object=self.vlan, resource_depth=1)[0]
+
+        self.assertEqual([['PATCH', '/interface/Vlan/10/name', '<name>blue</name>', 'config', 1, True],
+                          ['PATCH', '/interface/Vlan/10/description', '<description>uplink</description>', 'config', 1, True]], rest_commands)
+
+    def test_single_leaf_update_is_not_marked(self):
+        self.vlan._set_description('uplink')
+
+        rest_commands = self.api._config_worker(operation_type='update_patch', pybind_object=self.vlan, resource_depth=1)[0]
+
+        self.assertEqual([['PATCH', '/interface/Vlan/10/description', '<description>uplink</description>', 'config', 1]], rest_commands)
+
+
+class StandInNetmikoSession(object):
+
+    command_seconds = 0.1
+
+    def __init__(self, **opt):
+        self.opt = opt
+
+    def is_alive(self):
+        return True
+
+    def enable(self):
+        pass
+
+    def send_command(self, command):
+        time.sleep(self.command_seconds)
+
+        return command + ' on ' + self.opt['ip']
+
+    def disconnect(self):
+        pass
+
+
+class TestNetmikoSessions(unittest.TestCase):
+
+    def setUp(self):
+        self.connect_handler = pyswitchlib.pyswitchlib_api_daemon.ConnectHandler
+        pyswitchlib.pyswitchlib_api_daemon.ConnectHandler = StandInNetmikoSession
+
+    def tearDown(self):
+        pyswitchlib.pyswitchlib_api_daemon.ConnectHandler = self.connect_handler
+
+    def _connect(self, api, password='password'):
+        api.netmiko_acquire()
+        api.create_netmiko_connection({'device_type': 'brocade_netiron', 'ip': '10.0.0.1', 'username': 'admin', 'password': password})
+        api.netmiko_release()
+
+    def test_cli_calls_to_a_switch_run_concurrently(self):
+        api = PySwitchLibApiDaemon(netmiko_max_sessions=4)
+        self._connect(api)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(api.cli_execution('cli-get', '10.0.0.1', 'show version'))) for n in range(4)]
+        start = time.time()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.time() - start, StandInNetmikoSession.command_seconds * 3)
+        self.assertEqual(['show version on 10.0.0.1'] * 4, results)
+        self.assertEqual({'10.0.0.1': {'sessions': 4, 'idle': 4}}, api.netmiko_pool_stats())
+        self.assertEqual('', api.cli_execution('cli-get', '10.0.0.2', 'show version'))
+
+    def test_new_credentials_replace_sessions(self):
+        api = PySwitchLibApiDaemon()
+        self._connect(api)
+        self._connect(api)
+        session = api._netmiko_pool.checkout(host='10.0.0.1')
+        api._netmiko_pool.checkin(pooled_session=session)
+
+        self._connect(api, password='new-password')
+
+        self.assertEqual('new-password', api._netmiko_pool.checkout(host='10.0.0.1').session.opt['password'])
+        self.assertIsNot(session, api._netmiko_pool.checkout(host='10.0.0.1'))
+
+
+class BindingsCapture(Exception):
+    pass
+
+
+class BindingsCaptureApiDaemon(PySwitchLibApiDaemon):
+
+    def _get_pybind_object(self, **kwargs):
+        raise BindingsCapture(kwargs)
+
+
+def linear_bindings(module_name, bindings_list, compositions_list, composed_child_list):
+    for value in bindings_list:
+        if module_name in value[2]:
+            break
+    else:
+        return None, [], []
+
+    pybind_class_module_name = value[2]
+    compositions = []
+
+    for module in value[0].replace(value[2] + '.', '', 1).split('.'):
+        pybind_class_module_name = pybind_class_module_name + '.' + module
+
+        for composition_index, composition_tuple in enumerate(compositions_list):
+            if pybind_class_module_name == composition_tuple[0]:
+                compositions.append(composition_index)
+
+    children = [child_index for child_index, child_tuple in enumerate(composed_child_list) if pybind_class_module_name in child_tuple[0]]
+
+    return value, compositions, children
+
+
+class TestBindingsIndex(unittest.TestCase):
+
+    def setUp(self):
+        register_api_modules(PySwitchLibApiDaemon)
+        self.api = PySwitchLibApiDaemon()
+        self.capture_api = BindingsCaptureApiDaemon()
+
+    def _get_tables(self, api_name):
+        try:
+            getattr(self.capture_api, api_name)()
+        except BindingsCapture as e:
+            return e.args[0]
+
+    def _get_indexed_bindings(self, tables):
+        value, compositions_map, child_indexes = self.api._get_bindings_index(index_name='pybind_object', resolve=lambda: self.api._resolve_pybind_object_bindings(bindings_list=tables['bindings_list'], compositions_list=tables['compositions_list'], composed_child_list=tables['composed_child_list']))
+        compositions = []
+
+        if value is not None:
+            pybind_class_module_name = value[2]
+
+            for module in value[0].replace(value[2] + '.', '', 1).split('.'):
+                pybind_class_module_name = pybind_class_module_name + '.' + module
+                compositions.extend(compositions_map.get(pybind_class_module_name, []))
+
+        return value, compositions, child_indexes
+
+    def test_indexed_bindings_match_linear_scan(self):
+        api_names = [api_name for api_name in dir(rpc) if api_name.endswith('_rpc')]
+
+        for api_name in api_names:
+            tables = self._get_tables(api_name)
+            module_names = set('.'.join(value[2].split('.')[:3]) for value in tables['bindings_list'])
+
+            for module_name in module_names | set(['pybind.nos.v5_0_1']):
+                expected = linear_bindings(module_name, tables['bindings_list'], tables['compositions_list'], tables['composed_child_list'])
+                expected_bindings_yang_names = [value[0].split('.')[-1].replace('_', '-') for value in tables['bindings_list'] if module_name == value[2]]
+                expected_child_yang_names = [child_tuple[1] for child_tuple in tables['composed_child_list'] if module_name in child_tuple[0]]
+
+                self.api._module_name = module_name
+                self.api._api_local.api_name = api_name
+
+                for attempt in range(2):
+                    self.assertEqual(expected, self._get_indexed_bindings(tables), module_name + ' ' + api_name)
+                    self.assertEqual(expected_bindings_yang_names, self.api._get_bindings_list_yang_name(bindings_list=tables['bindings_list']))
+                    self.assertEqual(expected_child_yang_names, self.api._get_child_list_yang_name(composed_child_list=tables['composed_child_list']))
+
+        self.assertEqual(set(['pybind_object', 'bindings_list_yang_name', 'child_list_yang_name']), set(index_key[2] for index_key in self.api._bindings_index))
+
+    def test_dispatch_uses_index(self):
+        self.api.api_dispatch(module_name='pybind.nos.v7_2_0', api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertIn(('get_vlan_brief_rpc', 'pybind.nos.v7_2_0', 'pybind_object'), self.api._bindings_index)
+        self.assertIsNone(self.api._api_local.api_name)
+
+
+class TestLazyApiRegistration(unittest.TestCase):
+
+    api_module_name = 'tests.unit.standin_api'
+
+    def setUp(self):
+        self.api_modules = pyswitchlib.pyswitchlib_api_daemon.pyswitchlib_api_modules
+        pyswitchlib.pyswitchlib_api_daemon.pyswitchlib_api_modules = [self.api_module_name]
+        sys.modules.pop(self.api_module_name, None)
+
+        class LazyApiDaemon(PySwitchLibApiDaemon):
+            pass
+
+        self.api_class = LazyApiDaemon
+
+    def tearDown(self):
+        pyswitchlib.pyswitchlib_api_daemon.pyswitchlib_api_modules = self.api_modules
+
+    def test_module_imported_on_first_call(self):
+        register_api_modules(self.api_class)
+
+        self.assertNotIn(self.api_module_name, sys.modules)
+        self.assertTrue(hasattr(self.api_class, 'standin_vlan_rpc'))
+        self.assertFalse(hasattr(self.api_class, 'standin_missing_rpc'))
+
+        result = self.api_class().api_dispatch(module_name='pybind.nos.v7_2_0', api_name='standin_vlan_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertIn(self.api_module_name, sys.modules)
+        self.assertIs(sys.modules[self.api_module_name].standin_vlan_rpc, self.api_class.__dict__['standin_vlan_rpc'])
+        self.assertIs(sys.modules[self.api_module_name].standin_module_rpc, self.api_class.__dict__['standin_module_rpc'])
+        self.assertEqual('<input><vlan-id>10</vlan-id></input>', result[0][0][2])
+
+    def test_lazily_loaded_apis_stay_exposed(self):
+        register_api_modules(self.api_class)
+        pyro_daemon = Pyro4.Daemon(host='127.0.0.1')
+        Pyro4.expose(PySwitchLibApiDaemon)
+        uri = pyro_daemon.register(Pyro4.expose(self.api_class)(pyro_daemon=pyro_daemon), force=True)
+        daemon_thread = threading.Thread(target=pyro_daemon.requestLoop)
+        daemon_thread.daemon = True
+        daemon_thread.start()
+
+        try:
+            with Pyro4.Proxy(uri) as proxy:
+                proxy.module_name(module_name='pybind.nos.v7_2_0')
+
+                self.assertEqual('/pybind.nos.v7_2_0', proxy.standin_module_rpc()[0][0][1])
+                self.assertEqual('/standin-vlan', proxy.standin_vlan_rpc(vlan_id=10)[0][0][1])
+        finally:
+            pyro_daemon.shutdown()
+
+
+class TestPreloadModules(unittest.TestCase):
+
+    module_name = 'tests.unit.standin_pybind'
+
+    def _wait_for_preload(self, api):
+        for attempt in range(100):
+            if all(status['state'] in ('loaded', 'failed') for status in api.api_preload_status().values()):
+                break
+
+            time.sleep(0.05)
+
+        return api.api_preload_status()
+
+    def test_preload_imports_modules_in_background(self):
+        api = PySwitchLibApiDaemon(api_preload_modules=[self.module_name, 'pybind.nos.v0_0_0'])
+        status = self._wait_for_preload(api)
+
+        self.assertEqual('loaded', status[self.module_name]['state'])
+        self.assertGreater(status[self.module_name]['seconds'], 0)
+        self.assertEqual('failed', status['pybind.nos.v0_0_0']['state'])
+        self.assertTrue(status['pybind.nos.v0_0_0']['error'])
+        self.assertIs(sys.modules[self.module_name + '.brocade_standin_rpc'], api._import_pybind_module(module_name=self.module_name + '.brocade_standin_rpc'))
+
+    def test_no_preload_by_default(self):
+        self.assertEqual({}, PySwitchLibApiDaemon().api_preload_status())
+
+    def test_module_names_expand_against_installed_pybind(self):
+        nos_module_names = get_pybind_module_names(module_names=['pybind.nos'])
+
+        self.assertIn('pybind.nos.v7_2_0', nos_module_names)
+        self.assertTrue(all(module_name.startswith('pybind.nos.') for module_name in nos_module_names))
+        self.assertLess(set(nos_module_names), set(get_pybind_module_names(module_names=['all'])))
+        self.assertEqual(['pybind.nos.v7_2_0', self.module_name], get_pybind_module_names(module_names=['pybind.nos.v7_2_0', self.module_name, 'pybind.nos.v7_2_0']))
+
+
+class TestApiWorkerProcesses(unittest.TestCase):
+
+    module_name = 'pybind.nos.v7_2_0'
+
+    def setUp(self):
+        register_api_modules(PySwitchLibApiDaemon)
+        self.api = PySwitchLibApiDaemon(api_preload_modules=['tests.unit.standin_pybind'], api_worker_processes=2)
+
+    def tearDown(self):
+        self.api.shutdown()
+
+    def test_workers_build_same_requests(self):
+        expected = PySwitchLibApiDaemon().api_dispatch(module_name=self.module_name, api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertEqual(expected, self.api.api_dispatch(module_name=self.module_name, api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10}))
+
+    def test_worker_errors_are_raised(self):
+        with self.assertRaises(AttributeError):
+            self.api.api_dispatch(module_name=self.module_name, api_name='standin_missing_rpc')
+
+    def test_requests_routed_by_api_and_module(self):
+        api_worker_pool = self.api._get_api_worker_pool(module_name=self.module_name, api_name='get_vlan_brief_rpc')
+
+        self.assertIs(api_worker_pool, self.api._get_api_worker_pool(module_name=self.module_name, api_name='get_vlan_brief_rpc'))
+        self.assertEqual(set(self.api._api_worker_pools), set(self.api._get_api_worker_pool(module_name=self.module_name, api_name=api_name) for api_name in dir(rpc) if api_name.endswith('_rpc')))
+
+    def test_workers_preload_modules(self):
+        for attempt in range(100):
+            status = self.api.api_preload_status()
+
+            if status['tests.unit.standin_pybind']['state'] == 'loaded':
+                break
+
+            time.sleep(0.05)
+
+        self.assertEqual('loaded', status['tests.unit.standin_pybind']['state'])
+        self.assertEqual({}, self.api._preload_status)
+
+
+if __name__ == '__main__':
+    unittest.main()
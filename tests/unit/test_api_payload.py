@@ -0,0 +1,29 @@
+import unittest2 as unittest
+
+from pyswitchlib.util.apiPayload import (pack_api_result, unpack_api_result)
+
+
+class TestApiPayload(unittest.TestCase):
+
+    result = ([['POST', '/get-vlan-brief', '<input><vlan-id>10</vlan-id></input>', 'rpc', 1]], ['vlan'], (60, 120))
+
+    def test_round_trip(self):
+        self.assertEqual(self.result, unpack_api_result(payload=pack_api_result(result=self.result)))
+
+    def test_compressed_above_threshold(self):
+        result = ([['PATCH', '/interface/vlan/' + str(index), u'<vlan><name>v' + str(index) + u'</name></vlan>', 'config', 1] for index in range(500)], '', '')
+        result = (list(result[0]), result[1], result[2])
+        plain_payload = pack_api_result(result=result)
+        compressed_payload = pack_api_result(result=result, compress_threshold=1024)
+
+        self.assertLess(len(compressed_payload), len(plain_payload) / 4)
+        self.assertEqual(result, unpack_api_result(payload=compressed_payload))
+        self.assertEqual(plain_payload, pack_api_result(result=result, compress_threshold=len(plain_payload)))
+
+    def test_unknown_payload_type(self):
+        with self.assertRaises(ValueError):
+            unpack_api_result(payload=b'X' + pack_api_result(result=self.result)[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest2 as unittest
+
+from pyswitchlib.util.apiStats import ApiStats
+
+
+def call_record(api_name='get_vlan_brief_rpc', ip_addr='10.0.0.1', total_seconds=0):
+    return {'api_name': api_name, 'ip_addr': ip_addr, 'start': 0, 'total_seconds': total_seconds, 'build_seconds': 0, 'rest_commands': []}
+
+
+class TestApiStats(unittest.TestCase):
+
+    def test_histogram_covers_rolling_window(self):
+        stats = ApiStats(window=100)
+
+        for index in range(200):
+            stats.add(record=call_record(total_seconds=100 if index < 100 else (index - 100) / 1000.0))
+
+        histogram = stats.get_histogram(api_name='get_vlan_brief_rpc')
+
+        self.assertEqual(100, histogram['count'])
+        self.assertEqual(0.05, histogram['p50'])
+        self.assertEqual(0.099, histogram['max'])
+        self.assertEqual([2, 1, 3, 5, 15, 25, 49] + [0] * 9, [count for bound, count in histogram['buckets']])
+        self.assertEqual(None, histogram['buckets'][-1][0])
+        self.assertEqual({'count': 0, 'p50': None, 'p90': None, 'p99': None, 'max': None}, dict((key, value) for key, value in stats.get_histogram(api_name='other_rpc').items() if key != 'buckets'))
+
+    def test_records_are_bounded_and_filtered(self):
+        stats = ApiStats(max_records=3)
+
+        for ip_addr in ('10.0.0.1', '10.0.0.2', '10.0.0.1', '10.0.0.2'):
+            stats.add(record=call_record(ip_addr=ip_addr))
+
+        self.assertEqual(3, len(stats.get_records()))
+        self.assertEqual(['10.0.0.1'], [record['ip_addr'] for record in stats.get_records(ip_addr='10.0.0.1')])
+        self.assertEqual(['get_vlan_brief_rpc'], stats.get_api_names())
+
+    def test_hooks_get_each_record(self):
+        stats = ApiStats()
+        records = []
+
+        stats.add_hook(hook=records.append)
+        stats.add(record=call_record())
+        stats.remove_hook(hook=records.append)
+        stats.add(record=call_record())
+
+        self.assertEqual([call_record()], records)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,596 @@
+import copy
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from random import uniform as random_uniform
+
+import Pyro4
+import unittest2 as unittest
+
+import pyswitchlib.asset
+import pyswitchlib.exceptions
+from pyswitchlib.pyswitchlib_api_daemon import PySwitchLibApiDaemon
+import pyswitchlib.util.restSession
+from pyswitchlib.util.restSession import (rest_connection_pool, switch_limiter, get_rest_session)
+from pyswitchlib.util.configFile import ConfigFileUtil
+from pyswitchlib.util.apiStats import (ApiStats, api_stats)
+from pyswitchlib.exceptions import (ApiModeTypeError, RestInterfaceError, RestCircuitOpenError)
+from tests.unit.rest_standin import StandInSwitch
+from tests.benchmark.helpers import start_api_daemon
+
+
+class TestAssetInProcess(unittest.TestCase):
+
+    def setUp(self):
+        self.switch = StandInSwitch().start()
+
+    def tearDown(self):
+        self.switch.stop()
+
+    def test_inprocess_api_call(self):
+        asset = pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+
+        self.assertEqual('pybind.nos.v7_2_0', asset.get_supported_module_name())
+
+        status, result = asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertTrue(status)
+        self.assertEqual([('POST', '/rest/operations/get-vlan-brief', '<input><vlan-id>10</vlan-id></input>')],
+                         [request[:3] for request in self.switch.api_requests()])
+
+    def test_invalid_api_mode(self):
+        with self.assertRaises(ApiModeTypeError):
+            pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='remote')
+
+
+def standin_echo_rpc(self, vlan_id=None):
+    return ([['POST', '/standin-echo', repr(vlan_id), 'rpc', 1]] * 100, '', '')
+
+
+class TestAssetConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        rest_connection_pool.clear()
+        self.switch = StandInSwitch().start()
+
+    def tearDown(self):
+        self.switch.stop()
+        rest_connection_pool.clear()
+
+    def test_assets_share_connections(self):
+        assets = [pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess') for index in range(5)]
+
+        for asset in assets:
+            asset.get_vlan_brief_rpc(vlan_id=10)
+            asset._session.close()
+
+        self.assertEqual(15, len(self.switch.requests))
+        self.assertEqual(1, self.switch.connections)
+
+    def test_connections_per_host_are_bounded(self):
+        self.switch.response_delay = 0.1
+        sessions = [get_rest_session(pool_maxsize=2) for index in range(6)]
+        threads = [threading.Thread(target=session.get, args=('http://' + self.switch.ip_addr + '/rest',), kwargs={'auth': ('admin', 'password')}) for session in sessions]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(6, len(self.switch.requests))
+        self.assertEqual(2, self.switch.connections)
+
+    def test_idle_connections_are_evicted(self):
+        session = get_rest_session(pool_idle_timeout=-1)
+
+        for index in range(3):
+            session.get('http://' + self.switch.ip_addr + '/rest', auth=('admin', 'password'))
+
+        self.assertEqual(3, self.switch.connections)
+
+
+def set_pyswitchlib_conf(conf):
+    """
+    Makes assets read the given pyswitchlib.conf settings.
+    """
+
+    class StandInConfigFileUtil(ConfigFileUtil):
+
+        def read(self, filename=None):
+            if filename.endswith('pyswitchlib.conf'):
+                return dict(conf)
+
+            return super(StandInConfigFileUtil, self).read(filename=filename)
+
+    pyswitchlib.asset.ConfigFileUtil = StandInConfigFileUtil
+
+
+class TestAssetRequestLimits(unittest.TestCase):
+
+    def setUp(self):
+        switch_limiter.clear()
+        self.switch = StandInSwitch().start()
+        self.vlan_brief = ('POST', '/rest/operations/get-vlan-brief')
+
+    def tearDown(self):
+        pyswitchlib.util.restSession.random.uniform = random_uniform
+        pyswitchlib.asset.ConfigFileUtil = ConfigFileUtil
+        self.switch.stop()
+        switch_limiter.clear()
+
+    def _create_asset(self, conf):
+        set_pyswitchlib_conf(conf)
+
+        return pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+
+    def test_in_flight_requests_are_capped_across_assets(self):
+        assets = [self._create_asset({'rest_max_in_flight': '2'}) for index in range(6)]
+        self.switch.response_delay = 0.1
+        threads = [threading.Thread(target=asset.get_vlan_brief_rpc, kwargs={'vlan_id': 10}) for asset in assets]
+
+        for thread in threads:
+            thread.start()
+
+        time.sleep(0.05)
+        status = assets[0].get_rest_transport_status()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(2, self.switch.max_active_requests)
+        self.assertEqual({'circuit_state': 'closed', 'in_flight': 2, 'waiting': 4, 'consecutive_failures': 0}, status)
+
+    def test_failures_back_off(self):
+        pyswitchlib.util.restSession.random.uniform = lambda low, high: high
+        asset = self._create_asset({'rest_backoff_base': '0.2'})
+        self.switch.responses[self.vlan_brief] = (503, '<errors/>')
+        asset.get_vlan_brief_rpc(vlan_id=10)
+        asset.get_vlan_brief_rpc(vlan_id=10)
+        start = time.time()
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertGreaterEqual(time.time() - start, 0.4)
+        self.assertEqual(3, asset.get_rest_transport_status()['consecutive_failures'])
+
+        del self.switch.responses[self.vlan_brief]
+        asset.get_vlan_brief_rpc(vlan_id=10)
+        start = time.time()
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertLess(time.time() - start, 0.2)
+        self.assertEqual(0, asset.get_rest_transport_status()['consecutive_failures'])
+
+    def test_circuit_breaker_sheds_load(self):
+        asset = self._create_asset({'rest_circuit_failure_threshold': '3', 'rest_circuit_reset_timeout': '1'})
+        self.switch.responses[self.vlan_brief] = (500, '<errors/>')
+
+        for index in range(3):
+            asset.get_vlan_brief_rpc(vlan_id=10)
+
+        request_count = len(self.switch.requests)
+
+        with self.assertRaises(RestCircuitOpenError):
+            asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertEqual(request_count, len(self.switch.requests))
+        self.assertEqual('open', asset.get_rest_transport_status()['circuit_state'])
+
+        del self.switch.responses[self.vlan_brief]
+        time.sleep(1)
+        status, result = asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertTrue(status)
+        self.assertEqual('closed', asset.get_rest_transport_status()['circuit_state'])
+
+    def test_failed_trial_reopens_circuit(self):
+        asset = self._create_asset({'rest_circuit_failure_threshold': '1', 'rest_circuit_reset_timeout': '1'})
+        self.switch.responses[self.vlan_brief] = (500, '<errors/>')
+        asset.get_vlan_brief_rpc(vlan_id=10)
+        time.sleep(1)
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+        with self.assertRaises(RestCircuitOpenError):
+            asset.get_vlan_brief_rpc(vlan_id=10)
+
+
+class TestAssetFactsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.switch = StandInSwitch().start()
+        self.temp_dir = tempfile.mkdtemp()
+        self.facts_cache_file = os.path.join(self.temp_dir, 'facts.json')
+        set_pyswitchlib_conf({'facts_cache_ttl': '3600', 'facts_cache_file': self.facts_cache_file})
+
+    def tearDown(self):
+        pyswitchlib.asset.ConfigFileUtil = ConfigFileUtil
+        self.switch.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _create_asset(self):
+        return pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+
+    def _read_facts(self):
+        with open(self.facts_cache_file) as facts_file:
+            return json.load(facts_file)[self.switch.ip_addr + '/http']
+
+    def test_warm_asset_makes_no_requests(self):
+        cold_asset = self._create_asset()
+        discovery_requests = len(self.switch.requests)
+        warm_asset = self._create_asset()
+
+        self.assertEqual(2, discovery_requests)
+        self.assertEqual(discovery_requests, len(self.switch.requests))
+        self.assertEqual(cold_asset._get_facts(), warm_asset._get_facts())
+        self.assertEqual('/rest/operations', warm_asset._rest_rpc_path)
+        self.assertEqual('pybind.nos.v7_2_0', warm_asset.get_supported_module_name())
+
+    def test_expired_facts_are_rediscovered(self):
+        self._create_asset()
+
+        with open(self.facts_cache_file) as facts_file:
+            facts_dict = json.load(facts_file)
+
+        facts_dict[self.switch.ip_addr + '/http']['timestamp'] -= 7200
+
+        with open(self.facts_cache_file, 'w') as facts_file:
+            json.dump(facts_dict, facts_file)
+
+        self._create_asset()
+
+        self.assertEqual(4, len(self.switch.requests))
+
+    def test_refused_request_revalidates_facts(self):
+        self._create_asset()
+
+        with open(self.facts_cache_file) as facts_file:
+            facts_dict = json.load(facts_file)
+
+        facts_dict[self.switch.ip_addr + '/http']['rest_rpc_path'] = '/rest/stale'
+
+        with open(self.facts_cache_file, 'w') as facts_file:
+            json.dump(facts_dict, facts_file)
+
+        self.switch.responses[('POST', '/rest/stale/get-vlan-brief')] = (404, '<errors><error><error-message>Not Found</error-message></error></errors>')
+        asset = self._create_asset()
+
+        status, result = asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertTrue(status)
+        self.assertEqual(['/rest/stale/get-vlan-brief', '/rest/operations/get-vlan-brief'], [request[1] for request in self.switch.api_requests()])
+        self.assertEqual('/rest/operations', self._read_facts()['rest_rpc_path'])
+
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertEqual(7, len(self.switch.requests))
+
+
+class StandInResponse(object):
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = '<Root/>'
+        self.url = ''
+
+
+class TestAssetAutoDiscovery(unittest.TestCase):
+
+    def setUp(self):
+        self.switch = StandInSwitch().start()
+        set_pyswitchlib_conf({'discovery_timeout': '1'})
+
+    def tearDown(self):
+        pyswitchlib.asset.ConfigFileUtil = ConfigFileUtil
+        self.switch.stop()
+
+    def test_blackholed_https_does_not_stall_discovery(self):
+        self.switch.blackhole_protocols.add('https')
+        start = time.time()
+
+        asset = pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='auto', api_mode='inprocess')
+
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual('http', asset._rest_protocol)
+        self.assertEqual(['http'], asset.get_enabled_rest_protocols())
+        self.assertEqual('/rest/operations', asset._rest_rpc_path)
+
+    def test_blackholed_http_fails_within_discovery_timeout(self):
+        self.switch.blackhole_protocols.add('http')
+        start = time.time()
+
+        with self.assertRaises(RestInterfaceError):
+            pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='auto', api_mode='inprocess')
+
+        self.assertLess(time.time() - start, 5)
+
+    def test_https_preferred_when_both_succeed(self):
+        asset = pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+        probe_delays = {'http': 0, 'https': 0.2}
+
+        def probe_rest_protocol(rest_command=None, rest_proto='', cacert=None):
+            time.sleep(probe_delays[rest_proto])
+
+            return StandInResponse(200)
+
+        asset._probe_rest_protocol = probe_rest_protocol
+        del asset._enabled_rest_protocols[:]
+
+        status, result = asset._do_concurrent_rest_protocol_discovery(rest_command=['GET', '', '', 'discover', 1])
+
+        self.assertTrue(status)
+        self.assertEqual('https', asset._rest_protocol)
+        self.assertEqual(['http', 'https'], asset.get_enabled_rest_protocols())
+
+
+class TestAssetLazyResponseDecoding(unittest.TestCase):
+
+    mac_table_xml = '<mac-address-table>' + ''.join('<mac-address>0000.0000.{0:04x}</mac-address>'.format(index) for index in range(50)) + '</mac-address-table>'
+
+    def setUp(self):
+        self.switch = StandInSwitch().start()
+        self.switch.responses[('POST', '/rest/operations/get-vlan-brief')] = (200, '<output>' + self.mac_table_xml + '</output>')
+
+    def tearDown(self):
+        pyswitchlib.asset.ConfigFileUtil = ConfigFileUtil
+        self.switch.stop()
+
+    def _get_response(self, lazy_response_decoding):
+        set_pyswitchlib_conf({'lazy_response_decoding': lazy_response_decoding})
+        asset = pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+        decoded_texts = []
+        xml_to_json = asset._xml_to_json
+
+        def counting_xml_to_json(xml=''):
+            decoded_texts.append(xml)
+
+            return xml_to_json(xml=xml)
+
+        asset._xml_to_json = counting_xml_to_json
+        status, result = asset.get_vlan_brief_rpc(vlan_id=10)
+
+        return asset, result[0][self.switch.ip_addr]['response'], decoded_texts
+
+    def test_json_decoded_on_first_access(self):
+        eager_asset, eager_response, eager_decoded_texts = self._get_response('false')
+        asset, response, decoded_texts = self._get_response('true')
+
+        self.assertEqual(1, len(eager_decoded_texts))
+        self.assertEqual(eager_asset.get_xml_output(), asset.get_xml_output())
+        self.assertEqual([], decoded_texts)
+        self.assertEqual(eager_asset.get_dict_output(), asset.get_dict_output())
+        self.assertEqual(eager_response['json'], response['json'])
+        self.assertEqual(1, len(decoded_texts))
+
+    def test_copies_include_json(self):
+        asset, response, decoded_texts = self._get_response('true')
+
+        for response_copy in (copy.deepcopy(response), pickle.loads(pickle.dumps(response))):
+            self.assertIs(dict, type(response_copy))
+            self.assertEqual(response['json'], response_copy['json'])
+
+        self.assertEqual(1, len(decoded_texts))
+
+
+class TestAssetAuthTokens(unittest.TestCase):
+
+    def setUp(self):
+        self.switch = StandInSwitch().start()
+
+    def tearDown(self):
+        self.switch.stop()
+
+    def _create_asset(self):
+        return pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+
+    def test_thread_count_stays_flat(self):
+        self._create_asset()
+        thread_count = threading.active_count()
+        assets = [self._create_asset() for index in range(1000)]
+
+        self.assertEqual(1000, len(assets))
+        self.assertLessEqual(threading.active_count(), thread_count + 1)
+
+    def test_assets_share_tokens(self):
+        first_asset = self._create_asset()
+        authorized_requests = len([request for request in self.switch.requests if request[3].get('authorization')])
+        second_asset = self._create_asset()
+        second_asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertEqual(1, authorized_requests)
+        self.assertEqual(authorized_requests, len([request for request in self.switch.requests if request[3].get('authorization')]))
+
+    def test_refused_token_is_replaced(self):
+        asset = self._create_asset()
+        self.switch.tokens.clear()
+        status, result = asset.get_vlan_brief_rpc(vlan_id=10)
+
+        vlan_requests = [request[3] for request in self.switch.api_requests()]
+
+        self.assertTrue(status)
+        self.assertEqual([False, True], ['authorization' in headers for headers in vlan_requests])
+        self.assertIn(asset._get_auth_token(), self.switch.tokens)
+
+
+def standin_leaf_update(self, leaf_count=0):
+    rest_commands = [['PATCH', '/standin-leaf/' + str(index), '<leaf>' + str(index) + '</leaf>', 'config', 1, True] for index in range(leaf_count)]
+
+    return (rest_commands + [['PATCH', '/standin-container', '<container/>', 'config', 1]], '', '')
+
+
+class TestAssetPipelinedCommands(unittest.TestCase):
+
+    def setUp(self):
+        PySwitchLibApiDaemon.standin_leaf_update = standin_leaf_update
+        self.switch = StandInSwitch().start()
+
+    def tearDown(self):
+        del PySwitchLibApiDaemon.standin_leaf_update
+        pyswitchlib.asset.ConfigFileUtil = ConfigFileUtil
+        self.switch.stop()
+
+    def _update_leaves(self, rest_pipeline_depth):
+        set_pyswitchlib_conf({'rest_pipeline_depth': rest_pipeline_depth})
+        asset = pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+        del self.switch.requests[:]
+        self.switch.response_delay = 0.1
+        start = time.time()
+        status, result = asset.standin_leaf_update(leaf_count=8)
+
+        self.assertTrue(status)
+        self.assertEqual(['/standin-leaf/' + str(index) for index in range(8)] + ['/standin-container'],
+                         [request_status[self.switch.ip_addr]['request']['uri'] for request_status in result])
+
+        return time.time() - start
+
+    def test_independent_commands_are_pipelined(self):
+        self.assertGreater(self._update_leaves('1'), 0.9)
+        self.assertLess(self._update_leaves('4'), 0.6)
+        self.assertEqual('/rest/config/running/standin-container', self.switch.requests[-1][1])
+
+    def test_pipelined_commands_share_one_token(self):
+        self._update_leaves('4')
+
+        self.assertEqual([], [request for request in self.switch.requests if request[3].get('authorization')])
+
+
+class TestAssetApiStats(unittest.TestCase):
+
+    def setUp(self):
+        api_stats.clear()
+        self.switch = StandInSwitch().start()
+        self.switch.responses[('POST', '/rest/operations/get-vlan-brief')] = (200, '<output><vlanid>10</vlanid></output>')
+
+    def tearDown(self):
+        pyswitchlib.asset.ConfigFileUtil = ConfigFileUtil
+        self.switch.stop()
+        api_stats.clear()
+
+    def _create_asset(self, conf):
+        set_pyswitchlib_conf(conf)
+
+        return pyswitchlib.asset.Asset(ip_addr=self.switch.ip_addr, rest_proto='http', api_mode='inprocess')
+
+    def test_calls_are_recorded(self):
+        asset = self._create_asset({'api_stats': 'true'})
+        self.switch.response_delay = 0.1
+        asset.get_vlan_brief_rpc(vlan_id=10)
+        record = api_stats.get_records()[-1]
+        rest_command = record['rest_commands'][0]
+
+        self.assertIs(api_stats, asset.get_api_stats())
+        self.assertEqual(('get_vlan_brief_rpc', self.switch.ip_addr), (record['api_name'], record['ip_addr']))
+        self.assertEqual(('POST', '/get-vlan-brief', 200, 36), (rest_command['op_code'], rest_command['uri'], rest_command['status_code'], rest_command['response_bytes']))
+        self.assertGreaterEqual(rest_command['network_seconds'], 0.1)
+        self.assertLess(rest_command['wait_seconds'], 0.1)
+        self.assertGreater(rest_command['parse_seconds'], 0)
+        self.assertGreaterEqual(record['total_seconds'], record['build_seconds'] + rest_command['network_seconds'])
+        self.assertEqual(1, api_stats.get_histogram(api_name='get_vlan_brief_rpc')['count'])
+
+    def test_off_by_default(self):
+        asset = self._create_asset({})
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertIsNone(asset.get_api_stats())
+        self.assertEqual([], api_stats.get_records())
+
+    def test_stats_set_per_asset(self):
+        stats = ApiStats()
+        asset = self._create_asset({})
+        asset.set_api_stats(stats=stats)
+        asset.get_vlan_brief_rpc(vlan_id=10)
+        asset.set_api_stats(stats=None)
+        asset.get_vlan_brief_rpc(vlan_id=10)
+
+        self.assertEqual(1, len(stats.get_records()))
+        self.assertEqual([], api_stats.get_records())
+
+
+class TestPybindVersionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.sys_path = list(sys.path)
+        sys.path.insert(0, self.temp_dir)
+
+        for os_ver in ('v7_1_0', 'v7_2_0'):
+            os.makedirs(os.path.join(self.temp_dir, 'pybind', 'nos', os_ver))
+
+    def tearDown(self):
+        sys.path[:] = self.sys_path
+        shutil.rmtree(self.temp_dir)
+
+    def test_resolution_is_memoized(self):
+        self.assertEqual('pybind.nos.v7_2_0', pyswitchlib.asset.get_supported_module_name(os_type='nos', os_ver='7.3.0'))
+
+        pybind_ver_tree = pyswitchlib.asset._pybind_ver_trees[os.path.join(self.temp_dir, 'pybind', 'nos')]
+
+        self.assertEqual('pybind.nos.v7_1_0', pyswitchlib.asset.get_supported_module_name(os_type='nos', os_ver='7.1.1'))
+        self.assertIs(pybind_ver_tree, pyswitchlib.asset._pybind_ver_trees[os.path.join(self.temp_dir, 'pybind', 'nos')])
+
+    def test_index_rebuilt_when_directory_changes(self):
+        os_dir = os.path.join(self.temp_dir, 'pybind', 'nos')
+
+        self.assertEqual('pybind.nos.v7_2_0', pyswitchlib.asset.get_supported_module_name(os_type='nos', os_ver='7.3.0'))
+
+        os.makedirs(os.path.join(os_dir, 'v7_3_0'))
+        os.utime(os_dir, (time.time() + 10, time.time() + 10))
+
+        self.assertEqual('pybind.nos.v7_3_0', pyswitchlib.asset.get_supported_module_name(os_type='nos', os_ver='7.3.0'))
+
+    def test_unsupported_os_version(self):
+        with self.assertRaises(pyswitchlib.exceptions.UnsupportedOSError):
+            pyswitchlib.asset.get_supported_module_name(os_type='nos', os_ver='6.0.0')
+
+
+class TestAssetPackedResults(unittest.TestCase):
+
+    def setUp(self):
+        PySwitchLibApiDaemon.standin_echo_rpc = standin_echo_rpc
+        self.pyro_daemon, uri = start_api_daemon()
+        self.asset = pyswitchlib.asset.Asset.__new__(pyswitchlib.asset.Asset)
+        self.asset._proxied = Pyro4.Proxy(uri)
+        self.asset._supported_module_name = 'pybind.nos.v7_2_0'
+        self.asset._api_serializer = 'marshal'
+        self.asset._api_compress_threshold = 256
+        self.asset._api_packed_results = False
+
+    def tearDown(self):
+        self.asset._proxied._pyroRelease()
+        self.pyro_daemon.shutdown()
+        del PySwitchLibApiDaemon.standin_echo_rpc
+
+    def test_negotiates_marshal_and_packed_results(self):
+        expected = self.asset._api_dispatch(api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.asset._negotiate_api_serializer()
+
+        self.assertTrue(self.asset._api_packed_results)
+        self.assertEqual('marshal', self.asset._proxied._pyroSerializer)
+        self.assertEqual(expected, self.asset._api_dispatch(api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10}))
+        self.assertEqual(100, len(self.asset._api_dispatch(api_name='standin_echo_rpc', api_kwargs={'vlan_id': 10})[0]))
+
+    def test_unmarshallable_kwargs_fall_back_to_serpent(self):
+        self.asset._negotiate_api_serializer()
+
+        result = self.asset._api_dispatch(api_name='standin_echo_rpc', api_kwargs={'vlan_id': Decimal('10.5')})
+
+        self.assertIn("'10.5'", result[0][0][2])
+        self.assertEqual('marshal', self.asset._proxied._pyroSerializer)
+
+    def test_unsupported_serializer_keeps_default(self):
+        self.asset._api_serializer = 'pickle'
+        self.asset._negotiate_api_serializer()
+
+        self.assertFalse(self.asset._api_packed_results)
+        self.assertIsNone(self.asset._proxied._pyroSerializer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest2 as unittest
+
+from pyswitchlib.util.authToken import AuthTokenManager
+
+
+class TestAuthTokenManager(unittest.TestCase):
+
+    key = ('10.0.0.1', 'admin', 'password')
+
+    def test_token_refreshed_ahead_of_expiry(self):
+        token_manager = AuthTokenManager()
+
+        token_manager.put(key=self.key, token='token-1', expiration=160)
+        self.assertEqual('token-1', token_manager.get(key=self.key, refresh_margin=10))
+
+        token_manager.put(key=self.key, token='token-1', expiration=5)
+        self.assertIsNone(token_manager.get(key=self.key, refresh_margin=10))
+        self.assertIsNone(token_manager.get(key=self.key, refresh_margin=0))
+
+    def test_invalidate_keeps_newer_token(self):
+        token_manager = AuthTokenManager()
+
+        token_manager.put(key=self.key, token='token-2')
+        token_manager.invalidate(key=self.key, token='token-1')
+        self.assertEqual('token-2', token_manager.get(key=self.key))
+
+        token_manager.invalidate(key=self.key, token='token-2')
+        self.assertIsNone(token_manager.get(key=self.key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import time
+
+import unittest2 as unittest
+
+from pyswitchlib.fleet import AssetFleet
+from pyswitchlib.exceptions import AssetTimeoutError
+from tests.unit.rest_standin import StandInSwitch
+
+
+class TestAssetFleet(unittest.TestCase):
+
+    def setUp(self):
+        self.switches = [StandInSwitch(response_delay=0.1).start() for index in range(8)]
+        self.devices = [(switch.ip_addr, ('admin', 'password')) for switch in self.switches]
+
+    def tearDown(self):
+        for switch in self.switches:
+            switch.stop()
+
+    def test_api_runs_on_every_switch(self):
+        list(AssetFleet(devices=self.devices[:1], rest_proto='http', api_mode='inprocess').run('get_vlan_brief_rpc', vlan_id=10))
+
+        fleet = AssetFleet(devices=self.devices[1:], max_workers=8, rest_proto='http', api_mode='inprocess')
+        start = time.time()
+        results = list(fleet.run('get_vlan_brief_rpc', vlan_id=10))
+
+        # Each switch takes three 0.1 second requests, so serially the seven switches would take 2.1 seconds.
+        self.assertLess(time.time() - start, 1.2)
+        self.assertEqual(sorted(ip_addr for ip_addr, auth in self.devices[1:]), sorted(ip_addr for ip_addr, result, error in results))
+        self.assertEqual([(True, None)] * 7, [(result[0], error) for ip_addr, result, error in results])
+
+        for switch in self.switches:
+            self.assertEqual(1, len(switch.api_requests()))
+
+    def test_assets_are_reused(self):
+        fleet = AssetFleet(devices=self.devices, rest_proto='http', api_mode='inprocess')
+        assets = dict((ip_addr, asset) for ip_addr, asset, error in fleet.connect())
+        request_counts = [len(switch.requests) for switch in self.switches]
+
+        list(fleet.run('get_vlan_brief_rpc', vlan_id=10))
+
+        self.assertEqual([request_count + 1 for request_count in request_counts], [len(switch.requests) for switch in self.switches])
+        self.assertIs(assets[self.switches[0].ip_addr], fleet.get_asset(ip_addr=self.switches[0].ip_addr))
+
+    def test_results_yielded_as_they_complete(self):
+        self.switches[0].response_delay = 0.5
+        fleet = AssetFleet(devices=self.devices, max_workers=8, rest_proto='http', api_mode='inprocess')
+
+        self.assertEqual(self.switches[0].ip_addr, list(fleet.connect())[-1][0])
+
+    def test_per_device_timeout(self):
+        self.switches[0].blackhole_protocols.add('http')
+        fleet = AssetFleet(devices=self.devices, max_workers=2, timeout=1, rest_proto='http', api_mode='inprocess')
+        start = time.time()
+        results = dict((ip_addr, (result, error)) for ip_addr, result, error in fleet.run('get_vlan_brief_rpc', vlan_id=10))
+
+        self.assertLess(time.time() - start, 3)
+        self.assertIsInstance(results[self.switches[0].ip_addr][1], AssetTimeoutError)
+        self.assertEqual([None] * 7, [results[switch.ip_addr][1] for switch in self.switches[1:]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import time
+
+import unittest2 as unittest
+
+from pyswitchlib.util.netmikoPool import NetmikoSessionPool
+
+
+class StandInSession(object):
+
+    def __init__(self, opt=None, connect_delay=0):
+        time.sleep(connect_delay)
+        self.opt = opt
+        self.alive = True
+        self.disconnected = False
+
+    def is_alive(self):
+        return self.alive
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def opt(ip='10.0.0.1', password='password'):
+    return {'ip': ip, 'username': 'admin', 'password': password}
+
+
+class TestNetmikoSessionPool(unittest.TestCase):
+
+    def test_sessions_grow_to_max_and_are_reused(self):
+        pool = NetmikoSessionPool(connect=StandInSession, min_sessions=1, max_sessions=2)
+        pool.open(opt=opt(), auth_hash='hash-1')
+
+        first = pool.checkout(host='10.0.0.1')
+        second = pool.checkout(host='10.0.0.1')
+
+        self.assertIsNot(first.session, second.session)
+        self.assertEqual({'10.0.0.1': {'sessions': 2, 'idle': 0}}, pool.stats())
+
+        waited = []
+        waiter = threading.Thread(target=lambda: waited.append(pool.checkout(host='10.0.0.1')))
+        waiter.start()
+        time.sleep(0.05)
+        self.assertEqual([], waited)
+
+        pool.checkin(pooled_session=second)
+        waiter.join()
+
+        self.assertIs(second, waited[0])
+        self.assertIsNone(pool.checkout(host='10.0.0.2'))
+
+    def test_dead_and_replaced_sessions_are_closed(self):
+        pool = NetmikoSessionPool(connect=StandInSession, min_sessions=1, max_sessions=2)
+        pool.open(opt=opt(), auth_hash='hash-1')
+
+        busy = pool.checkout(host='10.0.0.1')
+        idle = pool.checkout(host='10.0.0.1')
+        pool.checkin(pooled_session=idle)
+        idle.session.alive = False
+
+        pool.open(opt=opt(), auth_hash='hash-1')
+        self.assertTrue(idle.session.disconnected)
+        self.assertEqual({'sessions': 2, 'idle': 1}, pool.stats()['10.0.0.1'])
+
+        pool.open(opt=opt(password='new-password'), auth_hash='hash-2')
+        pool.checkin(pooled_session=busy)
+
+        self.assertTrue(busy.session.disconnected)
+        self.assertEqual({'sessions': 1, 'idle': 1}, pool.stats()['10.0.0.1'])
+        self.assertEqual('new-password', pool.checkout(host='10.0.0.1').session.opt['password'])
+
+    def test_unhealthy_and_idle_sessions_are_reaped(self):
+        pool = NetmikoSessionPool(connect=StandInSession, min_sessions=1, max_sessions=3, idle_timeout=0.05)
+        pool.open(opt=opt(), auth_hash='hash-1')
+
+        sessions = [pool.checkout(host='10.0.0.1') for index in range(3)]
+        pool.checkin(pooled_session=sessions[0], healthy=False)
+        pool.checkin(pooled_session=sessions[1])
+        time.sleep(0.1)
+        pool.checkin(pooled_session=sessions[2])
+
+        self.assertTrue(sessions[0].session.disconnected)
+        self.assertTrue(sessions[1].session.disconnected)
+        self.assertEqual({'sessions': 1, 'idle': 1}, pool.stats()['10.0.0.1'])
+
+    def test_switches_are_opened_in_parallel(self):
+        pool = NetmikoSessionPool(connect=lambda opt: StandInSession(opt=opt, connect_delay=0.2))
+        threads = [threading.Thread(target=pool.open, kwargs={'opt': opt(ip='10.0.0.' + str(n)), 'auth_hash': 'hash-1'}) for n in range(10)]
+        start = time.time()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(10, len(pool.stats()))
+
+
+if __name__ == '__main__':
+    unittest.main()
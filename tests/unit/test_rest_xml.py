@@ -0,0 +1,109 @@
+import importlib
+import json
+import pkgutil
+from collections import OrderedDict
+
+import pyangbind.lib.pybindJSON as pybindJSON
+import unittest2 as unittest
+from dicttoxml import dicttoxml
+
+from pyswitchlib.pyswitchlib_api_daemon import (PySwitchLibApiDaemon, register_api_modules)
+from pyswitchlib.util.restXml import pybind_to_rest_xml
+
+MODULE_NAMES = ['pybind.nos.v6_0_2f', 'pybind.nos.v7_2_0', 'pybind.slxos.v17r_1_01a', 'pybind.slxos.v17r_2_00', 'pybind.slxos.v17s_1_02']
+
+# Values tried in order for every leaf and list key.  They cover integers, escaped
+# strings, interface names, booleans, decimals and addresses.
+LEAF_VALUES = [10, u'a&b<c>"\'1', u'1/0/1', True, 1.5, u'10.1.1.1/24', u'aa:bb:cc:dd:ee:ff', u'1', u'enable']
+
+
+def legacy_rest_xml(pybind_object):
+    return dicttoxml(json.loads(pybindJSON.dumps(pybind_object, mode='rest'), object_pairs_hook=OrderedDict), root=False, attr_type=False, item_func=lambda x: x)
+
+
+def populate(pybind_object, depth=0, max_depth=2, max_elements=8):
+    """
+    Set the first leaves and list entries of a pybind object to the first value each accepts.
+    """
+    if hasattr(pybind_object, '_base_type') and hasattr(pybind_object._base_type, '__slots__'):
+        elements = [x.lstrip('_') for x in pybind_object._base_type.__slots__ if '__' in x]
+    else:
+        elements = list(pybind_object._pyangbind_elements)
+
+    for element_name in elements[:max_elements]:
+        element = getattr(pybind_object, element_name, None)
+        generated_by = getattr(element, '_pybind_generated_by', None)
+
+        if generated_by == 'container':
+            if depth < max_depth:
+                populate(element, depth + 1, max_depth, max_elements)
+        elif generated_by == 'YANGListType':
+            key_count = len(element._keyval.split()) if element._keyval else 1
+
+            for value in LEAF_VALUES:
+                try:
+                    member = element.add(' '.join([unicode(value)] * key_count) if key_count > 1 else value)
+                except Exception:
+                    continue
+
+                if depth < max_depth:
+                    populate(member, depth + 1, max_depth, max_elements)
+
+                break
+        elif hasattr(pybind_object, '_set_' + element_name):
+            for value in LEAF_VALUES:
+                try:
+                    getattr(pybind_object, '_set_' + element_name)(value)
+                except Exception:
+                    continue
+
+                break
+
+
+class TestRestXml(unittest.TestCase):
+
+    def setUp(self):
+        register_api_modules(PySwitchLibApiDaemon)
+        self.api = PySwitchLibApiDaemon()
+
+    def test_rpc_body(self):
+        result = self.api.api_dispatch(module_name='pybind.nos.v7_2_0', api_name='get_vlan_brief_rpc', api_kwargs={'vlan_id': 10})
+
+        self.assertEqual('<input><vlan-id>10</vlan-id></input>', result[0][0][2])
+
+    def test_rpc_body_escapes_values(self):
+        result = self.api.api_dispatch(module_name='pybind.nos.v7_2_0', api_name='bna_config_cmd_rpc', api_kwargs={'src': 'a&b<"c">', 'dest': 'flash://x'})
+
+        self.assertEqual('<input><src>a&amp;b&lt;&quot;c&quot;&gt;</src><dest>flash://x</dest></input>', result[0][0][2])
+
+    def test_duplicate_rest_names_match_legacy(self):
+        from pybind.nos.v7_2_0.interface_vlan import interface_vlan
+
+        pybind_object = interface_vlan()
+        populate(pybind_object)
+
+        self.assertEqual(legacy_rest_xml(pybind_object), pybind_to_rest_xml(pybind_object=pybind_object))
+
+    def test_all_modules_match_legacy(self):
+        for module_name in MODULE_NAMES:
+            module = importlib.import_module(module_name)
+
+            for _, name, is_package in pkgutil.iter_modules(module.__path__):
+                pybind_class = getattr(importlib.import_module(module_name + '.' + name), name, None)
+
+                if not is_package or pybind_class is None:
+                    continue
+
+                pybind_object = pybind_class()
+                populate(pybind_object)
+
+                try:
+                    expected = legacy_rest_xml(pybind_object)
+                except AttributeError:
+                    continue
+
+                self.assertEqual(expected, pybind_to_rest_xml(pybind_object=pybind_object), module_name + '.' + name)
+
+
+if __name__ == '__main__':
+    unittest.main()